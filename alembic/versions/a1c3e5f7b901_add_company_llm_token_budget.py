@@ -0,0 +1,29 @@
+"""add company llm_token_budget
+
+Revision ID: a1c3e5f7b901
+Revises: 50e34d381d1a
+Create Date: 2026-10-19 10:12:31.408215
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+from pgvector.sqlalchemy import Vector
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a1c3e5f7b901'
+down_revision: Union[str, None] = '50e34d381d1a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('company', sa.Column('llm_token_budget', sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('company', 'llm_token_budget')
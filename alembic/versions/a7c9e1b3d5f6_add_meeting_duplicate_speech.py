@@ -0,0 +1,41 @@
+"""add meeting_duplicate_speech
+
+Revision ID: a7c9e1b3d5f6
+Revises: f4b6d8a0c2e3
+Create Date: 2026-10-19 21:12:43.507219
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+from pgvector.sqlalchemy import Vector
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c9e1b3d5f6'
+down_revision: Union[str, None] = 'f4b6d8a0c2e3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('meeting_duplicate_speech',
+    sa.Column('meeting_id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('sentence_count', sa.Integer(), nullable=False),
+    sa.Column('duplicate_pairs', sa.Integer(), nullable=False),
+    sa.Column('duplicate_sentences', sa.Integer(), nullable=False),
+    sa.Column('duplicate_groups', sa.Integer(), nullable=False),
+    sa.Column('method', sa.String(length=30), nullable=False),
+    sa.Column('examples', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+    sa.Column('created_at', sa.TIMESTAMP(), nullable=False),
+    sa.ForeignKeyConstraint(['meeting_id'], ['meeting.meeting_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('meeting_id')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('meeting_duplicate_speech')
@@ -0,0 +1,54 @@
+"""add meeting_user, calendar unique constraints for bulk upsert
+
+Revision ID: b4d2f6a8c013
+Revises: a1c3e5f7b901
+Create Date: 2026-10-19 11:03:52.117402
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+from pgvector.sqlalchemy import Vector
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4d2f6a8c013'
+down_revision: Union[str, None] = 'a1c3e5f7b901'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 기존 중복 행 정리 (회의/사용자당 1행만 남김)
+    op.execute("""
+        DELETE FROM meeting_user a
+        USING meeting_user b
+        WHERE a.meeting_id = b.meeting_id
+          AND a.user_id = b.user_id
+          AND a.ctid > b.ctid
+    """)
+    op.execute("""
+        DELETE FROM calendar a
+        USING calendar b
+        WHERE a.calendar_type = 'meeting'
+          AND b.calendar_type = 'meeting'
+          AND a.meeting_id = b.meeting_id
+          AND a.user_id = b.user_id
+          AND a.ctid > b.ctid
+    """)
+    op.create_unique_constraint('uq_meeting_user_meeting_id_user_id', 'meeting_user', ['meeting_id', 'user_id'])
+    op.create_index(
+        'uq_calendar_meeting_id_user_id_meeting',
+        'calendar',
+        ['meeting_id', 'user_id'],
+        unique=True,
+        postgresql_where=sa.text("calendar_type = 'meeting'"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('uq_calendar_meeting_id_user_id_meeting', table_name='calendar')
+    op.drop_constraint('uq_meeting_user_meeting_id_user_id', 'meeting_user', type_='unique')
@@ -0,0 +1,39 @@
+"""add sentence_score_cache
+
+Revision ID: c6e8a0b2d4f5
+Revises: b4d2f6a8c013
+Create Date: 2026-10-19 14:02:47.615903
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+from pgvector.sqlalchemy import Vector
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c6e8a0b2d4f5'
+down_revision: Union[str, None] = 'b4d2f6a8c013'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('sentence_score_cache',
+    sa.Column('cache_key', sa.String(length=64), nullable=False),
+    sa.Column('scorer_version', sa.String(length=50), nullable=False),
+    sa.Column('model', sa.String(length=100), nullable=False),
+    sa.Column('score', sa.Integer(), nullable=False),
+    sa.Column('reason', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.TIMESTAMP(), nullable=False),
+    sa.PrimaryKeyConstraint('cache_key')
+    )
+    op.create_index('ix_sentence_score_cache_scorer_version', 'sentence_score_cache', ['scorer_version'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_sentence_score_cache_scorer_version', table_name='sentence_score_cache')
+    op.drop_table('sentence_score_cache')
@@ -0,0 +1,52 @@
+"""add llm_call_log
+
+Revision ID: e2a4c6e8f0b1
+Revises: d8f0a2c4e6b7
+Create Date: 2026-10-19 18:02:44.517309
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+from pgvector.sqlalchemy import Vector
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2a4c6e8f0b1'
+down_revision: Union[str, None] = 'd8f0a2c4e6b7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('llm_call_log',
+    sa.Column('call_id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('meeting_id', postgresql.UUID(as_uuid=True), nullable=True),
+    sa.Column('company_id', postgresql.UUID(as_uuid=True), nullable=True),
+    sa.Column('stage', sa.String(length=50), nullable=False),
+    sa.Column('provider', sa.String(length=20), nullable=False),
+    sa.Column('model', sa.String(length=100), nullable=False),
+    sa.Column('prompt_tokens', sa.Integer(), nullable=False),
+    sa.Column('completion_tokens', sa.Integer(), nullable=False),
+    sa.Column('audio_seconds', sa.Float(), nullable=True),
+    sa.Column('latency_ms', sa.Float(), nullable=False),
+    sa.Column('retries', sa.Integer(), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('cost_usd', sa.Numeric(precision=12, scale=6), nullable=False),
+    sa.Column('created_at', sa.TIMESTAMP(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('call_id')
+    )
+    op.create_index('ix_llm_call_log_created_at', 'llm_call_log', ['created_at'], unique=False)
+    op.create_index('ix_llm_call_log_meeting_id', 'llm_call_log', ['meeting_id'], unique=False)
+    op.create_index('ix_llm_call_log_company_id_created_at', 'llm_call_log', ['company_id', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_llm_call_log_company_id_created_at', table_name='llm_call_log')
+    op.drop_index('ix_llm_call_log_meeting_id', table_name='llm_call_log')
+    op.drop_index('ix_llm_call_log_created_at', table_name='llm_call_log')
+    op.drop_table('llm_call_log')
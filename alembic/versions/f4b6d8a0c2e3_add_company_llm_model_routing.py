@@ -0,0 +1,30 @@
+"""add company llm_model_routing
+
+Revision ID: f4b6d8a0c2e3
+Revises: e2a4c6e8f0b1
+Create Date: 2026-10-19 19:24:05.880163
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+from pgvector.sqlalchemy import Vector
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f4b6d8a0c2e3'
+down_revision: Union[str, None] = 'e2a4c6e8f0b1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('company', sa.Column('llm_model_routing', postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('company', 'llm_model_routing')
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, status, Depends, HTTPException
+from fastapi import APIRouter, status, Depends, HTTPException, Query
 from typing import List
 from uuid import UUID
 from pydantic import BaseModel, EmailStr
@@ -11,6 +11,13 @@ from app.services.admin_service.company_crud import CompanyCRUD
 from app.services.admin_service.position_crud import PositionCRUD
 from app.services.admin_service.admin_check import require_company_admin, require_super_admin, require_any_admin
 from app.services.notify_email_service import send_user_status_change_email
+from app.services.llm_cache import llm_cache
+from app.services.score_cache import score_cache
+from app.services.llm_telemetry import llm_call_writer
+from app.crud.crud_llm_call_log import aggregate_llm_calls
+from app.crud.crud_company import get_company_model_routing, update_company_model_routing
+from app.services.model_routing import MODEL_TIERS, routing_table, validate_routing
+from app.services.llm_resilience import resilience_stats
 
 
 # 사용자 관련 Pydantic 모델
@@ -311,4 +318,72 @@ async def delete_position(position_id: UUID):
 async def get_company_positions(company_id: UUID):
     """특정 회사의 직급 목록을 조회합니다."""
     crud = PositionCRUD()
-    return await crud.get_by_company_id(company_id) 
\ No newline at end of file
+    return await crud.get_by_company_id(company_id) 
+
+
+@router.get("/llm-cache/stats", dependencies=[Depends(require_super_admin)])
+async def get_llm_cache_stats():
+    """LLM 응답 캐시와 문장 점수 캐시의 적중/미적중 횟수를 조회합니다. (현재 프로세스 기준)"""
+    return {
+        "llm_response_cache": llm_cache.stats(),
+        "sentence_score_cache": {"hits": score_cache.hits, "misses": score_cache.misses},
+    }
+
+
+@router.get("/llm-resilience/stats", dependencies=[Depends(require_super_admin)])
+async def get_llm_resilience_stats():
+    """provider별 서킷 상태, 헤지 요청 횟수/성공 횟수, 단계별 헤지 지연(p95)과 제한 시간을 조회합니다. (현재 프로세스 기준)"""
+    return resilience_stats()
+
+
+@router.get("/llm-calls/stats", dependencies=[Depends(require_super_admin)])
+async def get_llm_call_stats(
+    group_by: str = Query("stage,model", description="집계 기준 (쉼표 구분): stage, model, provider, company, meeting, status, day"),
+    start: datetime | None = None,
+    end: datetime | None = None,
+    company_id: UUID | None = None,
+    meeting_id: UUID | None = None,
+    stage: str | None = None,
+    db: AsyncSession = Depends(get_db_session),
+):
+    """LLM/음성 전사 호출 기록을 기준별로 집계합니다. (호출 수, 토큰, 지연, 재시도, 예상 비용)"""
+    try:
+        rows = await aggregate_llm_calls(
+            db,
+            group_by=[name.strip() for name in group_by.split(",") if name.strip()],
+            start=start,
+            end=end,
+            company_id=company_id,
+            meeting_id=meeting_id,
+            stage=stage,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return {
+        "rows": rows,
+        "writer": {"written": llm_call_writer.written, "dropped": llm_call_writer.dropped},
+    }
+
+
+@router.get("/model-routing", dependencies=[Depends(require_super_admin)])
+async def get_model_routing(company_id: UUID | None = None, db: AsyncSession = Depends(get_db_session)):
+    """단계별 모델 호출 순서를 조회합니다. (company_id 지정 시 회사별 재정의 반영)"""
+    overrides = await get_company_model_routing(db, company_id) if company_id else None
+    return {
+        "tiers": MODEL_TIERS,
+        "company_overrides": overrides,
+        "stages": routing_table(overrides),
+    }
+
+
+@router.put("/companies/{company_id}/model-routing", dependencies=[Depends(require_super_admin)])
+async def put_company_model_routing(company_id: UUID, routing: dict, db: AsyncSession = Depends(get_db_session)):
+    """회사의 단계별 모델 라우팅 재정의를 저장합니다. 예: {"split": "fast", "summary": ["gpt-4o", "gpt-4"]} (빈 객체면 기본값)"""
+    try:
+        validate_routing(routing)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    company = await update_company_model_routing(db, company_id, routing)
+    if company is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="회사를 찾을 수 없습니다.")
+    return {"company_overrides": company.llm_model_routing, "stages": routing_table(company.llm_model_routing)}
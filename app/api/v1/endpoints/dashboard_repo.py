@@ -10,6 +10,8 @@ from app.models.meeting_user import MeetingUser
 from app.models.flowy_user import FlowyUser
 from app.models.feedback import Feedback
 from app.models.feedbacktype import FeedbackType
+from app.models.meeting_duplicate_speech import MeetingDuplicateSpeech
+from app.core.config import settings
 from app.schemas.dashboard import DashboardSummary, ChartData, TableData
 from fastapi import HTTPException
 
@@ -150,38 +152,25 @@ async def count_unassigned_task_meetings(db: AsyncSession, filters: List[Any], s
         return 0
 
 async def count_duplicate_speech_meetings(db: AsyncSession, filters: List[Any], start_date: datetime, end_date: datetime) -> int:
-    """중복 발언 발생: meeting_time_analysis 피드백에 "중복된 발언이 발견됨: "이 있는 회의 수"""
+    """중복 발언 발생: 중복 발언 감지 결과에서 되풀이한 문장이 DUPLICATE_SPEECH_MIN_COUNT개 이상인 회의 수"""
     
-    # FeedbackType에서 meeting_time_analysis에 해당하는 feedbacktype_id 조회
-    feedbacktype_query = (
-        select(FeedbackType.feedbacktype_id)
-        .where(FeedbackType.feedbacktype_name == 'meeting_time_analysis')
-    )
-    feedbacktype_result = await db.execute(feedbacktype_query)
-    feedbacktype_id = feedbacktype_result.scalar()
-    
-    if not feedbacktype_id:
-        return 0
-    
-    # 해당 피드백 유형의 피드백에서 중복 발언 키워드가 있는 회의 수
-    feedback_query = (
+    duplicate_query = (
         select(func.count(func.distinct(Meeting.meeting_id)))
         .select_from(Meeting)
         .join(MeetingUser, Meeting.meeting_id == MeetingUser.meeting_id)
         .join(FlowyUser, MeetingUser.user_id == FlowyUser.user_id)
-        .join(Feedback, Meeting.meeting_id == Feedback.meeting_id)
+        .join(MeetingDuplicateSpeech, Meeting.meeting_id == MeetingDuplicateSpeech.meeting_id)
         .where(
             Meeting.meeting_date.between(start_date, end_date),
-            Feedback.feedbacktype_id == feedbacktype_id,
-            func.cast(Feedback.feedback_detail, String).contains('중복된 발언이 발견됨: ')
+            MeetingDuplicateSpeech.duplicate_sentences >= settings.DUPLICATE_SPEECH_MIN_COUNT
         )
     )
     
     for filter_condition in filters:
-        feedback_query = feedback_query.where(filter_condition)
+        duplicate_query = duplicate_query.where(filter_condition)
     
     try:
-        result = await db.execute(feedback_query)
+        result = await db.execute(duplicate_query)
         count = result.scalar() or 0
         return count
     except Exception as e:
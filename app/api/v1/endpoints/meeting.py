@@ -4,6 +4,7 @@ from sqlalchemy import select, and_, exists, String
 from typing import List, Optional
 from uuid import UUID
 import datetime
+import json
 
 from app.db.db_session import get_db_session
 from app.services.signup_service.auth import check_access_token
@@ -13,7 +14,8 @@ from app.models.calendar import Calendar
 from app.models.flowy_user import FlowyUser
 from app.schemas.meeting import PendingMeetingResponse, AcceptMeetingRequest, RejectMeetingRequest
 from app.schemas.signup_info import TokenPayload
-from app.crud.crud_meeting import get_prompt_logs_by_meeting, get_all_prompt_logs
+from app.crud.crud_meeting import get_prompt_logs_by_meeting, get_all_prompt_logs, get_latest_prompt_log
+from app.services.tagging import generate_score_reasons
 from app.services.calendar_service.calendar_crud import insert_meeting_calendar
 
 router = APIRouter()
@@ -297,6 +299,54 @@ async def get_meeting_prompt_logs(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"프롬프트 로그 조회 중 오류: {str(e)}")
 
+@router.post("/sentence-reason/{meeting_id}")
+async def get_sentence_reason(
+    meeting_id: str,
+    index: int,
+    db: AsyncSession = Depends(get_db_session),
+    current_user: TokenPayload = Depends(check_access_token)
+):
+    """
+    문장 관련도 점수의 이유 조회 (숫자 평가 모드에서는 요청 시점에 LLM으로 생성 후 저장하므로 POST)
+
+    Args:
+        meeting_id: 회의 ID
+        index: 문장 번호 (sentence_scores의 index)
+    """
+    try:
+        log = await get_latest_prompt_log(db, meeting_id, "summary")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"잘못된 UUID 형식: {str(e)}")
+    if log is None:
+        raise HTTPException(status_code=404, detail="회의 분석 결과가 없습니다.")
+    try:
+        output = json.loads(log.prompt_output)
+    except json.JSONDecodeError:
+        raise HTTPException(status_code=500, detail="회의 분석 결과를 읽을 수 없습니다.")
+    sentence_scores = output.get("sentence_scores") or []
+    if index < 0 or index >= len(sentence_scores):
+        raise HTTPException(status_code=404, detail="해당 문장을 찾을 수 없습니다.")
+
+    entry = sentence_scores[index]
+    if not entry.get("reason") and entry.get("score") is not None:
+        subject = (output.get("metadata") or {}).get("subject") or ""
+        reasons = await generate_score_reasons(
+            subject,
+            [s.get("sentence", "") for s in sentence_scores],
+            {index: entry["score"]}
+        )
+        if index in reasons:
+            entry["reason"] = reasons[index]
+            log.prompt_output = json.dumps(output, ensure_ascii=False, default=str)
+            await db.commit()
+    return {
+        "meeting_id": meeting_id,
+        "index": index,
+        "sentence": entry.get("sentence"),
+        "score": entry.get("score"),
+        "reason": entry.get("reason")
+    }
+
 @router.get("/prompt-logs")
 async def get_all_meeting_prompt_logs(
     agent_type: Optional[str] = None,
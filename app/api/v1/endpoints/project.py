@@ -1,21 +1,29 @@
 from fastapi import APIRouter, Depends, Request, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.db.db_session import get_db_session
+from app.db.db_session import get_db_session, AsyncSessionLocal
 from app.crud.crud_user import get_all_users
 from app.schemas.signup_info import TokenPayload
 from app.schemas.project import ProjectCreate, ProjectNameUpdate, TaskAssignLogCreate, SummaryLogCreate, ProjectUpdateRequestBody, SummaryAndTaskRequest, MeetingCreateRequest
 from app.services.signup_service.auth import check_access_token
-from app.crud.crud_project import get_project_users_with_projects_by_user_id, get_meetings_with_users_by_project_id, create_project, get_meeting_detail_with_project_and_users, update_project_name_by_id, insert_task_assign_log, insert_summary_log, update_project_with_users, insert_summary_and_task_logs
+from app.crud.crud_project import get_project_users_with_projects_by_user_id, get_meetings_with_users_by_project_id, create_project, get_meeting_detail_with_project_and_users, update_project_name_by_id, insert_task_assign_log, insert_summary_log, update_project_with_users, insert_summary_and_task_logs, get_meeting_analysis_status
 from uuid import UUID
 import traceback
-from fastapi.responses import JSONResponse
-from app.services.calendar_service.calendar_crud import update_calendar_from_todos, insert_meeting_calendar
-from app.crud.crud_meeting import insert_meeting, insert_meeting_user, get_role_id_by_user_and_project
+from fastapi.responses import JSONResponse, StreamingResponse
+from app.services.calendar_service.calendar_crud import update_calendar_from_todos, upsert_meeting_calendars
+from app.crud.crud_meeting import insert_meeting, upsert_meeting_users, get_role_id_by_user_and_project
 from app.models.flowy_user import FlowyUser
 from datetime import datetime
+from app.services.meeting_events import meeting_event_hub, format_sse
+import asyncio
+import time
 
 router = APIRouter()
 
+# SSE 연결 유지용 keep-alive 주기 (초)
+SSE_KEEPALIVE_SECONDS = 15
+# 완료/실패 이벤트를 기다리는 최대 시간 (이후 현재 상태를 한 번 더 보내고 종료, 클라이언트는 재연결)
+SSE_MAX_WAIT_SECONDS = 60 * 60
+
 
 @router.post("")
 async def create_project_api(
@@ -51,6 +59,54 @@ async def read_meetings_with_users(project_id: UUID, db: AsyncSession = Depends(
     meetings = await get_meetings_with_users_by_project_id(db, project_id)
     return meetings
 
+@router.get("/meeting/events/{meeting_id}")
+async def stream_meeting_analysis_events(meeting_id: UUID, request: Request, db: AsyncSession = Depends(get_db_session)):
+    """
+    회의 분석 단계 완료 이벤트를 SSE로 전달합니다.
+    연결 직후 현재 분석 상태를 한 번 보내고, 이후 파이프라인이 NOTIFY한 단계 이벤트를 그대로 전달합니다.
+    completed/failed 이벤트나 SSE_MAX_WAIT_SECONDS가 지나면 종료하며,
+    저장된 상태가 완료이고 진행 중인 분석이 없을 때만 상태를 보낸 직후 종료합니다.
+    (업로드 직후의 예정(pending) 상태나 재분석 중인 완료 상태에서는 이후 이벤트를 계속 기다림)
+    요약/피드백 생성 중간 결과(status='partial')는 'partial' 이벤트로 보냅니다. (data.changes를 화면 결과에 덮어쓰기)
+    """
+    if await get_meeting_analysis_status(db, meeting_id) is None:
+        raise HTTPException(status_code=404, detail="Meeting not found")
+    # 스트림이 길게 유지되므로 초기 조회 후 DB 커넥션을 바로 반환
+    await db.close()
+
+    async def generate():
+        async with meeting_event_hub.subscribe(meeting_id) as queue:
+            # 구독 이후 상태를 다시 확인해 그 사이 완료된 이벤트를 놓치지 않도록 함
+            async with AsyncSessionLocal() as session:
+                current_status = await get_meeting_analysis_status(session, meeting_id)
+            yield format_sse({"meeting_id": str(meeting_id), "analysis_status": current_status}, event_name="status")
+            if current_status == "completed" and not meeting_event_hub.is_running(meeting_id):
+                return
+            deadline = time.monotonic() + SSE_MAX_WAIT_SECONDS
+            while not await request.is_disconnected():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    async with AsyncSessionLocal() as session:
+                        current_status = await get_meeting_analysis_status(session, meeting_id)
+                    yield format_sse({"meeting_id": str(meeting_id), "analysis_status": current_status, "timeout": True}, event_name="status")
+                    break
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=min(SSE_KEEPALIVE_SECONDS, remaining))
+                except asyncio.TimeoutError:
+                    # LISTEN 커넥션이 끊겼으면 재연결
+                    await meeting_event_hub.ensure_listener()
+                    yield ": keep-alive\n\n"
+                    continue
+                yield format_sse(event, event_name="partial" if event.get("status") == "partial" else "stage")
+                if event.get("stage") == "completed" or event.get("status") == "failed":
+                    break
+
+    return StreamingResponse(generate(), media_type="text/event-stream", headers={
+        "Cache-Control": "no-cache",
+        "Connection": "keep-alive",
+        "X-Accel-Buffering": "no",
+    })
+
 @router.get("/meeting/result/{meeting_id}")
 async def meetings_with_result(meeting_id: UUID ,db: AsyncSession = Depends(get_db_session)):
     meetings = await get_meeting_detail_with_project_and_users(db, meeting_id)
@@ -161,23 +217,26 @@ async def create_meeting_with_users(
             meeting_title=meeting_data.meeting_title,
             meeting_agenda=meeting_data.meeting_agenda,
             meeting_date=meeting_date_obj,
-            meeting_audio_path=meeting_data.meeting_audio_path
+            meeting_audio_path=meeting_data.meeting_audio_path,
+            commit=False
+        )
+        # 참석자/일정은 참석자 수와 무관하게 각각 한 번의 쿼리로 저장하고 한 번에 커밋
+        await upsert_meeting_users(
+            db,
+            meeting_id=meeting.meeting_id,
+            participants=[{"user_id": user.user_id, "role_id": user.role_id} for user in meeting_data.users],
+            commit=False
+        )
+        await upsert_meeting_calendars(
+            db,
+            user_ids=[user.user_id for user in meeting_data.users],
+            project_id=meeting_data.project_id,
+            title=meeting_data.meeting_title,
+            start=meeting_date_obj,
+            meeting_id=meeting.meeting_id,
+            commit=False
         )
-        for user in meeting_data.users:
-            await insert_meeting_user(
-                db=db,
-                meeting_id=meeting.meeting_id,
-                user_id=user.user_id,
-                role_id=user.role_id
-            )
-            await insert_meeting_calendar(
-                db=db,
-                user_id=user.user_id,
-                project_id=meeting_data.project_id,
-                title=meeting_data.meeting_title,
-                start=meeting_date_obj,
-                meeting_id=meeting.meeting_id
-            )
+        await db.commit()
         return {"meeting_id": meeting.meeting_id}
     except Exception as e:
         traceback_str = ''.join(traceback.format_exception(type(e), e, e.__traceback__))
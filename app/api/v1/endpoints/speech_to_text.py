@@ -12,15 +12,15 @@ from pydantic import BaseModel, UUID4
 from datetime import datetime
 from sqlalchemy.orm import Session
 from app.db.db_session import get_db_session
-from app.crud.crud_meeting import insert_meeting, insert_meeting_user, get_project_meetings, insert_prompt_log, update_meeting_user, update_meeting
+from app.crud.crud_meeting import insert_meeting, get_project_meetings, insert_prompt_log, update_meeting
 from app.models.project_user import ProjectUser
 from app.models.flowy_user import FlowyUser
 from app.models.role import Role
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.models.meeting import Meeting
-from app.services.calendar_service.calendar_crud import insert_meeting_calendar, update_calendar_by_meeting_id
 from app.services.notify_email_service import send_meeting_update_email, send_meeting_email_without_update
+from app.services.meeting_events import publish_meeting_event
 from fastapi.responses import JSONResponse
 import mutagen
 from app.models.calendar import Calendar
@@ -70,10 +70,13 @@ async def run_stt_in_background(
     from datetime import datetime
     from app.services.tagging import tag_chunks_async
     from app.services.docs_service.docs_recommend import recommend_documents
-    from app.crud.crud_meeting import insert_meeting, insert_meeting_user
+    from app.crud.crud_meeting import insert_meeting, upsert_meeting_users
     from app.models.flowy_user import FlowyUser
-    from app.services.calendar_service.calendar_crud import insert_meeting_calendar
+    from app.services.calendar_service.calendar_crud import upsert_meeting_calendars
     from app.services.stt import stt_from_file
+    from app.services.llm_budget import start_meeting_budget
+    from app.crud.crud_company import get_company_token_budget, get_company_model_routing
+    from app.services.model_routing import set_company_routing
 
     try:
         def split_items(items):
@@ -117,126 +120,70 @@ async def run_stt_in_background(
         meeting_date_obj = datetime.strptime(meeting_date, "%Y-%m-%d %H:%M:%S")
         HOST_ROLE_ID = "20ea65e2-d3b7-4adb-a8ce-9e67a2f21999"
         ATTENDEE_ROLE_ID = "a55afc22-b4c1-48a4-9513-c66ff6ed3965"
-        # meeting_id를 항상 str로 변환해서 체크
-        if not meeting_id or str(meeting_id).strip() == '':
-            # meeting insert
+        # 회의/참석자/일정 저장은 하나의 트랜잭션으로 처리 (참석자 수와 무관하게 쿼리 수 고정)
+        meeting = None
+        created = False
+        if meeting_id and str(meeting_id).strip() != '':
+            meeting = await update_meeting(
+                db=db,
+                meeting_id=meeting_id,
+                meeting_title=meeting_title,
+                meeting_agenda=meeting_agenda,
+                meeting_date=meeting_date_obj,
+                meeting_audio_path=temp_path,
+                commit=False
+            )
+        if meeting is None:
             meeting = await insert_meeting(
                 db=db,
                 project_id=project_id,
                 meeting_title=meeting_title,
                 meeting_agenda=meeting_agenda,
                 meeting_date=meeting_date_obj,
-                meeting_audio_path=temp_path
-            )
-            meeting_id = meeting.meeting_id
-        else:
-            # meeting update
-            existing_meeting = await db.execute(
-                select(Meeting).where(Meeting.meeting_id == meeting_id)
+                meeting_audio_path=temp_path,
+                commit=False
             )
-            meeting_obj = existing_meeting.scalar_one_or_none()
-            if meeting_obj:
-                await update_meeting(
-                    db=db,
-                    meeting_id=meeting_id,
-                    meeting_title=meeting_title,
-                    meeting_agenda=meeting_agenda,
-                    meeting_date=meeting_date_obj,
-                    meeting_audio_path=temp_path
-                )
-                meeting = meeting_obj
-            else:
-                meeting = await insert_meeting(
-                    db=db,
-                    project_id=project_id,
-                    meeting_title=meeting_title,
-                    meeting_agenda=meeting_agenda,
-                    meeting_date=meeting_date_obj,
-                    meeting_audio_path=temp_path
-                )
-                meeting_id = meeting.meeting_id
+            created = True
+        meeting_id = meeting.meeting_id
         all_ids = [host_id] + list(ids)
-        all_names = [host_name] + list(names)
-        all_emails = [host_email] + list(emails)
-        all_roles = [HOST_ROLE_ID] + [ATTENDEE_ROLE_ID] * len(names)
-        for id, name, email, role_id in zip(all_ids, all_names, all_emails, all_roles):
-            user = await db.execute(
-                select(FlowyUser).where(FlowyUser.user_id == id)
-            )
-            user_obj = user.scalar_one_or_none()
-            if not user_obj:
-                continue
-            # meeting_user도 update/insert 분기
-            if not meeting_id or str(meeting_id).strip() == '':
-                # meeting_id가 빈 값이면 insert만 실행
-                await insert_meeting_user(
-                    db=db,
-                    meeting_id=meeting.meeting_id,
-                    user_id=user_obj.user_id,
-                    role_id=role_id
-                )
-            else:
-                # meeting_id가 있으면 update/insert 분기
-                existing_meeting_user = await db.execute(
-                    select(MeetingUser).where(
-                        MeetingUser.meeting_id == meeting.meeting_id,
-                        MeetingUser.user_id == user_obj.user_id
-                    )
-                )
-                meeting_user_obj = existing_meeting_user.scalar_one_or_none()
-                if meeting_user_obj:
-                    await update_meeting_user(
-                        db=db,
-                        meeting_user_id=meeting_user_obj.meeting_user_id,
-                        role_id=role_id
-                    )
-                else:
-                    await insert_meeting_user(
-                        db=db,
-                        meeting_id=meeting.meeting_id,
-                        user_id=user_obj.user_id,
-                        role_id=role_id
-                    )
-            # calendar도 update/insert 분기
-            if not meeting_id or str(meeting_id).strip() == '':
-                # insert
-                await insert_meeting_calendar(
-                    db=db,
-                    user_id=user_obj.user_id,
-                    project_id=meeting.project_id,
-                    title=meeting_title,
-                    start=meeting_date_obj,
-                    meeting_id=meeting.meeting_id,
-                )
-            else:
-                # update
-                calendar = await db.execute(
-                    select(Calendar).where(Calendar.meeting_id == meeting_id)
-                )
-                calendar_obj = calendar.scalars().all()
-                if calendar_obj:
-                    await update_calendar_by_meeting_id(
-                        meeting_id=meeting_id,
-                        user_id=user_obj.user_id,
-                        title=meeting_title,
-                        start=meeting_date_obj,
-                        updated_at=datetime.now(),
-                        db=db
-                    )
-                else:
-                    await insert_meeting_calendar(
-                        db=db,
-                        user_id=user_obj.user_id,
-                        project_id=meeting.project_id,
-                        title=meeting_title,
-                        start=meeting_date_obj,
-                        meeting_id=meeting_id,
-                    )
+        all_roles = [HOST_ROLE_ID] + [ATTENDEE_ROLE_ID] * len(ids)
+        # 존재하는 사용자만 한 번에 조회
+        user_result = await db.execute(
+            select(FlowyUser.user_id).where(FlowyUser.user_id.in_(all_ids))
+        )
+        valid_user_ids = {str(user_id) for user_id in user_result.scalars().all()}
+        participants = [
+            {"user_id": user_id, "role_id": role_id}
+            for user_id, role_id in zip(all_ids, all_roles)
+            if str(user_id) in valid_user_ids
+        ]
+        await upsert_meeting_users(db, meeting_id=meeting_id, participants=participants, commit=False)
+        await upsert_meeting_calendars(
+            db,
+            user_ids=[p["user_id"] for p in participants],
+            project_id=meeting.project_id,
+            title=meeting_title,
+            start=meeting_date_obj,
+            meeting_id=meeting_id,
+            commit=False
+        )
+        await db.commit()
+        await db.refresh(meeting)
+        if created:
+            # 기존 회의는 업로드 요청에서 이미 시작 이벤트를 발행함
+            await publish_meeting_event(meeting.meeting_id, "stt", status="started")
+        # 회의 단위 토큰 예산 시작 (회사별 예산이 없으면 기본값)
+        company_id, company_budget = await get_company_token_budget(db, meeting.project_id)
+        budget = start_meeting_budget(limit=company_budget, meeting_id=meeting.meeting_id, company_id=company_id)
+        # 회사별 모델 라우팅 재정의 (없으면 기본 라우팅)
+        set_company_routing(await get_company_model_routing(db, company_id))
         stt_result = await stt_from_file(temp_path)
         chunks = stt_result.get("chunks")
         if not chunks:
             print("[BackgroundTask] stt 변환 결과 없음", flush=True)
+            await publish_meeting_event(meeting.meeting_id, "stt", status="failed")
             return
+        await publish_meeting_event(meeting.meeting_id, "stt", data={"chunk_count": len(chunks)})
         tag_result = await tag_chunks_async(
             project_name=project_id,
             subject=subject,
@@ -254,6 +201,22 @@ async def run_stt_in_background(
         docs_search_start_time = datetime.now()
         print(f"[BackgroundTask] Docs/Search Agent 시작: {docs_search_start_time}", flush=True)
         
+        # 토큰 예산이 거의 소진되었으면 문서 검색 단계를 생략하고 기록만 남김
+        if budget.should_degrade("skip_docs_search"):
+            print(f"[BackgroundTask] 토큰 예산 부족으로 Docs/Search Agent 생략: {budget.to_dict()}", flush=True)
+            await save_prompt_log(
+                db,
+                str(meeting.meeting_id),
+                "docs",
+                {"skipped": True, "reason": "token_budget", "token_budget": budget.to_dict()},
+                input_date=docs_search_start_time,
+                output_date=datetime.now()
+            )
+            await publish_meeting_event(meeting.meeting_id, "docs", status="skipped")
+            await publish_meeting_event(meeting.meeting_id, "completed")
+            print(f"[BackgroundTask] 분석 완료: meeting_id={meeting.meeting_id}", flush=True)
+            return
+        
         # 내부문서/외부문서 프롬프트 로그 (orchestration.py에서 내부적으로 docs와 search 분리 저장)
         search_result = await super_agent_for_meeting(all_txt_result, db=db, meeting_id=meeting.meeting_id)
         
@@ -264,9 +227,13 @@ async def run_stt_in_background(
         print(f"\n\n[BackgroundTask] 찾은 문서 링크 :\n {search_result}\n\n", flush=True)
         
         doc_recommend_result = await recommend_documents(subject)
+        await publish_meeting_event(meeting.meeting_id, "docs")
+        await publish_meeting_event(meeting.meeting_id, "completed")
         print(f"[BackgroundTask] 분석 완료: meeting_id={meeting.meeting_id}", flush=True)
     except Exception as e:
         print(f"[BackgroundTask] 전체 분석 작업 중 오류: {e}", flush=True)
+        if meeting_id:
+            await publish_meeting_event(meeting_id, "completed", status="failed", data={"error": str(e)})
     finally:
         try:
             os.remove(temp_path)
@@ -330,6 +297,9 @@ async def stt_api(
     async with aiofiles.open(temp_path, "wb") as f:
         content = await file.read()
         await f.write(content)
+    if meeting_id and str(meeting_id).strip() != '':
+        # 응답 직후 구독한 클라이언트가 기존 상태(예정/완료)만 보고 스트림을 닫지 않도록 분석 시작을 먼저 알림
+        await publish_meeting_event(meeting_id, "stt", status="started")
     background_tasks.add_task(
         run_stt_in_background,
         temp_path,
@@ -35,6 +35,110 @@ class Settings:
     COOKIE_SECURE: bool = os.getenv("COOKIE_SECURE", "false").lower() == "true"
     COOKIE_SAMESITE: str = os.getenv("COOKIE_SAMESITE")
 
+    # 회의당 LLM 토큰 예산 (회사별 설정이 없을 때 사용, 0이면 무제한)
+    MEETING_TOKEN_BUDGET: int = int(os.getenv("MEETING_TOKEN_BUDGET", "1500000"))
+    # 예산 부족 시 문장 평가에 사용할 저렴한 모델
+    SCORING_FALLBACK_MODEL: str = os.getenv("SCORING_FALLBACK_MODEL", "gpt-4o-mini")
+    # 문장 평가 1회 호출에 묶어 보내는 문장 수 / 누락 문장 재시도 횟수
+    SCORING_BATCH_SIZE: int = int(os.getenv("SCORING_BATCH_SIZE", "40"))
+    SCORING_BATCH_MAX_RETRIES: int = int(os.getenv("SCORING_BATCH_MAX_RETRIES", "2"))
+    # 문장 평가 동시 요청 수 (AIMD로 MIN~MAX 사이에서 자동 조절) 및 목표 응답 지연(초)
+    SCORING_CONCURRENCY_INITIAL: int = int(os.getenv("SCORING_CONCURRENCY_INITIAL", "4"))
+    SCORING_CONCURRENCY_MIN: int = int(os.getenv("SCORING_CONCURRENCY_MIN", "1"))
+    SCORING_CONCURRENCY_MAX: int = int(os.getenv("SCORING_CONCURRENCY_MAX", "16"))
+    SCORING_TARGET_LATENCY_SECONDS: float = float(os.getenv("SCORING_TARGET_LATENCY_SECONDS", "20"))
+    # 임베딩 1차 분류: 유사도 LOW 이하는 0점, HIGH 이상은 3점으로 확정하고 사이 구간만 LLM 평가
+    RELEVANCE_TRIAGE_ENABLED: bool = os.getenv("RELEVANCE_TRIAGE_ENABLED", "true").lower() == "true"
+    RELEVANCE_TRIAGE_LOW: float = float(os.getenv("RELEVANCE_TRIAGE_LOW", "0.12"))
+    RELEVANCE_TRIAGE_HIGH: float = float(os.getenv("RELEVANCE_TRIAGE_HIGH", "0.55"))
+    # 확정 문장 중 일치율 측정을 위해 LLM으로도 평가하는 비율
+    RELEVANCE_TRIAGE_AUDIT_RATE: float = float(os.getenv("RELEVANCE_TRIAGE_AUDIT_RATE", "0.05"))
+    # 문장 평가 방식 ('llm': 임베딩 1차 분류 + LLM, 'local': 학습된 로컬 분류기 + LLM 표본 검증)
+    RELEVANCE_SCORER: str = os.getenv("RELEVANCE_SCORER", "llm").lower()
+    RELEVANCE_CLASSIFIER_DIR: str = os.getenv("RELEVANCE_CLASSIFIER_DIR", "models/relevance")
+    # 로컬 분류기 확신도가 이 값 미만이면 LLM으로 평가 / 확정 문장 중 LLM 표본 검증 비율
+    RELEVANCE_CLASSIFIER_MIN_CONFIDENCE: float = float(os.getenv("RELEVANCE_CLASSIFIER_MIN_CONFIDENCE", "0.6"))
+    RELEVANCE_CLASSIFIER_SPOT_CHECK_RATE: float = float(os.getenv("RELEVANCE_CLASSIFIER_SPOT_CHECK_RATE", "0.03"))
+    # 문장 평가 응답 형식 ('digits': 점수 숫자만 + logprob 확신도, 'json': 점수와 이유를 함께 생성)
+    SCORING_MODE: str = os.getenv("SCORING_MODE", "digits").lower()
+    # 숫자 평가 확신도가 이 값 미만인 문장은 분석 중 이유를 바로 생성
+    SCORING_REASON_CONFIDENCE: float = float(os.getenv("SCORING_REASON_CONFIDENCE", "0.6"))
+    # 문장 점수 캐시 버전 (평가 프롬프트/방식 변경 시 올리면 기존 캐시 무효화) / 프로세스 내 LRU 크기
+    SCORING_CACHE_VERSION: str = os.getenv("SCORING_CACHE_VERSION", "batch-v1")
+    SCORE_CACHE_LRU_SIZE: int = int(os.getenv("SCORE_CACHE_LRU_SIZE", "50000"))
+    # 문장 분리 방식 ('local': 규칙 기반 한국어 분리기, 'llm': GPT 분리 호출)
+    SENTENCE_SPLITTER: str = os.getenv("SENTENCE_SPLITTER", "local").lower()
+    # 구조화 출력 검증 실패 시 1회 복구 요청에 사용할 저렴한 모델 (JSON schema 지원 모델)
+    STRUCTURED_REPAIR_MODEL: str = os.getenv("STRUCTURED_REPAIR_MODEL", "gpt-4o-mini")
+    # LLM 게이트웨이 공용 HTTP 연결 풀 (전체 동시 연결 수 / keep-alive 유지 연결 수 / 유휴 연결 유지 시간(초))
+    LLM_MAX_CONNECTIONS: int = int(os.getenv("LLM_MAX_CONNECTIONS", "64"))
+    LLM_MAX_KEEPALIVE_CONNECTIONS: int = int(os.getenv("LLM_MAX_KEEPALIVE_CONNECTIONS", "32"))
+    LLM_KEEPALIVE_EXPIRY_SECONDS: float = float(os.getenv("LLM_KEEPALIVE_EXPIRY_SECONDS", "60"))
+    # LLM 요청 타임아웃(초) / SDK 자동 재시도 횟수
+    LLM_REQUEST_TIMEOUT_SECONDS: float = float(os.getenv("LLM_REQUEST_TIMEOUT_SECONDS", "120"))
+    LLM_MAX_RETRIES: int = int(os.getenv("LLM_MAX_RETRIES", "2"))
+    # LLM 응답 캐시 (temperature 0 호출 중 호출부에서 허용한 경우만) / 보관 기간(초) / 프로세스 내 LRU 크기
+    LLM_CACHE_ENABLED: bool = os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+    LLM_CACHE_TTL_SECONDS: int = int(os.getenv("LLM_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+    LLM_CACHE_LRU_SIZE: int = int(os.getenv("LLM_CACHE_LRU_SIZE", "2000"))
+    # LLM 호출 단위 기록 (llm_call_log) / 한 번에 저장할 건수 / 최대 대기 시간(초) / 대기열 크기 (넘치면 버림)
+    LLM_CALL_LOG_ENABLED: bool = os.getenv("LLM_CALL_LOG_ENABLED", "true").lower() == "true"
+    LLM_CALL_LOG_BATCH_SIZE: int = int(os.getenv("LLM_CALL_LOG_BATCH_SIZE", "200"))
+    LLM_CALL_LOG_FLUSH_SECONDS: float = float(os.getenv("LLM_CALL_LOG_FLUSH_SECONDS", "2"))
+    LLM_CALL_LOG_QUEUE_SIZE: int = int(os.getenv("LLM_CALL_LOG_QUEUE_SIZE", "10000"))
+    # 모델 라우팅 재정의 (JSON) - 등급별 모델 순서 {"fast": ["gpt-4o-mini", ...]} / 단계별 등급 {"split": "fast", ...}
+    LLM_MODEL_TIERS: str = os.getenv("LLM_MODEL_TIERS")
+    LLM_STAGE_TIERS: str = os.getenv("LLM_STAGE_TIERS")
+    # 등급 목록 외에 라우팅에 지정할 수 있는 모델 이름 (쉼표 구분, 모르는 모델 이름은 라우팅 검증에서 거부)
+    LLM_EXTRA_MODELS: str = os.getenv("LLM_EXTRA_MODELS", "")
+    # LLM 호출 제한 시간(초, 단계별 재정의는 JSON {"scoring": 30}) - SDK 재시도를 포함한 호출 전체 기준
+    LLM_CALL_DEADLINE_SECONDS: float = float(os.getenv("LLM_CALL_DEADLINE_SECONDS", "90"))
+    LLM_STAGE_DEADLINES: str = os.getenv("LLM_STAGE_DEADLINES")
+    # 헤지 요청: 응답이 최근 지연 분위수(p95)를 넘으면 같은 요청을 한 번 더 보냄 (짧고 반복 가능한 단계만)
+    LLM_HEDGE_ENABLED: bool = os.getenv("LLM_HEDGE_ENABLED", "true").lower() == "true"
+    LLM_HEDGE_STAGES: str = os.getenv("LLM_HEDGE_STAGES", "scoring,scoring_reason,split")
+    LLM_HEDGE_QUANTILE: float = float(os.getenv("LLM_HEDGE_QUANTILE", "0.95"))
+    LLM_HEDGE_MIN_SAMPLES: int = int(os.getenv("LLM_HEDGE_MIN_SAMPLES", "20"))
+    # provider별 서킷 브레이커 (연속 장애 횟수 / 차단 시간(초))
+    LLM_CIRCUIT_FAILURE_THRESHOLD: int = int(os.getenv("LLM_CIRCUIT_FAILURE_THRESHOLD", "5"))
+    LLM_CIRCUIT_COOLDOWN_SECONDS: float = float(os.getenv("LLM_CIRCUIT_COOLDOWN_SECONDS", "30"))
+    # provider 장애 시 다른 provider 모델로 넘어가도 되는 단계 / provider별 대체 모델 (JSON)
+    LLM_FAILOVER_STAGES: str = os.getenv("LLM_FAILOVER_STAGES", "summary,summary_map,role,preview,refine,todo,feedback,docs,docs_agent,docs_describe,split,scoring_reason")
+    LLM_FAILOVER_MODELS: str = os.getenv("LLM_FAILOVER_MODELS", '{"openai": "gemini-2.5-flash", "google": "gpt-4o"}')
+    # 외부 API 주소 재지정 (로컬 대역 서버 scripts/llm_standin_server.py 사용 시, 비우면 실제 서비스)
+    OPENAI_BASE_URL: str = os.getenv("OPENAI_BASE_URL") or None
+    GEMINI_API_ENDPOINT: str = os.getenv("GEMINI_API_ENDPOINT") or None
+    SERPAPI_BASE_URL: str = os.getenv("SERPAPI_BASE_URL") or None
+    # 요약/피드백 생성 중간 결과를 회의 이벤트(status='partial')로 발행 / 최소 발행 간격(초)
+    STREAM_PARTIAL_RESULTS: bool = os.getenv("STREAM_PARTIAL_RESULTS", "true").lower() == "true"
+    STREAM_PUBLISH_INTERVAL_SECONDS: float = float(os.getenv("STREAM_PUBLISH_INTERVAL_SECONDS", "0.5"))
+    # 회의 요약 map-reduce ('auto': 중요 문장이 한 번의 요약 예산을 넘을 때만, 'always', 'off') / 구간 요약 동시 호출 수 / 최대 구간 수
+    SUMMARY_MAP_REDUCE: str = os.getenv("SUMMARY_MAP_REDUCE", "auto").lower()
+    SUMMARY_MAP_CONCURRENCY: int = int(os.getenv("SUMMARY_MAP_CONCURRENCY", "8"))
+    SUMMARY_MAP_MAX_SEGMENTS: int = int(os.getenv("SUMMARY_MAP_MAX_SEGMENTS", "16"))
+    # 안건 논의 여부 판단 전 임베딩 사전 필터 / 이 유사도 미만 안건은 LLM 없이 미논의 / 안건별 근거 문장 수
+    AGENDA_EMBEDDING_PREFILTER: bool = os.getenv("AGENDA_EMBEDDING_PREFILTER", "true").lower() == "true"
+    AGENDA_PREFILTER_MIN_SIMILARITY: float = float(os.getenv("AGENDA_PREFILTER_MIN_SIMILARITY", "0.15"))
+    AGENDA_EVIDENCE_SENTENCES: int = int(os.getenv("AGENDA_EVIDENCE_SENTENCES", "20"))
+    # 회의 효율성 분석 방식 ('topics': 로컬 주제 구간 분할로 수치 계산 후 LLM은 평가 문장만, 'llm': LLM이 전체 분석)
+    EFFICIENCY_ANALYSIS: str = os.getenv("EFFICIENCY_ANALYSIS", "topics").lower()
+    # 주제 구간 분할 (TextTiling 비교 창 문장 수 / 최소 구간 문장 수 / 같은 주제로 묶을 구간 평균 유사도)
+    TOPIC_TILING_WINDOW: int = int(os.getenv("TOPIC_TILING_WINDOW", "6"))
+    TOPIC_MIN_SEGMENT_SENTENCES: int = int(os.getenv("TOPIC_MIN_SEGMENT_SENTENCES", "4"))
+    TOPIC_CLUSTER_SIMILARITY: float = float(os.getenv("TOPIC_CLUSTER_SIMILARITY", "0.65"))
+    # 중복 발언 감지 (사용 여부 / 검사할 최소 글자 수 / 문자 shingle 길이 / MinHash 순열 수 / LSH 띠 수)
+    DUPLICATE_SPEECH_DETECTION: bool = os.getenv("DUPLICATE_SPEECH_DETECTION", "true").lower() == "true"
+    DUPLICATE_SPEECH_MIN_CHARS: int = int(os.getenv("DUPLICATE_SPEECH_MIN_CHARS", "10"))
+    DUPLICATE_SPEECH_SHINGLE_SIZE: int = int(os.getenv("DUPLICATE_SPEECH_SHINGLE_SIZE", "3"))
+    DUPLICATE_SPEECH_NUM_PERM: int = int(os.getenv("DUPLICATE_SPEECH_NUM_PERM", "64"))
+    DUPLICATE_SPEECH_LSH_BANDS: int = int(os.getenv("DUPLICATE_SPEECH_LSH_BANDS", "16"))
+    # 중복으로 확정할 MinHash 자카드 유사도 / 임베딩 코사인 유사도 / 대시보드 '중복 발언 발생'으로 셀 최소 중복 문장 수
+    DUPLICATE_SPEECH_JACCARD: float = float(os.getenv("DUPLICATE_SPEECH_JACCARD", "0.5"))
+    DUPLICATE_SPEECH_EMBEDDING_SIMILARITY: float = float(os.getenv("DUPLICATE_SPEECH_EMBEDDING_SIMILARITY", "0.85"))
+    DUPLICATE_SPEECH_MIN_COUNT: int = int(os.getenv("DUPLICATE_SPEECH_MIN_COUNT", "1"))
+    # 코루틴 Agent 도구 안의 동기 네트워크 호출 처리 ('raise': 도구 실패 처리, 'warn': 로그만, 'off': 감지 안 함)
+    BLOCKING_IO_GUARD: str = os.getenv("BLOCKING_IO_GUARD", "raise").lower()
+
     # 여기에 추가 환경변수 및 공통 설정 작성 가능
 
 settings = Settings() 
\ No newline at end of file
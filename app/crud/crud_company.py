@@ -23,3 +23,39 @@ async def get_signup_meta(db: AsyncSession):
         "companies": companies,
         "sysroles": sysroles
     }
+
+
+# 프로젝트가 속한 회사의 회의당 LLM 토큰 예산 조회
+async def get_company_token_budget(db: AsyncSession, project_id: str):
+    from app.models import Project
+    stmt = (
+        select(Company.company_id, Company.llm_token_budget)
+        .join(Project, Project.company_id == Company.company_id)
+        .where(Project.project_id == project_id)
+    )
+    result = await db.execute(stmt)
+    row = result.first()
+    if not row:
+        return None, None
+    return row.company_id, row.llm_token_budget
+
+
+# 회사의 단계별 모델 라우팅 재정의 조회
+async def get_company_model_routing(db: AsyncSession, company_id: str):
+    if not company_id:
+        return None
+    result = await db.execute(
+        select(Company.llm_model_routing).where(Company.company_id == company_id)
+    )
+    return result.scalar_one_or_none()
+
+
+# 회사의 단계별 모델 라우팅 재정의 저장 (None이면 기본 라우팅으로 되돌림)
+async def update_company_model_routing(db: AsyncSession, company_id: str, routing):
+    company = await db.get(Company, company_id)
+    if company is None:
+        return None
+    company.llm_model_routing = routing or None
+    await db.commit()
+    await db.refresh(company)
+    return company
@@ -0,0 +1,71 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func, literal_column
+from datetime import datetime
+from typing import List, Dict, Optional
+from app.models.llm_call_log import LlmCallLog
+
+# 집계 기준 이름 → 컬럼
+LLM_CALL_GROUP_COLUMNS = {
+    "stage": LlmCallLog.stage,
+    "model": LlmCallLog.model,
+    "provider": LlmCallLog.provider,
+    "company": LlmCallLog.company_id,
+    "meeting": LlmCallLog.meeting_id,
+    "status": LlmCallLog.status,
+    # GROUP BY에서 같은 식으로 인식되도록 단위는 바인딩 파라미터가 아닌 리터럴로
+    "day": func.date_trunc(literal_column("'day'"), LlmCallLog.created_at),
+}
+
+
+# LLM 호출 기록 집계 함수 (호출 수, 토큰, 지연 평균/p95, 재시도, 예상 비용)
+async def aggregate_llm_calls(
+    db: AsyncSession,
+    group_by: List[str],
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    company_id: Optional[str] = None,
+    meeting_id: Optional[str] = None,
+    stage: Optional[str] = None,
+) -> List[Dict]:
+    unknown = [name for name in group_by if name not in LLM_CALL_GROUP_COLUMNS]
+    if unknown:
+        raise ValueError(f"지원하지 않는 집계 기준: {unknown}")
+    keys = [LLM_CALL_GROUP_COLUMNS[name].label(name) for name in group_by]
+    cost = func.sum(LlmCallLog.cost_usd)
+    stmt = select(
+        *keys,
+        func.count().label("calls"),
+        func.sum(LlmCallLog.prompt_tokens).label("prompt_tokens"),
+        func.sum(LlmCallLog.completion_tokens).label("completion_tokens"),
+        func.avg(LlmCallLog.latency_ms).label("avg_latency_ms"),
+        func.percentile_cont(0.95).within_group(LlmCallLog.latency_ms).label("p95_latency_ms"),
+        func.sum(LlmCallLog.latency_ms).label("total_latency_ms"),
+        func.sum(LlmCallLog.retries).label("retries"),
+        func.count().filter(LlmCallLog.status != "ok").label("failed_calls"),
+        cost.label("cost_usd"),
+    )
+    if start is not None:
+        stmt = stmt.where(LlmCallLog.created_at >= start)
+    if end is not None:
+        stmt = stmt.where(LlmCallLog.created_at < end)
+    if company_id is not None:
+        stmt = stmt.where(LlmCallLog.company_id == company_id)
+    if meeting_id is not None:
+        stmt = stmt.where(LlmCallLog.meeting_id == meeting_id)
+    if stage is not None:
+        stmt = stmt.where(LlmCallLog.stage == stage)
+    if keys:
+        stmt = stmt.group_by(*keys).order_by(cost.desc())
+
+    result = await db.execute(stmt)
+    rows = []
+    for row in result.mappings():
+        item = dict(row)
+        for name in ("company", "meeting"):
+            if item.get(name) is not None:
+                item[name] = str(item[name])
+        for name in ("avg_latency_ms", "p95_latency_ms", "total_latency_ms"):
+            item[name] = round(float(item[name] or 0), 1)
+        item["cost_usd"] = float(item["cost_usd"] or 0)
+        rows.append(item)
+    return rows
@@ -1,5 +1,6 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from uuid import uuid4, UUID
 from datetime import datetime
 from app.models.meeting import Meeting  # 실제 모델 경로에 맞게 수정
@@ -22,6 +23,38 @@ async def insert_meeting_user(db: AsyncSession, meeting_id: str, user_id: str, r
     return meeting_participant
 
 
+# 회의 참석자 일괄 저장 함수 (INSERT ... ON CONFLICT, 참석자 수와 무관하게 1회 실행)
+async def upsert_meeting_users(db: AsyncSession, meeting_id: str, participants: List[Dict], commit: bool = True):
+    """
+    participants: [{"user_id": ..., "role_id": ...}, ...]
+    이미 등록된 참석자는 role_id만 갱신, 같은 user_id가 여러 번 오면 첫 항목(호스트 우선)만 사용
+    """
+    rows = []
+    seen_user_ids = set()
+    for participant in participants:
+        user_id = str(participant["user_id"])
+        if user_id in seen_user_ids:
+            continue
+        seen_user_ids.add(user_id)
+        rows.append({
+            "meeting_user_id": uuid4(),
+            "meeting_id": meeting_id,
+            "user_id": participant["user_id"],
+            "role_id": participant["role_id"]
+        })
+    if not rows:
+        return 0
+    stmt = pg_insert(MeetingUser).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        constraint="uq_meeting_user_meeting_id_user_id",
+        set_={"role_id": stmt.excluded.role_id}
+    )
+    await db.execute(stmt)
+    if commit:
+        await db.commit()
+    return len(rows)
+
+
 # meeting 저장 함수
 async def insert_meeting(
     db: AsyncSession,
@@ -29,7 +62,8 @@ async def insert_meeting(
     meeting_title: str,
     meeting_agenda: str,
     meeting_date: datetime,
-    meeting_audio_path: str = None
+    meeting_audio_path: str = None,
+    commit: bool = True
 ):
     meeting = Meeting(
         meeting_id=str(uuid4()),
@@ -40,8 +74,11 @@ async def insert_meeting(
         meeting_audio_path=meeting_audio_path
     )
     db.add(meeting)
-    await db.commit()
-    await db.refresh(meeting)
+    if commit:
+        await db.commit()
+        await db.refresh(meeting)
+    else:
+        await db.flush()
     return meeting 
 
 
@@ -116,6 +153,18 @@ async def insert_feedback_log(db: AsyncSession, feedback_detail: dict, feedbackt
     await db.refresh(feedback)
     return feedback 
 
+# 회의 중복 발언 감지 결과 저장 (회의당 한 행, 재분석 시 덮어씀)
+async def upsert_meeting_duplicate_speech(db: AsyncSession, meeting_id: str, record: Dict):
+    from app.models import MeetingDuplicateSpeech
+    values = {**record, "meeting_id": meeting_id, "created_at": datetime.now()}
+    stmt = pg_insert(MeetingDuplicateSpeech).values(values)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["meeting_id"],
+        set_={key: stmt.excluded[key] for key in values if key != "meeting_id"}
+    )
+    await db.execute(stmt)
+    await db.commit()
+
 # 프로젝트 사용자 목록 불러오기
 async def get_conference_list(db: AsyncSession, project_id: str) -> List[Dict]:
     stmt = select(
@@ -214,6 +263,20 @@ async def get_prompt_logs_by_meeting(db: AsyncSession, meeting_id: str, agent_ty
         for log in logs
     ]
 
+# 회의의 가장 최근 프롬프트 로그 조회 함수 (ORM 객체 반환, 수정용)
+async def get_latest_prompt_log(db: AsyncSession, meeting_id: str, agent_type: str):
+    from app.models import PromptLog
+
+    meeting_uuid = UUID(meeting_id) if isinstance(meeting_id, str) else meeting_id
+    stmt = (
+        select(PromptLog)
+        .where(PromptLog.prompt_meeting_id == meeting_uuid, PromptLog.agent_type == agent_type)
+        .order_by(PromptLog.prompt_output_date.desc())
+        .limit(1)
+    )
+    result = await db.execute(stmt)
+    return result.scalar_one_or_none()
+
 # 모든 프롬프트 로그 조회 함수
 async def get_all_prompt_logs(db: AsyncSession, agent_type: Optional[str] = None):
     """
@@ -280,7 +343,8 @@ async def update_meeting(
     meeting_title: str,
     meeting_agenda: str,
     meeting_date: datetime,
-    meeting_audio_path: str = None
+    meeting_audio_path: str = None,
+    commit: bool = True
 ):
     result = await db.execute(
         select(Meeting).where(Meeting.meeting_id == meeting_id)
@@ -292,8 +356,11 @@ async def update_meeting(
     meeting.meeting_agenda = meeting_agenda
     meeting.meeting_date = meeting_date
     meeting.meeting_audio_path = meeting_audio_path
-    await db.commit()
-    await db.refresh(meeting)
+    if commit:
+        await db.commit()
+        await db.refresh(meeting)
+    else:
+        await db.flush()
     return meeting
 
 async def update_meeting_user(
@@ -119,6 +119,37 @@ async def get_meetings_with_users_by_project_id(
     
     return meeting_data
 
+async def get_meeting_analysis_status(db: AsyncSession, meeting_id: UUID) -> str | None:
+    """
+    회의 한 건의 분석 상태만 가볍게 조회합니다. (SSE 초기 상태 전송용)
+    get_meetings_with_users_by_project_id와 같은 기준을 EXISTS 서브쿼리로 판단합니다.
+    """
+    has_summary = (
+        select(SummaryLog.summary_log_id)
+        .where(SummaryLog.meeting_id == meeting_id)
+        .exists()
+    )
+    has_feedback = (
+        select(Feedback.feedback_id)
+        .where(
+            Feedback.meeting_id == meeting_id,
+            Feedback.feedbacktype_id.in_(feedbacktype_ids)
+        )
+        .exists()
+    )
+    stmt = select(Meeting.meeting_audio_path, has_summary, has_feedback).where(
+        Meeting.meeting_id == meeting_id
+    )
+    row = (await db.execute(stmt)).first()
+    if row is None:
+        return None
+    audio_path, summary_exists, feedback_exists = row
+    if audio_path == "app/none":
+        return "pending"
+    if summary_exists and feedback_exists:
+        return "completed"
+    return "analyzing"
+
 async def create_project(
     project_data: ProjectCreate,
     db: AsyncSession
@@ -1,3 +1,4 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 # , UploadFile, File, Form, HTTPException, Request, Depends
 import os
@@ -13,6 +14,8 @@ from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.sessions import SessionMiddleware
 from app.api.v1.api import api_router
 from app.core.config import settings
+from app.services.llm_gateway import aclose_llm_clients
+from app.services.meeting_events import meeting_event_hub
 # # 로깅 설정
 # logging.basicConfig(
 #     level=logging.INFO,
@@ -24,7 +27,19 @@ from app.core.config import settings
 # logging.getLogger('sqlalchemy.pool').setLevel(logging.INFO)
 # logging.getLogger('sqlalchemy.dialects').setLevel(logging.INFO)
 
-app = FastAPI(debug=True)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 회의 분석 이벤트 LISTEN을 미리 시작해 다른 레플리카에서 진행 중인 분석도 추적 (실패해도 첫 구독 시 재시도)
+    try:
+        await meeting_event_hub.ensure_listener()
+    except Exception as e:
+        print(f"[main] 회의 이벤트 LISTEN 시작 실패: {e}", flush=True)
+    yield
+    # LLM 게이트웨이 공용 연결 풀 정리
+    await aclose_llm_clients()
+
+
+app = FastAPI(debug=True, lifespan=lifespan)
 
 # 허용할 프론트엔드 주소 (Vite는 보통 5173 포트)
 origins = [
@@ -62,8 +77,6 @@ app.add_middleware(
 app.include_router(api_router, prefix="/api/v1")
 
 
-
-
 @app.get("/")
 def read_root():
     return {"Hello": "World"}
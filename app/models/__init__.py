@@ -19,6 +19,10 @@ from app.models.task_assign_log import TaskAssignLog
 from app.models.prompt_log import PromptLog
 from app.models.calendar import Calendar
 from app.models.scenario import Scenario
+from app.models.sentence_score_cache import SentenceScoreCache
+from app.models.llm_response_cache import LlmResponseCache
+from app.models.llm_call_log import LlmCallLog
+from app.models.meeting_duplicate_speech import MeetingDuplicateSpeech
 # 다른 모델들...
 
-__all__ = ["CompanyPosition", "FlowyUser", "Interdoc", "Company", "Company", "DraftLog", "Feedback", "FeedbackType", "MeetingUser", "Meeting", "ProfileImg", "ProjectUser", "Project", "Role", "SignupLog", "SummaryLog", "Sysrole", "TaskAssignLog", "PromptLog", "Calendar", "Scenario"]
\ No newline at end of file
+__all__ = ["CompanyPosition", "FlowyUser", "Interdoc", "Company", "Company", "DraftLog", "Feedback", "FeedbackType", "MeetingUser", "Meeting", "ProfileImg", "ProjectUser", "Project", "Role", "SignupLog", "SummaryLog", "Sysrole", "TaskAssignLog", "PromptLog", "Calendar", "Scenario", "SentenceScoreCache", "LlmResponseCache", "LlmCallLog", "MeetingDuplicateSpeech"]
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Text, ForeignKey, Boolean, TIMESTAMP, Date
+from sqlalchemy import Column, String, Text, ForeignKey, Boolean, TIMESTAMP, Date, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import uuid
@@ -6,6 +6,15 @@ from app.models.base import Base
 
 class Calendar(Base):
     __tablename__ = "calendar"
+    __table_args__ = (
+        # 회의 일정은 회의/사용자당 1행 (todo 일정은 제외, bulk upsert의 ON CONFLICT 대상)
+        Index(
+            'uq_calendar_meeting_id_user_id_meeting',
+            'meeting_id', 'user_id',
+            unique=True,
+            postgresql_where=text("calendar_type = 'meeting'"),
+        ),
+    )
 
     calendar_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey('flowy_user.user_id'), nullable=False)
@@ -1,5 +1,5 @@
-from sqlalchemy import Column, String, TIMESTAMP, BOOLEAN
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, TIMESTAMP, BOOLEAN, Integer
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 import uuid
 from sqlalchemy.orm import relationship
 from .base import Base
@@ -13,6 +13,8 @@ class Company(Base):
     service_startdate = Column(TIMESTAMP, nullable=True)
     service_enddate = Column(TIMESTAMP, nullable=True)
     service_status = Column(BOOLEAN, nullable=False)
+    llm_token_budget = Column(Integer, nullable=True)  # 회의당 LLM 토큰 예산 (NULL이면 기본값 사용)
+    llm_model_routing = Column(JSONB, nullable=True)  # 단계별 모델 라우팅 재정의 {stage: 등급 | 모델 | [모델, ...]} (NULL이면 기본 라우팅)
 
     users = relationship("FlowyUser", back_populates="company")
     projects = relationship("Project", back_populates="company")
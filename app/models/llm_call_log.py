@@ -0,0 +1,31 @@
+from sqlalchemy import Column, String, Integer, Float, Numeric, TIMESTAMP, Index
+from sqlalchemy.dialects.postgresql import UUID
+import uuid
+from .base import Base
+
+class LlmCallLog(Base):
+    __tablename__ = 'llm_call_log'
+    __table_args__ = (
+        Index('ix_llm_call_log_created_at', 'created_at'),
+        Index('ix_llm_call_log_meeting_id', 'meeting_id'),
+        Index('ix_llm_call_log_company_id_created_at', 'company_id', 'created_at'),
+    )
+
+    call_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    # 회의 분석 밖의 호출(문서 업로드, 검색 등)은 비어 있음, 회의 삭제와 무관하게 남기려고 FK는 두지 않음
+    meeting_id = Column(UUID(as_uuid=True))
+    company_id = Column(UUID(as_uuid=True))
+    stage = Column(String(50), nullable=False)
+    provider = Column(String(20), nullable=False)
+    model = Column(String(100), nullable=False)
+    prompt_tokens = Column(Integer, nullable=False, default=0)
+    completion_tokens = Column(Integer, nullable=False, default=0)
+    # 음성 전사 호출의 오디오 길이(초)
+    audio_seconds = Column(Float)
+    latency_ms = Column(Float, nullable=False)
+    # HTTP 재시도 횟수 (SDK 자동 재시도 포함)
+    retries = Column(Integer, nullable=False, default=0)
+    # 'ok' | 'error' | 'rate_limited'
+    status = Column(String(20), nullable=False)
+    cost_usd = Column(Numeric(12, 6), nullable=False, default=0)
+    created_at = Column(TIMESTAMP(timezone=True), nullable=False)
@@ -0,0 +1,19 @@
+from sqlalchemy import Column, String, Text, Float, TIMESTAMP, Index
+from .base import Base
+
+class LlmResponseCache(Base):
+    __tablename__ = 'llm_response_cache'
+    __table_args__ = (
+        Index('ix_llm_response_cache_expires_at', 'expires_at'),
+    )
+
+    # sha256(provider + 모델 + temperature + 요청 형식 + 프롬프트)
+    cache_key = Column(String(64), primary_key=True)
+    provider = Column(String(20), nullable=False)
+    model = Column(String(100), nullable=False)
+    temperature = Column(Float, nullable=False)
+    stage = Column(String(50))
+    # 텍스트 응답 또는 구조화 출력 JSON
+    response = Column(Text, nullable=False)
+    created_at = Column(TIMESTAMP, nullable=False)
+    expires_at = Column(TIMESTAMP, nullable=False)
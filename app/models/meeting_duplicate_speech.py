@@ -0,0 +1,19 @@
+from sqlalchemy import Column, String, Integer, TIMESTAMP, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+from .base import Base
+
+class MeetingDuplicateSpeech(Base):
+    __tablename__ = 'meeting_duplicate_speech'
+
+    # 회의당 한 행 (재분석 시 덮어씀)
+    meeting_id = Column(UUID(as_uuid=True), ForeignKey('meeting.meeting_id', ondelete="CASCADE"), primary_key=True)
+    sentence_count = Column(Integer, nullable=False)
+    duplicate_pairs = Column(Integer, nullable=False)
+    # 앞선 발언을 되풀이한 문장 수 (대시보드 '중복 발언 발생' 기준)
+    duplicate_sentences = Column(Integer, nullable=False)
+    duplicate_groups = Column(Integer, nullable=False)
+    # 'minhash+embedding' | 'minhash' (임베딩 확인 실패)
+    method = Column(String(30), nullable=False)
+    # 대표 중복 예시 [{first, second, jaccard, similarity}]
+    examples = Column(JSONB, nullable=False)
+    created_at = Column(TIMESTAMP, nullable=False)
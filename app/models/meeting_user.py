@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Text, DateTime, TIMESTAMP, ForeignKey, BOOLEAN
+from sqlalchemy import Column, String, Text, DateTime, TIMESTAMP, ForeignKey, BOOLEAN, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import uuid
@@ -6,6 +6,10 @@ from .base import Base
 
 class MeetingUser(Base):
     __tablename__ = 'meeting_user'
+    __table_args__ = (
+        # 회의당 참석자 1행 (bulk upsert의 ON CONFLICT 대상)
+        UniqueConstraint('meeting_id', 'user_id', name='uq_meeting_user_meeting_id_user_id'),
+    )
 
     meeting_user_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey('flowy_user.user_id'), nullable=False)
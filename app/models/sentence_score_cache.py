@@ -0,0 +1,18 @@
+from sqlalchemy import Column, String, Text, Integer, Float, TIMESTAMP, Index
+from .base import Base
+
+class SentenceScoreCache(Base):
+    __tablename__ = 'sentence_score_cache'
+    __table_args__ = (
+        Index('ix_sentence_score_cache_scorer_version', 'scorer_version'),
+    )
+
+    # sha256(평가기 버전 + 모델 + 회의 주제 + 문맥 문장 + 대상 문장)
+    cache_key = Column(String(64), primary_key=True)
+    scorer_version = Column(String(50), nullable=False)
+    model = Column(String(100), nullable=False)
+    score = Column(Integer, nullable=False)
+    reason = Column(Text)
+    # 숫자 평가 확신도 (캐시 적중 문장도 확신도가 낮으면 이유 생성 대상, 이 컬럼 추가 전 항목은 NULL)
+    confidence = Column(Float)
+    created_at = Column(TIMESTAMP, nullable=False)
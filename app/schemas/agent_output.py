@@ -0,0 +1,101 @@
+# LLM agent 구조화 출력 스키마 (JSON schema / function calling 응답 검증용)
+from typing import List, Literal
+
+from pydantic import BaseModel, Field
+
+
+# 문장 관련도 평가 (tagging.py)
+class SentenceScoreOutput(BaseModel):
+    score: Literal[0, 1, 2, 3] = Field(description="회의 주제와의 관련도 (0~3)")
+    reason: str = Field(description="간단한 이유")
+
+
+class IndexedSentenceScore(BaseModel):
+    index: int = Field(description="문장 번호")
+    score: Literal[0, 1, 2, 3] = Field(description="회의 주제와의 관련도 (0~3)")
+    reason: str = Field(description="간단한 이유")
+
+
+class BatchSentenceScoreOutput(BaseModel):
+    scores: List[IndexedSentenceScore]
+
+
+class IndexedReason(BaseModel):
+    index: int = Field(description="문장 번호")
+    reason: str = Field(description="점수를 받은 이유 (한 문장)")
+
+
+class ScoreReasonOutput(BaseModel):
+    reasons: List[IndexedReason]
+
+
+# 회의 요약 (lang_summary.py)
+class SummarySection(BaseModel):
+    title: str = Field(description="항목 제목")
+    items: List[str] = Field(description="항목별 핵심 정보 (명사형 중심)")
+
+
+class SummaryOutput(BaseModel):
+    sections: List[SummarySection]
+
+    def to_dict(self) -> dict:
+        # 기존 저장 형식 {"항목 제목": ["내용", ...]} 으로 변환
+        return {section.title: section.items for section in self.sections}
+
+
+# 안건별 논의 여부 (lang_feedback.py)
+class AgendaCoverageItem(BaseModel):
+    index: int = Field(description="안건 번호")
+    discussed: bool = Field(description="구체적인 논의, 의견 교환, 결정사항이 있었으면 true (키워드 언급만 있으면 false)")
+    reason: str = Field(description="판단 근거 (한 문장)")
+
+
+class AgendaCoverageOutput(BaseModel):
+    items: List[AgendaCoverageItem]
+
+
+# 회의 효율성 평가 문장 (lang_feedback.py, 수치는 topic_segmentation이 계산)
+class TopicName(BaseModel):
+    index: int = Field(description="주제 번호")
+    name: str = Field(description="주제 이름 (명사형, 15자 이내)")
+
+
+class EfficiencyEvaluationOutput(BaseModel):
+    topic_names: List[TopicName]
+    imbalance: str = Field(description="주제별 편중 정도 설명 ('-습니다' 체 한 문장)")
+    evaluation: str = Field(description="종합 효율 평가 ('-습니다' 체 1~2문장)")
+
+
+# 할 일 추출 (lang_todo.py)
+class TodoItem(BaseModel):
+    action: str = Field(description="명확한 업무 단위")
+    context: str = Field(description="해당 Action이 나온 회의 원문 문장")
+    schedule: str = Field(description="예상 일정, 언급 없으면 '미정'")
+
+
+class TodoOutput(BaseModel):
+    todos: List[TodoItem]
+    summary: str = Field(description="이번 회의에서 발생한 할일 요약")
+    total_count: int
+
+
+# 역할 분배 (lang_role.py)
+class AssignedTodo(BaseModel):
+    action: str
+    assignee: str = Field(description="참석자 이름, 없으면 '미지정'")
+    schedule: str
+    context: str
+
+
+class RoleAssignmentOutput(BaseModel):
+    assigned_todos: List[AssignedTodo]
+
+
+# 문서 추천 (docs_recommend.py)
+class RecommendedDocument(BaseModel):
+    title: str = Field(description="문서 제목")
+    relevance_reason: str = Field(description="추천 이유 (한 문장), 관련성이 낮으면 '관련성 낮음'")
+
+
+class DocumentRecommendationOutput(BaseModel):
+    documents: List[RecommendedDocument]
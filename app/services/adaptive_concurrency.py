@@ -0,0 +1,117 @@
+# 응답 지연/429 기반 AIMD 동시성 제어 + 슬라이딩 윈도우 실행기
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, List, Optional, Sequence
+
+from openai import RateLimitError
+
+from app.core.config import settings
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """
+    공급자 속도 제한(429) 오류 여부 (서킷 차단처럼 잠시 후 재시도해야 하는 오류 포함)
+    """
+    if isinstance(error, RateLimitError) or getattr(error, "throttled", False):
+        return True
+    return getattr(error, "status_code", None) == 429
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD(가산 증가 / 승산 감소) 방식으로 동시 요청 수를 조절
+    - 지연이 목표 이하로 limit번 연속 완료되면 limit += 1
+    - 429 응답 시 limit *= backoff_factor, 목표 지연 초과 시 limit *= latency_factor
+    """
+
+    def __init__(
+        self,
+        initial_limit: int,
+        min_limit: int = 1,
+        max_limit: int = 16,
+        target_latency: float = 20.0,
+        backoff_factor: float = 0.5,
+        latency_factor: float = 0.8,
+        name: str = "llm",
+    ):
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.limit = min(self.max_limit, max(self.min_limit, initial_limit))
+        self.target_latency = target_latency
+        self.backoff_factor = backoff_factor
+        self.latency_factor = latency_factor
+        self.name = name
+        self.in_flight = 0
+        self._successes = 0
+        self._condition = asyncio.Condition()
+
+    async def acquire(self) -> None:
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < self.limit)
+            self.in_flight += 1
+
+    async def release(self, latency: float, throttled: bool = False) -> None:
+        async with self._condition:
+            self.in_flight -= 1
+            previous = self.limit
+            if throttled:
+                self.limit = max(self.min_limit, int(self.limit * self.backoff_factor))
+                self._successes = 0
+            elif latency > self.target_latency:
+                self.limit = max(self.min_limit, int(self.limit * self.latency_factor))
+                self._successes = 0
+            else:
+                self._successes += 1
+                if self._successes >= self.limit:
+                    self.limit = min(self.max_limit, self.limit + 1)
+                    self._successes = 0
+            if self.limit != previous:
+                print(f"[adaptive_concurrency] {self.name} 동시성 {previous} -> {self.limit} (지연 {latency:.1f}s, 429={throttled})", flush=True)
+            self._condition.notify_all()
+
+
+async def run_sliding_window(
+    items: Sequence[Any],
+    worker: Callable[[Any], Awaitable[Any]],
+    limiter: AdaptiveConcurrencyLimiter,
+    max_retries: int = 3,
+    retry_delay: float = 2.0,
+) -> List[Optional[Any]]:
+    """
+    limiter가 허용하는 만큼 항상 요청을 채워 두고, 하나가 끝나면 바로 다음 항목을 시작
+    429는 limiter에 반영한 뒤 지수 백오프로 재시도하며, 결과는 입력 순서대로 반환
+    재시도 후에도 실패한 항목은 None
+    """
+    results: List[Optional[Any]] = [None] * len(items)
+
+    async def run_one(index: int, item: Any) -> None:
+        for attempt in range(max_retries + 1):
+            await limiter.acquire()
+            started = time.monotonic()
+            throttled = False
+            try:
+                results[index] = await worker(item)
+                return
+            except Exception as e:
+                throttled = is_rate_limit_error(e)
+                error = e
+            finally:
+                # 취소(CancelledError)로 빠져나가도 슬롯은 반드시 반납 (공용 limiter라 누수 시 이후 회의 동시성이 줄어듦)
+                await limiter.release(time.monotonic() - started, throttled=throttled)
+            if not throttled or attempt == max_retries:
+                print(f"[adaptive_concurrency] 항목 {index} 실패: {error}", flush=True)
+                return
+            await asyncio.sleep(retry_delay * (2 ** attempt))
+
+    await asyncio.gather(*[run_one(index, item) for index, item in enumerate(items)])
+    return results
+
+
+# 문장 평가용 프로세스 공용 limiter (공급자 속도 제한은 API 키 단위라 회의 간 공유)
+scoring_limiter = AdaptiveConcurrencyLimiter(
+    initial_limit=settings.SCORING_CONCURRENCY_INITIAL,
+    min_limit=settings.SCORING_CONCURRENCY_MIN,
+    max_limit=settings.SCORING_CONCURRENCY_MAX,
+    target_latency=settings.SCORING_TARGET_LATENCY_SECONDS,
+    name="scoring",
+)
@@ -0,0 +1,81 @@
+# 이벤트 루프 차단 감지 (코루틴 Agent 도구 안의 동기 네트워크 호출을 audit hook으로 잡아냄)
+import asyncio
+import functools
+import sys
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Optional, Tuple, TypeVar
+
+from app.core.config import settings
+
+F = TypeVar("F", bound=Callable[..., Awaitable[Any]])
+
+# 블로킹 소켓 연결 / 이벤트 루프 스레드에서의 DNS 조회
+_WATCHED_EVENTS = {"socket.connect", "socket.getaddrinfo", "socket.gethostbyname"}
+
+# 현재 실행 중인 보호 대상 도구 이름 (그 안에서 만든 Task에도 이어짐)
+_guarded_tool: ContextVar[Optional[str]] = ContextVar("guarded_tool", default=None)
+_installed = False
+blocking_guard_stats = {"blocked": 0, "warned": 0}
+
+
+class BlockingCallError(RuntimeError):
+    """코루틴 도구 안에서 이벤트 루프를 막는 동기 네트워크 호출이 감지됨"""
+
+
+def _is_blocking(event: str, args: Tuple[Any, ...]) -> bool:
+    if event == "socket.connect":
+        # asyncio가 쓰는 논블로킹 소켓(timeout 0)은 허용
+        return args[0].gettimeout() != 0.0
+    return True
+
+
+def _audit_hook(event: str, args: Tuple[Any, ...]) -> None:
+    if event not in _WATCHED_EVENTS:
+        return
+    tool = _guarded_tool.get()
+    if tool is None:
+        return
+    try:
+        # to_thread/executor 스레드의 호출은 루프를 막지 않음
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    if not _is_blocking(event, args):
+        return
+    target = args[1] if event == "socket.connect" else args[0]
+    message = f"{tool}: 코루틴 안에서 동기 네트워크 호출 감지 ({event} {target}), ainvoke/비동기 클라이언트 또는 asyncio.to_thread를 사용하세요."
+    if settings.BLOCKING_IO_GUARD == "warn":
+        blocking_guard_stats["warned"] += 1
+        print(f"[blocking_guard] {message}", flush=True)
+        return
+    blocking_guard_stats["blocked"] += 1
+    raise BlockingCallError(message)
+
+
+def install_blocking_guard() -> None:
+    """프로세스당 한 번 audit hook 등록 (등록 후에는 해제할 수 없음)"""
+    global _installed
+    if not _installed:
+        sys.addaudithook(_audit_hook)
+        _installed = True
+
+
+def loop_safe(name: str) -> Callable[[F], F]:
+    """
+    코루틴 도구 데코레이터: 실행 중 이벤트 루프 스레드에서 블로킹 소켓 연결/DNS 조회가 일어나면
+    BLOCKING_IO_GUARD에 따라 BlockingCallError로 거부('raise')하거나 로그만 남긴다('warn').
+    """
+    def decorator(func: F) -> F:
+        if settings.BLOCKING_IO_GUARD == "off":
+            return func
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            install_blocking_guard()
+            token = _guarded_tool.set(name)
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                _guarded_tool.reset(token)
+        return wrapper
+    return decorator
@@ -2,9 +2,10 @@ import json
 import re
 from datetime import datetime
 from typing import List, Optional
-from uuid import UUID
+from uuid import UUID, uuid4
 
-from sqlalchemy import select
+from sqlalchemy import select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.calendar import Calendar
@@ -88,6 +89,57 @@ async def insert_meeting_calendar(
     return calendar
 
 
+async def upsert_meeting_calendars(
+    db: AsyncSession,
+    user_ids: List[UUID],
+    project_id: UUID,
+    title: str,
+    start: datetime,
+    meeting_id: UUID,
+    commit: bool = True
+) -> int:
+    """
+    회의 참석자 전원의 회의 일정을 한 번의 INSERT ... ON CONFLICT로 저장합니다.
+    이미 있는 회의 일정은 제목/시작 시간만 갱신하며, todo 일정은 건드리지 않습니다.
+    """
+    now = datetime.utcnow()
+    rows = [
+        {
+            "calendar_id": uuid4(),
+            "user_id": user_id,
+            "project_id": project_id,
+            "title": title,
+            "start": start,
+            "end": None,
+            "calendar_type": "meeting",
+            "completed": False,
+            "created_at": now,
+            "updated_at": now,
+            "status": "active",
+            "meeting_id": meeting_id,
+        }
+        for user_id in dict.fromkeys(user_ids)
+    ]
+    if not rows:
+        return 0
+    stmt = pg_insert(Calendar).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[Calendar.meeting_id, Calendar.user_id],
+        # 부분 유니크 인덱스와 매칭되도록 바인드 파라미터가 아닌 리터럴 조건 사용
+        index_where=text("calendar_type = 'meeting'"),
+        set_={
+            "project_id": stmt.excluded.project_id,
+            "title": stmt.excluded.title,
+            "start": stmt.excluded.start,
+            "updated_at": stmt.excluded.updated_at,
+        }
+    )
+    await db.execute(stmt)
+    if commit:
+        await db.commit()
+    return len(rows)
+
+
 async def insert_calendar_from_task(db: AsyncSession, task_assign_log: TaskAssignLog) -> List[Calendar]:
     """
     task_assign_log에 기록된 할 일 목록을 기반으로 캘린더에 새 일정을 추가합니다.
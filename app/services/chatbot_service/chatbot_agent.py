@@ -2,7 +2,7 @@ from langchain_huggingface import HuggingFaceEmbeddings
 from langchain_postgres import PGVector
 from app.core.config import settings
 # from langchain_community.utilities import SQLDatabase
-from langchain_google_genai import ChatGoogleGenerativeAI
+from app.services.llm_gateway import get_chat_model, DEFAULT_GEMINI_MODEL
 from langchain.agents.agent_toolkits import create_retriever_tool
 # from langchain_community.agent_toolkits import SQLDatabaseToolkit
 from langgraph.prebuilt import create_react_agent
@@ -28,14 +28,7 @@ vector_store = PGVector(
 if not google_api_key:
     print("Warning: API keys not properly loaded.")
 
-llm = ChatGoogleGenerativeAI(
-    model="gemini-2.5-flash",
-    temperature=0,
-    max_tokens=None,
-    timeout=None,
-    max_retries=5,
-    google_api_key=google_api_key,
-)
+llm = get_chat_model(DEFAULT_GEMINI_MODEL, max_retries=5)
 
 # toolkit = SQLDatabaseToolkit(db=db, llm=llm)
 
@@ -2,8 +2,7 @@
 
 from langchain.agents import initialize_agent, AgentType
 from langchain.tools import tool
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_community.utilities import SerpAPIWrapper
+from app.services.llm_gateway import get_chat_model, get_search_client, DEFAULT_GEMINI_MODEL
 from app.core.config import settings
 import asyncio
 
@@ -13,16 +12,9 @@ serperapi_api_key = settings.SERPAPI_API_KEY
 if not google_api_key or not serperapi_api_key:
     print("Warning: API keys not properly loaded.")
 
-search = SerpAPIWrapper()
+search = get_search_client()
 
-chat_model = ChatGoogleGenerativeAI(
-    model="gemini-2.5-flash",
-    temperature=0,
-    max_tokens=None,
-    timeout=None,
-    max_retries=2,
-    google_api_key=google_api_key,
-)
+chat_model = get_chat_model(DEFAULT_GEMINI_MODEL, max_retries=2)
 
 # @tool(description="Handles common scenario-based queries. Examples: business hours, shipping status, refund process.")
 # async def scenario_tool_func(scenario: str) -> str:
@@ -11,7 +11,7 @@ from botocore.exceptions import ClientError
 from dotenv import load_dotenv
 from fastapi import UploadFile, HTTPException
 from sentence_transformers import SentenceTransformer
-from openai import AsyncOpenAI
+from app.services.llm_gateway import complete
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.future import select
@@ -41,9 +41,6 @@ session = aioboto3.Session(
     region_name=os.getenv('AWS_REGION')
 )
 
-# OpenAI 클라이언트
-openai_client = AsyncOpenAI(api_key=os.getenv('OPENAI_API_KEY'))
-
 # 문서 임베딩 모델 초기화
 model = SentenceTransformer('sentence-transformers/distiluse-base-multilingual-cased-v2')
 
@@ -230,14 +227,8 @@ async def extract_text_from_file(file: UploadFile) -> str:
                         {"type": "image_url", "image_url": {"url": f"data:image/png;base64,{img_b64}"}}
                     ]
                 })
-            response = await openai_client.chat.completions.create(
-                model="gpt-4o",
-                messages=messages,
-                max_tokens=300,
-                temperature=0.3
-            )
-            summary = response.choices[0].message.content.strip()
-            return summary
+            response = await complete(messages, stage="docs_describe", max_tokens=300, temperature=0.3)
+            return response.text
         # 텍스트라면 기존 프롬프트로 처리
         prompt = f"""
 파일명: {filename}
@@ -254,17 +245,16 @@ async def extract_text_from_file(file: UploadFile) -> str:
 - 구체적인 내용이 아니라, '무슨 목적으로 어떤 형식으로 작성된 문서'인지 설명할 것
 - 반드시 단문형 서술체로 요약할 것 (예: "프로젝트 기획안 작성을 위한 문서")
 """
-        response = await openai_client.chat.completions.create(
-            model="gpt-4o",
-            messages=[
+        response = await complete(
+            [
                 {"role": "system", "content": "당신은 문서 분석 전문가입니다. 문서의 제목과 내용을 바탕으로 문서의 용도와 종류를 한 문장으로 요약하세요."},
                 {"role": "user", "content": prompt.strip()}
             ],
+            stage="docs_describe",
             max_tokens=300,
             temperature=0.3
         )
-        summary = response.choices[0].message.content.strip()
-        return summary
+        return response.text
     except Exception as e:
         raise HTTPException(
             status_code=500,
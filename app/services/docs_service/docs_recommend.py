@@ -1,26 +1,18 @@
+import asyncio
 import os
 from dotenv import load_dotenv
 from langchain_community.embeddings import HuggingFaceEmbeddings
-from langchain_openai import ChatOpenAI
-from langchain_google_genai import ChatGoogleGenerativeAI
 from app.core.config import settings
 import aiopg
 import json
 from contextlib import asynccontextmanager
 import aioboto3
 from botocore.exceptions import ClientError
-import re
+from app.schemas.agent_output import DocumentRecommendationOutput
+from app.services.llm_gateway import complete
 
 load_dotenv()
 
-# Gemini Pro 모델 초기화
-google_api_key = os.getenv("GOOGLE_API_KEY", settings.GOOGLE_API_KEY)
-llm = ChatGoogleGenerativeAI(model="gemini-2.5-flash", temperature=0, google_api_key=google_api_key)
-
-# OpenAI 모델 초기화
-# openai_api_key = settings.OPENAI_API_KEY
-# llm = ChatOpenAI(temperature=0)
-
 # AWS 설정
 AWS_ACCESS_KEY = os.getenv("AWS_ACCESS_KEY")
 AWS_SECRET_KEY = os.getenv("AWS_SECRET_KEY")
@@ -57,7 +49,8 @@ async def direct_vector_search(query_text: str, k: int = 3):
     """직접 SQL로 벡터 유사도 검색"""
     try:
         # 쿼리 벡터화
-        query_embedding = embedding_model.embed_query(query_text)
+        # 임베딩 모델 추론은 CPU 작업이라 스레드에서 실행 (이벤트 루프 차단 방지)
+        query_embedding = await asyncio.to_thread(embedding_model.embed_query, query_text)
         
         # DB 연결 및 검색
         async with get_db_connection() as conn:
@@ -174,36 +167,16 @@ async def recommend_documents(role_text: str, k: int = 1) -> dict:
   "documents": [
     {{
       "title": "문서 제목",
-      "download_url": "다운로드 URL",
-      "similarity_score": "유사도 점수",
       "relevance_reason": "이 문서가 추천되는 이유 (한 문장으로 간단히)"
     }}
   ]
 }}
 '''
 
-        response = await llm.ainvoke(prompt)
-        agent_output = response.content
-        print(f"[recommend_documents] LLM 응답: {agent_output}")
+        recommendation = await complete(prompt, stage="docs", schema=DocumentRecommendationOutput, cache=True)
+        result_json = recommendation.model_dump() if recommendation else {"documents": []}
+        print(f"[recommend_documents] LLM 응답: {result_json}")
 
-        # JSON 파싱
-        try:
-            agent_output = agent_output.strip()
-            if agent_output.startswith("```json"):
-                agent_output = agent_output.removeprefix("```json").removesuffix("```").strip()
-            
-            match = re.search(r'\{.*\}', agent_output, re.DOTALL)
-            if match:
-                agent_output = match.group()
-                result_json = json.loads(agent_output)
-            else:
-                # 파싱 실패 시 기본 구조 생성
-                result_json = {"documents": []}
-                
-        except Exception as e:
-            print(f"[recommend_documents] JSON 파싱 오류: {e}")
-            result_json = {"documents": []}
-        
         # 다운로드 링크 생성 및 최종 결과 구성
         final_documents = []
         for i, doc in enumerate(docs):
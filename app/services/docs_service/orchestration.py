@@ -1,8 +1,6 @@
 from langchain.agents import Tool, initialize_agent
 from langchain.agents.agent_types import AgentType
-from langchain_community.chat_models import ChatOpenAI
 from app.services.search_service.lang_search import run_single_keyword_search
-from langchain_google_genai import ChatGoogleGenerativeAI
 from app.services.docs_service.docs_recommend import run_doc_recommendation
 from app.core.config import settings
 import re
@@ -11,30 +9,36 @@ import asyncio
 import json
 import os
 from urllib.parse import urlparse
+from app.services.blocking_guard import loop_safe
+from app.services.llm_budget import TokenBudgetCallback
+from app.services.llm_gateway import complete, get_chat_model
+from app.services.model_routing import route_model
+from app.services.llm_resilience import stage_deadline
+from app.services.prompt_budget import SECTION_PLACEHOLDER, fill_section, truncate_to_tokens
 
 
-# Gemini Pro 모델 초기화
-google_api_key = os.getenv("GOOGLE_API_KEY", settings.GOOGLE_API_KEY)
-llm = ChatGoogleGenerativeAI(model="gemini-2.5-flash", temperature=0, google_api_key=google_api_key)
-
-# OpenAI 모델 초기화
-# openai_api_key = settings.OPENAI_API_KEY
-# llm = ChatOpenAI(temperature=0)
+# Gemini 모델 (게이트웨이 공용 인스턴스)
+llm = get_chat_model(route_model("docs_agent"))
 
+# Agent 도구는 모두 코루틴으로만 실행 (ainvoke 경로), 동기 네트워크 호출은 loop_safe가 거부
 # 문서 필요성 판단 Tool
+@loop_safe("Meeting Analysis")
 async def analyze_meeting_for_documents(meeting_text: str) -> str:
     result = await should_use_internal_doc_tool(meeting_text)
     return "Yes" if result else "No"
 
 # 회의 내용에서 키워드 추출 Tool
+@loop_safe("Keyword Extraction")
 async def extract_keywords_from_meeting(meeting_text: str) -> str:
     keywords = await extract_internal_doc_keywords(meeting_text)
     return "\n".join(keywords)
 
 # 내부 문서 추천 Tool
+@loop_safe("Document Recommendation")
 async def doc_recommendation(query: str) -> dict:
     return await run_doc_recommendation(query)
 
+@loop_safe("External Document Search")
 async def single_keyword_search(query: str) -> str:
     return await run_single_keyword_search(query)
 
@@ -42,14 +46,14 @@ async def single_keyword_search(query: str) -> str:
 # Tool 인스턴스 생성
 meeting_analysis_tool = Tool(
     name="Meeting Analysis",
-    func=analyze_meeting_for_documents,
+    func=None,
     description="Analyze meeting content to determine if internal documents are needed. Returns 'Yes' or 'No'.",
     coroutine=analyze_meeting_for_documents
 )
 
 keyword_extraction_tool = Tool(
     name="Keyword Extraction",
-    func=extract_keywords_from_meeting,
+    func=None,
     description="Extract internal document keywords from meeting content. Returns keywords separated by newlines.",
     coroutine=extract_keywords_from_meeting
 )
@@ -57,7 +61,7 @@ keyword_extraction_tool = Tool(
 # 내부문서
 doc_recommendation_tool = Tool(
     name="Document Recommendation",
-    func=doc_recommendation,
+    func=None,
     description="Use this tool to recommend documents for the meeting based on keywords extracted from meeting content.",
     coroutine=doc_recommendation
 )
@@ -65,7 +69,7 @@ doc_recommendation_tool = Tool(
 # 외부문서
 doc_external_recommendation_tool = Tool(
     name="External Document Search",
-    func=single_keyword_search,
+    func=None,
     description="Tool to search and extract link.",
     coroutine=single_keyword_search
 )
@@ -87,8 +91,8 @@ async def should_use_internal_doc_tool(meeting_text: str) -> bool:
 'Yes' 또는 'No'만 출력하세요.
 """
     prompt = system_prompt + f"\n\n회의 내용:\n{meeting_text}"
-    response = llm.invoke(prompt).content # <-- .predict() 대신 .invoke().content 사용
-    return "yes" in response.lower()
+    response = await complete(prompt, stage="docs", cache=True)
+    return "yes" in response.text.lower()
 
 async def extract_internal_doc_keywords(meeting_text: str) -> list[str]:
     extract_prompt = f"""
@@ -118,7 +122,8 @@ async def extract_internal_doc_keywords(meeting_text: str) -> list[str]:
 
 키워드만 한 줄에 하나씩 출력하세요:
 """
-    keywords_text = llm.invoke(extract_prompt).content # <-- .predict() 대신 .invoke().content 사용
+    keywords_response = await complete(extract_prompt, stage="docs", cache=True)
+    keywords_text = keywords_response.text
     keywords = [kw.strip() for kw in keywords_text.splitlines() if kw.strip()]
     print("추출된 키워드 : ", keywords)
     return keywords
@@ -141,8 +146,9 @@ def create_agent_prompt(meeting_text: str) -> str:
     """
     Agent가 전체 프로세스를 수행하도록 하는 통합 프롬프트 생성
     - 문서 추천 결과가 부적절할 경우 외부 검색을 수행하는 로직 추가
+    - 회의 내용은 docs_agent 토큰 예산에 맞춰 자름 (Agent가 도구 입력으로 반복 전달하므로)
     """
-    return f"""
+    prompt = f"""
 반드시 아래 형식으로 답변하세요:
 Thought: (에이전트의 생각)
 Action: (사용할 도구 이름)
@@ -214,8 +220,15 @@ Action Input: (도구에 넘길 입력값)
 
 
 **분석할 회의 내용:**
-{meeting_text}
+{SECTION_PLACEHOLDER}
 """
+    model = route_model("docs_agent")
+    return fill_section(
+        prompt,
+        lambda max_tokens: truncate_to_tokens(meeting_text, max_tokens, model),
+        agent="docs_agent",
+        model=model,
+    )
 
 async def super_agent_for_meeting(meeting_text: str, db=None, meeting_id=None) -> str:
     """
@@ -237,7 +250,14 @@ async def super_agent_for_meeting(meeting_text: str, db=None, meeting_id=None) -
         
         # Agent 실행 - 전체 프로세스를 Agent가 자율적으로 수행
         print("[LangChain Agent] Agent 실행 중 (내부 문서 필요성 판단 → 키워드 추출 → 문서 추천)...")
-        agent_result = await agent.ainvoke({"input": agent_prompt})
+        # Agent 전체 실행에도 제한 시간 적용 (내부 Gemini 호출이 멈춰도 회의 분석이 끝나도록)
+        agent_result = await asyncio.wait_for(
+            agent.ainvoke(
+                {"input": agent_prompt},
+                config={"callbacks": [TokenBudgetCallback("docs_agent")]}
+            ),
+            timeout=stage_deadline("docs_agent"),
+        )
         
         # Agent 결과 추출
         if isinstance(agent_result, dict) and 'output' in agent_result:
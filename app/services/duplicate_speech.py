@@ -0,0 +1,233 @@
+# 회의 중복 발언 감지 (문자 shingle MinHash/LSH로 후보 추출 → 문장 임베딩 유사도로 확인)
+import asyncio
+import re
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from app.core.config import settings
+from app.services.sentence_embedding import encode_texts_async
+from app.services.sentence_table import SentenceTable
+
+# 문자 gram 해시를 줄이는 메르센 소수 (곱이 uint64 범위를 넘지 않음)
+_MERSENNE_PRIME = (1 << 31) - 1
+# 문자 gram 다항식 해시의 밑 (유니코드 코드포인트 최댓값보다 큼)
+_SHINGLE_BASE = 1_114_117
+# 프로세스/서버와 무관하게 같은 결과를 내도록 고정 시드
+_SEED = 20240601
+# 공백/문장부호/밑줄 (정규화 시 제거)
+_NON_WORD = re.compile(r"[\W_]+")
+# 저장할 대표 중복 예시 수
+MAX_EXAMPLES = 5
+# LSH 버킷 안에서 정렬 순서로 짝지을 이웃 수 (버킷이 커도 후보 수가 문장 수에 비례하도록 제한)
+BUCKET_NEIGHBORS = 8
+
+
+@dataclass
+class DuplicatePair:
+    first: int  # 먼저 나온 문장 번호 (원래 테이블 기준)
+    second: int
+    jaccard: float  # MinHash 추정 shingle 자카드 유사도
+    similarity: Optional[float] = None  # 임베딩 코사인 유사도 (확인하지 못했으면 None)
+    exact: bool = False  # 정규화한 문장이 완전히 같은 반복 (임베딩 확인 생략)
+
+
+@dataclass
+class DuplicateSpeechReport:
+    sentence_count: int  # 검사 대상 문장 수 (짧은 문장 제외)
+    candidate_pairs: int = 0  # LSH 후보 쌍 수
+    pairs: List[DuplicatePair] = field(default_factory=list)
+    groups: List[List[int]] = field(default_factory=list)  # 서로 중복인 문장 묶음 (2개 이상)
+    method: str = "minhash"  # 'minhash+embedding' 이면 임베딩 확인까지 거친 결과
+
+    @property
+    def duplicate_sentences(self) -> int:
+        # 앞선 발언을 되풀이한 문장 수 (묶음마다 첫 발언은 제외)
+        return sum(len(group) - 1 for group in self.groups)
+
+    def to_record(self, table: SentenceTable) -> Dict[str, Any]:
+        """meeting_duplicate_speech 저장용 dict (유사도가 높은 대표 예시 포함)"""
+        ranked = sorted(self.pairs, key=lambda p: -(p.similarity if p.similarity is not None else p.jaccard))
+        # 같은 문구가 수백 번 반복돼도 예시는 서로 다른 문장 쌍으로
+        examples, seen = [], set()
+        for p in ranked:
+            texts = (table.sentence(p.first), table.sentence(p.second))
+            if texts in seen:
+                continue
+            seen.add(texts)
+            examples.append((p, texts))
+            if len(examples) == MAX_EXAMPLES:
+                break
+        return {
+            "sentence_count": self.sentence_count,
+            "duplicate_pairs": len(self.pairs),
+            "duplicate_sentences": self.duplicate_sentences,
+            "duplicate_groups": len(self.groups),
+            "method": self.method,
+            "examples": [
+                {
+                    "first": first,
+                    "second": second,
+                    "jaccard": round(p.jaccard, 3),
+                    "similarity": round(p.similarity, 3) if p.similarity is not None else None,
+                }
+                for p, (first, second) in examples
+            ],
+        }
+
+
+def _normalize(text: str) -> str:
+    # 대소문자/공백/문장부호 차이를 무시한 비교용 문장
+    return _NON_WORD.sub("", text.lower()) or text
+
+
+def _shingle_hashes(texts: List[str], size: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    문장별 문자 size-gram 해시를 한 배열로 (해시, 문장별 시작 위치)
+    정규화한 문장들의 유니코드 코드포인트를 이어 붙여 모든 gram의 다항식 해시를 한 번에 계산
+    (프로세스마다 값이 바뀌는 hash()를 쓰지 않으므로 항상 같은 결과)
+    """
+    # size보다 짧은 문장은 gram 하나로 취급
+    normalized = [_normalize(text).ljust(size, "\0") for text in texts]
+    lengths = np.fromiter((len(value) for value in normalized), dtype=np.int64, count=len(normalized))
+    counts = lengths - size + 1
+    text_starts = np.concatenate([[0], np.cumsum(lengths)[:-1]])
+    offsets = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    # 각 gram의 시작 위치 (문장 경계를 넘는 gram 제외)
+    positions = np.repeat(text_starts, counts) + np.arange(counts.sum()) - np.repeat(offsets, counts)
+    windows = np.lib.stride_tricks.sliding_window_view(np.frombuffer("".join(normalized).encode("utf-32-le"), dtype=np.uint32), size)[positions].astype(np.uint64)
+    hashes = np.zeros(len(positions), dtype=np.uint64)
+    for j in range(size):
+        hashes = (hashes * np.uint64(_SHINGLE_BASE) + windows[:, j]) % np.uint64(_MERSENNE_PRIME)
+    return hashes, offsets
+
+
+def minhash_signatures(texts: List[str], num_perm: int, shingle_size: int) -> np.ndarray:
+    """
+    문장별 MinHash 서명 (N, num_perm)
+    전체 shingle 해시에 순열 해시를 한 번에 적용하고 문장 구간별 최솟값을 구한다.
+    """
+    values, offsets = _shingle_hashes(texts, shingle_size)
+    rng = np.random.default_rng(_SEED)
+    # multiply-shift 해시 ((a·x + b) mod 2^64 의 상위 32비트, 나머지 연산 없이 순환 곱으로 계산)
+    a = rng.integers(1, 1 << 63, size=(num_perm, 1), dtype=np.uint64) | np.uint64(1)
+    b = rng.integers(0, 1 << 63, size=(num_perm, 1), dtype=np.uint64)
+    permuted = ((a * values[None, :] + b) >> np.uint64(32)).astype(np.uint32)
+    return np.minimum.reduceat(permuted, offsets, axis=1).T
+
+
+def lsh_candidates(signatures: np.ndarray, bands: int) -> np.ndarray:
+    """
+    서명을 bands개 띠로 나눠 한 띠라도 완전히 같은 문장 쌍을 후보로 반환 ((M, 2) 배열, first < second)
+    (띠 b개 × 행 r개면 자카드 (1/b)^(1/r) 부근부터 후보가 될 확률이 급격히 높아짐)
+    띠마다 행 값을 64비트 키 하나로 섞어 정렬하고, 같은 키 구간의 문장은 구간 첫 문장 및
+    BUCKET_NEIGHBORS개 이내 이웃과만 짝지어 버킷이 커져도 후보 수가 문장 수에 비례하도록 한다
+    (작은 버킷은 모든 쌍, 큰 버킷은 union-find로 묶으면 사실상 같은 묶음).
+    """
+    rows = signatures.shape[1] // bands
+    # 홀수 난수 곱의 합 (2^64에서 순환) → 키 충돌은 이후 자카드 확인에서 걸러짐
+    multipliers = np.random.default_rng(_SEED + 1).integers(1, 1 << 62, size=rows, dtype=np.uint64) | np.uint64(1)
+    firsts, seconds = [], []
+    for band in range(bands):
+        keys = (signatures[:, band * rows:(band + 1) * rows] * multipliers).sum(axis=1)
+        # stable 정렬이라 같은 키 구간 안에서는 문장 번호 오름차순
+        order = np.argsort(keys, kind="stable")
+        ordered = keys[order]
+        boundary = np.concatenate([[True], ordered[1:] != ordered[:-1]])
+        # 정렬 위치마다 그 구간 첫 문장
+        run_ids = np.cumsum(boundary) - 1
+        leaders = order[np.flatnonzero(boundary)][run_ids]
+        linked = leaders != order
+        firsts.append(leaders[linked])
+        seconds.append(order[linked])
+        for k in range(1, min(BUCKET_NEIGHBORS, len(order))):
+            same = run_ids[:-k] == run_ids[k:]
+            firsts.append(order[:-k][same])
+            seconds.append(order[k:][same])
+    n = np.int64(len(signatures))
+    keys = np.unique(np.concatenate(firsts).astype(np.int64) * n + np.concatenate(seconds))
+    return np.stack([keys // n, keys % n], axis=1)
+
+
+def _group_pairs(pairs: List[DuplicatePair]) -> List[List[int]]:
+    # 중복 쌍을 union-find로 묶어 연결된 문장 묶음 (발화 순서)
+    parent: Dict[int, int] = {}
+
+    def find(x: int) -> int:
+        parent.setdefault(x, x)
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    for pair in pairs:
+        parent[find(pair.second)] = find(pair.first)
+    groups: Dict[int, List[int]] = defaultdict(list)
+    for x in sorted(parent):
+        groups[find(x)].append(x)
+    return [members for members in groups.values() if len(members) > 1]
+
+
+def find_near_duplicates(table: SentenceTable) -> DuplicateSpeechReport:
+    """
+    MinHash/LSH 단계만 수행 (임베딩 없이, CPU 작업이므로 비동기 경로에서는 스레드에서 호출)
+    인사/맞장구처럼 짧은 문장은 반복돼도 중복 발언으로 보지 않도록 DUPLICATE_SPEECH_MIN_CHARS 미만은 제외
+    정규화 후 완전히 같은 문장(STT가 무음 구간에 같은 문구를 수백 번 내는 경우 등)은 해시 전에 하나로 합치고
+    첫 발언과의 exact 쌍으로 기록한다.
+    """
+    mask = table.char_len >= settings.DUPLICATE_SPEECH_MIN_CHARS
+    rows = np.flatnonzero(mask)
+    report = DuplicateSpeechReport(sentence_count=len(rows))
+    if len(rows) < 2:
+        return report
+    first_row: Dict[str, int] = {}
+    unique_rows, unique_texts = [], []
+    for row, text in zip(rows.tolist(), table.sentences(mask)):
+        key = _normalize(text)
+        if key in first_row:
+            report.pairs.append(DuplicatePair(first=first_row[key], second=row, jaccard=1.0, exact=True))
+            continue
+        first_row[key] = row
+        unique_rows.append(row)
+        unique_texts.append(text)
+    if len(unique_rows) >= 2:
+        signatures = minhash_signatures(unique_texts, settings.DUPLICATE_SPEECH_NUM_PERM, settings.DUPLICATE_SPEECH_SHINGLE_SIZE)
+        candidates = lsh_candidates(signatures, settings.DUPLICATE_SPEECH_LSH_BANDS)
+        report.candidate_pairs = len(candidates)
+        jaccards = (signatures[candidates[:, 0]] == signatures[candidates[:, 1]]).mean(axis=1)
+        keep = jaccards >= settings.DUPLICATE_SPEECH_JACCARD
+        unique_rows = np.asarray(unique_rows)
+        for x, y, jaccard in zip(unique_rows[candidates[keep, 0]].tolist(), unique_rows[candidates[keep, 1]].tolist(), jaccards[keep].tolist()):
+            report.pairs.append(DuplicatePair(first=x, second=y, jaccard=jaccard))
+    report.groups = _group_pairs(report.pairs)
+    return report
+
+
+async def detect_duplicate_speech(table: SentenceTable) -> DuplicateSpeechReport:
+    """
+    회의 중복 발언 감지: MinHash/LSH로 글자가 많이 겹치는 문장 쌍을 찾고,
+    해당 문장만 임베딩해 의미 유사도가 DUPLICATE_SPEECH_EMBEDDING_SIMILARITY 이상인 쌍만 중복으로 확정한다.
+    정규화 후 완전히 같은 문장 쌍은 임베딩 없이 확정하며, 임베딩을 쓸 수 없으면 MinHash 결과를 그대로 사용한다.
+    """
+    report = await asyncio.to_thread(find_near_duplicates, table)
+    near = [p for p in report.pairs if not p.exact]
+    if not near:
+        return report
+    involved = sorted({p.first for p in near} | {p.second for p in near})
+    try:
+        vectors = await encode_texts_async([table.sentence(i) for i in involved])
+    except Exception as e:
+        print(f"[duplicate_speech] 문장 임베딩 실패, MinHash 결과만 사용: {e}", flush=True)
+        return report
+    position = {row: i for i, row in enumerate(involved)}
+    left = vectors[[position[p.first] for p in near]]
+    right = vectors[[position[p.second] for p in near]]
+    similarities = np.einsum("ij,ij->i", left, right)
+    for pair, similarity in zip(near, similarities.tolist()):
+        pair.similarity = similarity
+    report.pairs = [p for p in report.pairs if p.exact or p.similarity >= settings.DUPLICATE_SPEECH_EMBEDDING_SIMILARITY]
+    report.groups = _group_pairs(report.pairs)
+    report.method = "minhash+embedding"
+    return report
@@ -1,7 +1,21 @@
+import asyncio
 import statistics
 from collections import Counter
-from langchain_openai import ChatOpenAI
 import re
+from typing import Awaitable, Callable, List, Optional
+
+import numpy as np
+
+from app.core.config import settings
+from app.schemas.agent_output import AgendaCoverageOutput, EfficiencyEvaluationOutput
+from app.services.llm_budget import get_current_budget
+from app.services.llm_gateway import complete
+from app.services.meeting_events import PartialResultPublisher
+from app.services.model_routing import route_model
+from app.services.sentence_embedding import encode_texts_async
+from app.services.sentence_table import as_sentence_table, SentenceTable, UNSCORED
+from app.services.topic_segmentation import TopicAnalysis, analyze_topics
+from app.services.prompt_budget import SECTION_PLACEHOLDER, fill_section, pack_sentences, truncate_to_tokens
 
 # 다양한 안건 입력을 비동기로 분리하는 함수
 def _sync_split_agenda(agenda: str):
@@ -25,61 +39,196 @@ async def split_agenda(agenda: str):
     # 실제로는 동기 함수지만, 향후 확장성 위해 async로 래핑
     return _sync_split_agenda(agenda)
 
+async def _encode_sentences(table: SentenceTable) -> Optional[np.ndarray]:
+    # 빈 문장을 제외한 회의 문장 임베딩 (안건 사전 필터와 주제 구간 분할이 공유), 실패하면 None
+    try:
+        return await encode_texts_async(table.sentences(table.char_len > 0))
+    except Exception as e:
+        print(f"[lang_feedback] 문장 임베딩 실패: {e}", flush=True)
+        return None
+
+
+async def _agenda_evidence(agenda_items: List[str], table: SentenceTable, sentence_vectors: Callable[[], Awaitable[Optional[np.ndarray]]]):
+    """
+    안건-문장 임베딩 유사도로 안건별 근거 문장 후보를 추림
+    Returns: (안건별 최고 유사도, 근거 문장 mask), 임베딩을 쓸 수 없으면 None (전체 회의록 사용)
+    """
+    rows = np.flatnonzero(table.char_len > 0)
+    if not settings.AGENDA_EMBEDDING_PREFILTER or len(rows) == 0:
+        return None
+    vectors = await sentence_vectors()
+    if vectors is None:
+        return None
+    try:
+        agenda_vectors = await encode_texts_async(agenda_items)
+    except Exception as e:
+        print(f"[lang_feedback] 안건 임베딩 실패, 전체 회의록으로 판단: {e}", flush=True)
+        return None
+    similarity = agenda_vectors @ vectors.T
+    top_k = min(settings.AGENDA_EVIDENCE_SENTENCES, len(rows))
+    evidence = np.zeros(len(table), dtype=bool)
+    for scores in similarity:
+        top = np.argpartition(-scores, top_k - 1)[:top_k]
+        # 근거 문장 앞뒤 한 문장까지 포함 (질문-답변 흐름 유지)
+        for offset in (-1, 0, 1):
+            evidence[np.clip(rows[top] + offset, 0, len(table) - 1)] = True
+    return similarity.max(axis=1), evidence
+
+
+async def check_agenda_coverage(
+    agenda_items: List[str],
+    table: SentenceTable,
+    meeting_text: str,
+    model: str,
+    sentence_vectors: Optional[Callable[[], Awaitable[Optional[np.ndarray]]]] = None,
+) -> List[str]:
+    """
+    모든 안건의 실제 논의 여부를 구조화 출력 한 번으로 판단하고 논의되지 않은 안건 목록을 반환
+    - 임베딩 사전 필터: 회의 문장과의 최고 유사도가 AGENDA_PREFILTER_MIN_SIMILARITY 미만인 안건은 LLM 없이 미논의,
+      나머지는 안건별 유사 문장(앞뒤 문맥 포함)만 근거로 전달
+    - 호출 실패 또는 응답에 빠진 안건은 기존처럼 회의록 포함 여부로 판단
+    """
+    agenda_items = [str(item) for item in agenda_items]
+    if not agenda_items:
+        return []
+    prefilter = await _agenda_evidence(agenda_items, table, sentence_vectors or (lambda: _encode_sentences(table)))
+    candidates = list(range(len(agenda_items)))
+    mask = None
+    if prefilter is not None:
+        best, mask = prefilter
+        candidates = [i for i in candidates if best[i] >= settings.AGENDA_PREFILTER_MIN_SIMILARITY]
+        skipped = len(agenda_items) - len(candidates)
+        if skipped:
+            print(f"[lang_feedback] 안건 {skipped}개는 관련 발언이 없어 미논의로 판단 (임베딩 유사도)", flush=True)
+
+    decided = {}
+    if candidates:
+        agenda_lines = "\n".join(f"{i}. {agenda_items[i]}" for i in candidates)
+        agenda_prompt = f"""
+        다음 회의록을 분석하여 각 안건이 실제로 논의되었는지 판단해주세요.
+
+        **회의록:**
+        {SECTION_PLACEHOLDER}
+
+        **확인할 안건 (번호. 안건):**
+        {agenda_lines}
+
+        **판단 기준:**
+        1. 해당 안건과 관련된 구체적인 논의, 의견 교환, 결정사항이 있는가?
+        2. 단순히 키워드만 언급된 것이 아니라 실질적인 내용 논의가 있었는가?
+        3. 안건에 대한 질문, 답변, 토론이 이루어졌는가?
+
+        모든 안건에 대해 번호(index), 논의 여부(discussed), 근거(reason)를 반환해주세요.
+        """
+        # 회의록은 토큰 예산 안에서 점수 높은 문장부터 채움 (문장 테이블이 없으면 원문을 잘라 사용)
+        agenda_prompt = fill_section(
+            agenda_prompt,
+            lambda max_tokens: "\n".join(pack_sentences(table, max_tokens, model, mask=mask, agent="agenda_analysis"))
+            or truncate_to_tokens(meeting_text, max_tokens, model),
+            agent="agenda_analysis",
+            model=model,
+        )
+        try:
+            coverage = await complete(agenda_prompt, stage="feedback", schema=AgendaCoverageOutput, cache=True)
+            if coverage is not None:
+                decided = {item.index: item.discussed for item in coverage.items if item.index in candidates}
+        except Exception as e:
+            print(f"[lang_feedback] 안건 분석 중 오류 발생, 회의록 포함 여부로 판단: {e}", flush=True)
+
+    not_discussed = []
+    for i, item in enumerate(agenda_items):
+        if i not in candidates:
+            discussed = False
+        elif i in decided:
+            discussed = decided[i]
+        else:
+            discussed = item in meeting_text
+        if not discussed:
+            not_discussed.append(item)
+    return not_discussed
+
+
+# 효율성 분석에 이름을 붙여 보여줄 최대 주제 수 (나머지는 기타)
+MAX_LISTED_TOPICS = 5
+
+
+async def describe_topics(subject, agenda, topics: TopicAnalysis, use_llm: bool = True) -> dict:
+    """
+    로컬 주제 분석 수치를 기존 효율성 분석 형식으로 변환
+    LLM은 주제 이름과 편중/종합 평가 문장만 작성하고, 실패하거나 생략하면 대표 문장과 수치 기반 문장을 사용
+    """
+    listed = topics.topics[:MAX_LISTED_TOPICS]
+    names = [topic.representative[:20] for topic in listed]
+    imbalance = f"가장 많이 다룬 주제가 전체 발언의 {topics.concentration}%를 차지했습니다."
+    evaluation = (
+        f"{len(topics.topics)}개 주제를 논의했고 주제 전환은 {topics.switches}회, "
+        f"다시 논의한 주제는 {sum(1 for topic in topics.topics if topic.repeats > 0)}개였습니다."
+    )
+
+    if use_llm:
+        topic_lines = "\n".join(
+            f"{i}. 비율 {topic.share}%"
+            + (f" (약 {topic.minutes}분)" if topic.minutes is not None else "")
+            + f", 다시 논의 {topic.repeats}회, 대표 발언: {topic.representative}"
+            for i, topic in enumerate(listed)
+        )
+        prompt = f"""
+        회의 발언을 주제 구간으로 나눠 계산한 결과야. 수치는 이미 계산되어 있으니 바꾸지 말고 문장만 작성해줘.
+
+        **회의 주제:** {subject}
+        **회의 안건:** {agenda if agenda else "안건 없음"}
+        **전체 주제 수:** {len(topics.topics)}개
+        **주제별 비율 (번호. 비율, 다시 논의 횟수, 대표 발언):**
+        {topic_lines}
+        **주제 전환:** {topics.switches}회 ({topics.switch_level})
+        **가장 큰 주제 비율:** {topics.concentration}%
+
+        1. 각 주제 번호(index)에 대표 발언을 보고 짧은 주제 이름(name)을 붙여줘.
+        2. imbalance: 주제별 시간 배분의 편중 정도를 한 문장으로 설명해줘.
+        3. evaluation: 회의 주제와 안건에 비춰 주제 집중도, 전환 빈도, 반복 논의를 종합해 효율을 평가해줘.
+        모든 문장은 '-습니다' 체로 작성해줘.
+        """
+        try:
+            described = await complete(prompt, stage="feedback", schema=EfficiencyEvaluationOutput, cache=True)
+            if described is not None:
+                for item in described.topic_names:
+                    if 0 <= item.index < len(names) and item.name.strip():
+                        names[item.index] = item.name.strip()
+                imbalance = described.imbalance.strip() or imbalance
+                evaluation = described.evaluation.strip() or evaluation
+        except Exception as e:
+            print(f"[lang_feedback] 효율성 평가 문장 생성 실패, 수치 기반 문장 사용: {e}", flush=True)
+
+    topic_times = [f"{name}: {topic.share}% (중복 논의 {topic.repeats}회)" for name, topic in zip(names, listed)]
+    other_share = round(sum(topic.share for topic in topics.topics[MAX_LISTED_TOPICS:]), 1)
+    if other_share > 0:
+        topic_times.append(f"기타: {other_share}%")
+    return {
+        "총 주제 수": f"{len(topics.topics)}개",
+        "주요 주제별 소요 시간": topic_times,
+        "주제 전환 빈도": f"{topics.switch_level} (주제 간 전환 {topics.switches}회)",
+        "주제별 편중": imbalance,
+        "효율 평가": evaluation,
+    }
+
+
 async def feedback_agent(subject, chunks, tag_result, attendees_list=None, agenda=None, meeting_date=None, meeting_duration_minutes=None):
     # print(f"[lang_feedback] meeting_duration_minutes: {meeting_duration_minutes}", flush=True)
-    score_char_count = {0: 0, 1: 0, 2: 0, 3: 0}
-    total_chars = 0
-    for s in tag_result:
-        if isinstance(s, dict):
-            score = s.get("score", 0)
-            sent = s.get("sentence", "")
-            score_char_count[score] += len(sent)
-            total_chars += len(sent)
-    percent = lambda n: round((score_char_count.get(n, 0) / total_chars) * 100, 1) if total_chars else 0
-    percent_3 = percent(3)
-    percent_2 = percent(2)
-    percent_1 = percent(1)
-    percent_0 = percent(0)
+    table = as_sentence_table(tag_result, meeting_duration_minutes)
+    # 프롬프트 토큰 계산 기준 모델 (feedback 단계 라우팅 1순위)
+    model = route_model("feedback")
+    char_percent = table.score_char_percent()
+    percent_3 = char_percent[3]
+    percent_2 = char_percent[2]
+    percent_1 = char_percent[1]
+    percent_0 = char_percent[0]
     percent_23 = percent_2 + percent_3
 
-    scores = [s.get("score", 0) for s in tag_result if isinstance(s, dict)]
-    chit_chat_indices = [i for i, s in enumerate(scores) if s in [0, 1]]
-    chit_chat_ranges = []
-    if chit_chat_indices:
-        start = chit_chat_indices[0]
-        prev = start
-        for idx in chit_chat_indices[1:]:
-            if idx == prev + 1:
-                prev = idx
-            else:
-                chit_chat_ranges.append((start, prev))
-                start = idx
-                prev = idx
-        chit_chat_ranges.append((start, prev))
+    # 0~1점 문장이 연속된 구간을 잡담 구간으로 판단
+    chit_chat_mask = table.score_between(0, 1)
     small_talk = []
-    if meeting_duration_minutes is not None and len(scores) > 0:
-        min_per_sentence = meeting_duration_minutes / len(scores)
-        small_talk_ranges = []
-        for start, end in chit_chat_ranges:
-            start_min = round(start * min_per_sentence, 1)
-            end_min = round((end + 1) * min_per_sentence, 1)
-            end_min = min(end_min, meeting_duration_minutes)
-            s, e = sorted([start_min, end_min])
-            small_talk_ranges.append((s, e))
-        # 병합 함수
-        def merge_ranges(ranges):
-            if not ranges:
-                return []
-            ranges = sorted(ranges)
-            merged = [ranges[0]]
-            for current in ranges[1:]:
-                prev = merged[-1]
-                if current[0] <= prev[1]:
-                    merged[-1] = (prev[0], max(prev[1], current[1]))
-                else:
-                    merged.append(current)
-            return merged
-        merged_ranges = merge_ranges(small_talk_ranges)
+    if meeting_duration_minutes is not None and len(table) > 0:
+        merged_ranges = table.run_minutes(chit_chat_mask)
         n = len(merged_ranges)
         if n == 0:
             small_talk = ["잡담 구간이 뚜렷하게 나타나지 않았습니다."]
@@ -97,14 +246,23 @@ async def feedback_agent(subject, chunks, tag_result, attendees_list=None, agend
             details = ", ".join([f"{round(s,1)}~{round(e,1)}분" for s, e in merged_ranges[:3]])
             small_talk = [f"총 {n}개의 잡담 구간({details} 외 {n-3}개)에서 관련 없는 대화가 있었습니다."]
     else:
-        for start, end in chit_chat_ranges:
+        for start, end in table.runs(chit_chat_mask):
             start_min = start + 1
             end_min = end + 1
             small_talk.append(f"{start_min}분~{end_min}분 구간에서 관련 없는 대화가 있었습니다.")
     if not small_talk:
         small_talk = ["잡담 구간이 뚜렷하게 나타나지 않았습니다."]
 
-    llm = ChatOpenAI(model="gpt-4o", temperature=0)
+    overall = (
+        f"이번 회의에서 핵심 관련 발언(3점)은 {percent_3}%, 관련 발언(2점)은 {percent_2}%로,\n"
+        f"총 {percent_23}%가 회의 주제에 집중된 내용으로 진행되었습니다.\n"
+        f"반면 전혀 관련 없는 잡담(0점)은 {percent_0}% 포함되어 있었습니다."
+    )
+
+    # 완성된 항목부터 회의 이벤트로 전달 (LLM 없이 계산되는 총평/잡담 구간은 바로)
+    budget = get_current_budget()
+    publisher = PartialResultPublisher(budget.meeting_id if budget else None, "feedback")
+    await publisher.publish({"총평": overall, "잡담 구간 피드백": small_talk})
 
     attendees_list_str = "참석자 정보 없음"
     if attendees_list and isinstance(attendees_list, list):
@@ -124,8 +282,8 @@ async def feedback_agent(subject, chunks, tag_result, attendees_list=None, agend
     {attendees_list_str}
 
     - 점수별 글자수 비율: 3점 {percent_3}%, 2점 {percent_2}%, 1점 {percent_1}%, 0점 {percent_0}%
-    - 태깅 결과:
-    {[(s.get('score'), s.get('sentence'), s.get('reason')) for s in tag_result if isinstance(s, dict)]}
+    - 태깅 결과 (점수 | 문장 | 이유):
+    {SECTION_PLACEHOLDER}
 
     주의 사항:
     - 회의 시작 전 **인사말**과 마무리 인사말은 예의적 발언으로 간주하고 스몰톡으로 판단하지 마.
@@ -134,194 +292,202 @@ async def feedback_agent(subject, chunks, tag_result, attendees_list=None, agend
     회의 주제와 안건을 고려해 회의 전반을 분석하고 개선 가이드를 2~3줄 제시해줘.
     """
 
-    guide_response = await llm.ainvoke(feedback_prompt)
-    # guide_response.content가 리스트일 수 있으므로 처리
-    guide_content = guide_response.content
-    if isinstance(guide_content, list):
-        guide_content = ' '.join(str(item) for item in guide_content)
-    guide = [guide_content.strip()]
+    def tagged_line(i):
+        score = int(table.score[i])
+        reason = table.reasons[i]
+        line = f"{score if score != UNSCORED else '-'} | {table.sentence(i)}"
+        return f"{line} | {reason}" if reason else line
+
+    feedback_prompt = fill_section(
+        feedback_prompt,
+        lambda max_tokens: "\n".join(pack_sentences(table, max_tokens, model, line=tagged_line, agent="feedback")),
+        agent="feedback",
+        model=model,
+    )
+    # 문장 임베딩은 처음 필요한 분석이 한 번만 계산하고 공유
+    vectors_task = None
+
+    async def sentence_vectors():
+        nonlocal vectors_task
+        if vectors_task is None:
+            vectors_task = asyncio.ensure_future(_encode_sentences(table))
+        return await vectors_task
+
+    # 개선 가이드 / 안건 논의 여부 / 효율성 분석은 서로 독립이라 동시에 실행
+    async def analyze_guide():
+        async def on_guide_delta(text):
+            if publisher.due():
+                await publisher.publish({"개선 가이드": [text.strip()]})
+
+        guide_response = await complete(
+            feedback_prompt, stage="feedback", cache=True, on_delta=on_guide_delta if publisher.enabled else None
+        )
+        guide = [guide_response.text]
+        await publisher.publish({"개선 가이드": guide})
+        return guide
 
-    missing_agenda_issues = None
-    if agenda:
+    async def analyze_agenda():
+        if not agenda:
+            return None
         if isinstance(agenda, str):
             agenda_items = await split_agenda(agenda)
         else:
             agenda_items = agenda
-        
-        # LLM을 활용한 의미론적 안건 논의 여부 분석
+        agenda_items = [item for item in agenda_items if item]
         meeting_text = '\n'.join(chunks) if isinstance(chunks, list) else str(chunks)
-        
-        # 각 안건에 대해 LLM으로 논의 여부 판단
-        discussed = []
-        not_discussed = []
-        
-        for item in agenda_items:
-            if not item:
-                continue
-                
-            agenda_analysis_prompt = f"""
-            다음 회의록을 분석하여 특정 안건이 실제로 논의되었는지 판단해주세요.
-
-            **회의록:**
-            {meeting_text}
-
-            **확인할 안건:**
-            {item}
-
-            **판단 기준:**
-            1. 해당 안건과 관련된 구체적인 논의, 의견 교환, 결정사항이 있는가?
-            2. 단순히 키워드만 언급된 것이 아니라 실질적인 내용 논의가 있었는가?
-            3. 안건에 대한 질문, 답변, 토론이 이루어졌는가?
-
-            다음 형식으로만 답변해주세요:
-            논의됨: [예/아니오]
-            이유: [구체적인 근거]
-            """
-            
-            try:
-                analysis_response = await llm.ainvoke(agenda_analysis_prompt)
-                response_content = analysis_response.content
-                if isinstance(response_content, list):
-                    response_content = ' '.join(str(item) for item in response_content)
-                response_content = response_content.strip()
-                
-                # 응답 파싱
-                if "논의됨: 예" in response_content:
-                    discussed.append(item)
-                else:
-                    not_discussed.append(item)
-                    
-            except Exception as e:
-                # print(f"[lang_feedback] 안건 분석 중 오류 발생: {e}", flush=True)
-                # 오류 발생 시 기존 방식으로 폴백
-                if item and item in meeting_text:
-                    discussed.append(item)
-                else:
-                    not_discussed.append(item)
-        
+
+        # 모든 안건을 구조화 출력 한 번으로 판단
+        not_discussed = await check_agenda_coverage(agenda_items, table, meeting_text, model, sentence_vectors)
         if not_discussed:
             missing_agenda_issues = f"{', '.join(not_discussed)}"
         else:
             missing_agenda_issues = "모든 안건이 논의되었습니다."
+        await publisher.publish({"누락된 논의 발생": missing_agenda_issues})
+        return missing_agenda_issues
 
-    # LLM을 활용한 회의 효율성 분석
-    meeting_efficiency_analysis = {}
-    sentences = [s.get('sentence', '') for s in tag_result if isinstance(s, dict) and s.get('sentence', '').strip()]
+    async def analyze_efficiency():
+        meeting_efficiency_analysis = {}
+        sentences = [s for s in table.sentences() if s.strip()]
     
-    if len(sentences) > 1:
-        # 회의 효율성 분석을 위한 LLM 프롬프트
-        efficiency_analysis_prompt = f"""
-        다음 회의록을 분석하여 회의 효율성을 평가해주세요.
+        # 토큰 예산이 부족하면 효율성 분석을 생략하고 점수 기반 기본 분석으로 대체
+        skip_efficiency = budget is not None and budget.should_degrade("skip_efficiency_analysis")
 
-        **회의 주제:** {subject}
-        **회의 안건:** {agenda if agenda else "안건 없음"}
-        **회의 문장들:**
-        {chr(10).join([f"{i+1}. {sent}" for i, sent in enumerate(sentences)])}
-
-        **분석 기준:**
-        1️⃣ 주제 집중도: 특정 주제가 전체의 50% 이상 차지하는지
-        2️⃣ 주제 전환 빈도: 얼마나 다양한 주제를 논의했는지
-        3️⃣ 주제별 논의 시간의 편중 여부: 모든 주제가 비슷한 시간으로 배분됐는지
-        4️⃣ 동일 주제 반복 정도: 같은 주제가 새로운 정보 없이 여러 차례 등장했는지
-        5️⃣ 회의 목표 달성 여부: 안건에 따라 각 주제가 실질적 진전을 이뤘는지
-
-        **응답 형식 (정확히 이 형식으로만 답변):**
-        총 주제 수: [숫자]개
-        주요 주제별 소요 시간:
-        - 주제명1: [비율]% (중복 논의 [횟수]회)
-        - 주제명2: [비율]% (중복 논의 [횟수]회)
-        - 기타: [비율]%
-        주제 전환 빈도: [높음/보통/낮음] (주제 간 전환 [횟수]회)
-        주제별 편중: [편중 정도 설명]
-        효율 평가: [종합 평가]
-        
-        **문체 지침:**
-        - 모든 문장은 '-습니다' 체로 작성해주세요.
-        - 예: "됨" → "되었습니다", "할애됨" → "할애되었습니다", "이루었다" → "이루었습니다"
-        """
+        # 주제 수/비율/전환/반복은 로컬 주제 구간 분할로 계산하고 LLM은 주제 이름과 평가 문장만 작성
+        topics = None
+        if len(sentences) > 1 and settings.EFFICIENCY_ANALYSIS == "topics":
+            vectors = await sentence_vectors()
+            if vectors is not None:
+                topics = await asyncio.to_thread(analyze_topics, table, vectors, meeting_duration_minutes)
+    
+        if topics is not None:
+            meeting_efficiency_analysis = await describe_topics(subject, agenda, topics, use_llm=not skip_efficiency)
+        elif len(sentences) > 1 and not skip_efficiency:
+            # LLM을 활용한 회의 효율성 분석
+            # 회의 효율성 분석을 위한 LLM 프롬프트
+            efficiency_analysis_prompt = f"""
+            다음 회의록을 분석하여 회의 효율성을 평가해주세요.
+
+            **회의 주제:** {subject}
+            **회의 안건:** {agenda if agenda else "안건 없음"}
+            **회의 문장들:**
+            {SECTION_PLACEHOLDER}
+
+            **분석 기준:**
+            1️⃣ 주제 집중도: 특정 주제가 전체의 50% 이상 차지하는지
+            2️⃣ 주제 전환 빈도: 얼마나 다양한 주제를 논의했는지
+            3️⃣ 주제별 논의 시간의 편중 여부: 모든 주제가 비슷한 시간으로 배분됐는지
+            4️⃣ 동일 주제 반복 정도: 같은 주제가 새로운 정보 없이 여러 차례 등장했는지
+            5️⃣ 회의 목표 달성 여부: 안건에 따라 각 주제가 실질적 진전을 이뤘는지
+
+            **응답 형식 (정확히 이 형식으로만 답변):**
+            총 주제 수: [숫자]개
+            주요 주제별 소요 시간:
+            - 주제명1: [비율]% (중복 논의 [횟수]회)
+            - 주제명2: [비율]% (중복 논의 [횟수]회)
+            - 기타: [비율]%
+            주제 전환 빈도: [높음/보통/낮음] (주제 간 전환 [횟수]회)
+            주제별 편중: [편중 정도 설명]
+            효율 평가: [종합 평가]
         
-        try:
-            efficiency_response = await llm.ainvoke(efficiency_analysis_prompt)
-            response_content = efficiency_response.content
-            if isinstance(response_content, list):
-                response_content = ' '.join(str(item) for item in response_content)
-            response_content = response_content.strip()
+            **문체 지침:**
+            - 모든 문장은 '-습니다' 체로 작성해주세요.
+            - 예: "됨" → "되었습니다", "할애됨" → "할애되었습니다", "이루었다" → "이루었습니다"
+            """
+            # 문장 번호는 원래 발화 순서 기준 (예산 초과로 빠진 문장은 번호가 건너뜀)
+            efficiency_analysis_prompt = fill_section(
+                efficiency_analysis_prompt,
+                lambda max_tokens: "\n".join(pack_sentences(
+                    table,
+                    max_tokens,
+                    model,
+                    mask=table.char_len > 0,
+                    line=lambda i: f"{i+1}. {table.sentence(i)}",
+                    agent="efficiency",
+                )),
+                agent="efficiency",
+                model=model,
+            )
+
+            try:
+                efficiency_response = await complete(efficiency_analysis_prompt, stage="feedback", cache=True)
+                response_content = efficiency_response.text
             
-            # 응답 파싱하여 효율성 분석 정보 추출
-            lines = response_content.split('\n')
-            current_section = None
-            topic_time_info = []
+                # 응답 파싱하여 효율성 분석 정보 추출
+                lines = response_content.split('\n')
+                current_section = None
+                topic_time_info = []
             
-            for line in lines:
-                line = line.strip()
-                if line.startswith("총 주제 수:"):
-                    meeting_efficiency_analysis["총 주제 수"] = line.replace("총 주제 수:", "").strip()
-                elif line.startswith("주요 주제별 소요 시간:"):
-                    current_section = "topics"
-                elif line.startswith("주제 전환 빈도:"):
-                    meeting_efficiency_analysis["주제 전환 빈도"] = line.replace("주제 전환 빈도:", "").strip()
-                    current_section = None
-                elif line.startswith("주제별 편중:"):
-                    meeting_efficiency_analysis["주제별 편중"] = line.replace("주제별 편중:", "").strip()
-                    current_section = None
-                elif line.startswith("효율 평가:"):
-                    meeting_efficiency_analysis["효율 평가"] = line.replace("효율 평가:", "").strip()
-                    current_section = None
-                elif current_section == "topics" and line.startswith("- "):
-                    topic_time_info.append(line[2:].strip())
+                for line in lines:
+                    line = line.strip()
+                    if line.startswith("총 주제 수:"):
+                        meeting_efficiency_analysis["총 주제 수"] = line.replace("총 주제 수:", "").strip()
+                    elif line.startswith("주요 주제별 소요 시간:"):
+                        current_section = "topics"
+                    elif line.startswith("주제 전환 빈도:"):
+                        meeting_efficiency_analysis["주제 전환 빈도"] = line.replace("주제 전환 빈도:", "").strip()
+                        current_section = None
+                    elif line.startswith("주제별 편중:"):
+                        meeting_efficiency_analysis["주제별 편중"] = line.replace("주제별 편중:", "").strip()
+                        current_section = None
+                    elif line.startswith("효율 평가:"):
+                        meeting_efficiency_analysis["효율 평가"] = line.replace("효율 평가:", "").strip()
+                        current_section = None
+                    elif current_section == "topics" and line.startswith("- "):
+                        topic_time_info.append(line[2:].strip())
             
-            meeting_efficiency_analysis["주요 주제별 소요 시간"] = topic_time_info
+                meeting_efficiency_analysis["주요 주제별 소요 시간"] = topic_time_info
                         
-        except Exception as e:
-            # print(f"[lang_feedback] 회의 효율성 분석 중 오류 발생: {e}", flush=True)
-            # 오류 발생 시 기본값 설정
-            meeting_efficiency_analysis = {
-                "총 주제 수": "분석 불가",
-                "주요 주제별 소요 시간": ["분석 중 오류 발생"],
-                "주제 전환 빈도": "분석 불가",
-                "주제별 편중": "분석 불가",
-                "효율 평가": "분석 중 오류가 발생하여 평가할 수 없습니다"
-            }
-    # 회의 효율성 분석 결과를 회의 시간 분석으로 통합
-    if meeting_efficiency_analysis and "효율 평가" in meeting_efficiency_analysis:
-        # 효율성 분석 결과를 상세하게 포맷팅
-        analysis_parts = []
+            except Exception as e:
+                # print(f"[lang_feedback] 회의 효율성 분석 중 오류 발생: {e}", flush=True)
+                # 오류 발생 시 기본값 설정
+                meeting_efficiency_analysis = {
+                    "총 주제 수": "분석 불가",
+                    "주요 주제별 소요 시간": ["분석 중 오류 발생"],
+                    "주제 전환 빈도": "분석 불가",
+                    "주제별 편중": "분석 불가",
+                    "효율 평가": "분석 중 오류가 발생하여 평가할 수 없습니다"
+                }
+        # 회의 효율성 분석 결과를 회의 시간 분석으로 통합
+        if meeting_efficiency_analysis and "효율 평가" in meeting_efficiency_analysis:
+            # 효율성 분석 결과를 상세하게 포맷팅
+            analysis_parts = []
         
-        if "총 주제 수" in meeting_efficiency_analysis:
-            analysis_parts.append(f"총 주제 수: {meeting_efficiency_analysis['총 주제 수']}")
+            if "총 주제 수" in meeting_efficiency_analysis:
+                analysis_parts.append(f"총 주제 수: {meeting_efficiency_analysis['총 주제 수']}")
         
-        if "주요 주제별 소요 시간" in meeting_efficiency_analysis and meeting_efficiency_analysis["주요 주제별 소요 시간"]:
-            topic_times = meeting_efficiency_analysis["주요 주제별 소요 시간"]
-            if len(topic_times) > 0:
-                analysis_parts.append("주요 주제별 소요 시간: " + "; ".join(topic_times))
+            if "주요 주제별 소요 시간" in meeting_efficiency_analysis and meeting_efficiency_analysis["주요 주제별 소요 시간"]:
+                topic_times = meeting_efficiency_analysis["주요 주제별 소요 시간"]
+                if len(topic_times) > 0:
+                    analysis_parts.append("주요 주제별 소요 시간: " + "; ".join(topic_times))
         
-        if "주제 전환 빈도" in meeting_efficiency_analysis:
-            analysis_parts.append(f"주제 전환 빈도: {meeting_efficiency_analysis['주제 전환 빈도']}")
+            if "주제 전환 빈도" in meeting_efficiency_analysis:
+                analysis_parts.append(f"주제 전환 빈도: {meeting_efficiency_analysis['주제 전환 빈도']}")
         
-        if "주제별 편중" in meeting_efficiency_analysis:
-            analysis_parts.append(f"주제별 편중: {meeting_efficiency_analysis['주제별 편중']}")
+            if "주제별 편중" in meeting_efficiency_analysis:
+                analysis_parts.append(f"주제별 편중: {meeting_efficiency_analysis['주제별 편중']}")
         
-        if "효율 평가" in meeting_efficiency_analysis:
-            analysis_parts.append(f"효율 평가: {meeting_efficiency_analysis['효율 평가']}")
+            if "효율 평가" in meeting_efficiency_analysis:
+                analysis_parts.append(f"효율 평가: {meeting_efficiency_analysis['효율 평가']}")
         
-        meeting_time_analysis = " | ".join(analysis_parts) if analysis_parts else "회의 효율성 분석이 완료되었습니다."
-    else:
-        # 기본 분석 (폴백)
-        if percent_3 + percent_2 >= 70:
-            fallback_text = "회의 시간이 매우 효율적으로 사용되었습니다."
-        elif percent_0 >= 20:
-            fallback_text = f"회의 중 {percent_0}%가 잡담 등 비효율적으로 사용되었습니다."
+            meeting_time_analysis = " | ".join(analysis_parts) if analysis_parts else "회의 효율성 분석이 완료되었습니다."
         else:
-            fallback_text = "회의 시간이 비교적 효율적으로 사용되었습니다."
+            # 기본 분석 (폴백)
+            if percent_3 + percent_2 >= 70:
+                fallback_text = "회의 시간이 매우 효율적으로 사용되었습니다."
+            elif percent_0 >= 20:
+                fallback_text = f"회의 중 {percent_0}%가 잡담 등 비효율적으로 사용되었습니다."
+            else:
+                fallback_text = "회의 시간이 비교적 효율적으로 사용되었습니다."
         
-        meeting_time_analysis = fallback_text
+            meeting_time_analysis = fallback_text
+        await publisher.publish({"회의 시간 분석": meeting_time_analysis})
+        return meeting_time_analysis
 
-    overall = (
-        f"이번 회의에서 핵심 관련 발언(3점)은 {percent_3}%, 관련 발언(2점)은 {percent_2}%로,\n"
-        f"총 {percent_23}%가 회의 주제에 집중된 내용으로 진행되었습니다.\n"
-        f"반면 전혀 관련 없는 잡담(0점)은 {percent_0}% 포함되어 있었습니다."
+    guide, missing_agenda_issues, meeting_time_analysis = await asyncio.gather(
+        analyze_guide(), analyze_agenda(), analyze_efficiency()
     )
 
+
     feedback = {
         "총평": overall,
         "잡담 구간 피드백": small_talk,
@@ -329,6 +495,7 @@ async def feedback_agent(subject, chunks, tag_result, attendees_list=None, agend
         "회의 시간 분석": meeting_time_analysis,
         "개선 가이드": guide
     }
+    await publisher.publish(feedback, done=True)
 
     # print("[lang_feedback] 피드백 결과:", feedback, flush=True)
     return {
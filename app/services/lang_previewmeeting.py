@@ -1,7 +1,8 @@
-from langchain_openai import ChatOpenAI
 import datetime
 import re, json
 from typing import Optional, Dict, Any
+from app.services.llm_gateway import complete
+from app.services.prompt_budget import compact_json
 
 async def lang_previewmeeting(
     summary_data: Dict[str, Any], 
@@ -24,8 +25,6 @@ async def lang_previewmeeting(
         dict: Meeting 테이블에 insert할 데이터 또는 None (다음 회의가 없는 경우)
     """
     
-    llm = ChatOpenAI(model="gpt-4", temperature=0)
-    
     # meeting_date를 기반으로 날짜 계산
     if meeting_date:
         try:
@@ -41,7 +40,7 @@ async def lang_previewmeeting(
         today_str = today.strftime('%Y.%m.%d(%a)')
     
     # 요약 데이터를 문자열로 변환
-    summary_text = json.dumps(summary_data, ensure_ascii=False, indent=2)
+    summary_text = compact_json(summary_data)
     
     print(f"[lang_previewmeeting] === 시작 ===", flush=True)
     print(f"[lang_previewmeeting] 입력 subject: {subject}", flush=True)
@@ -119,8 +118,8 @@ async def lang_previewmeeting(
     - 날짜 변환이 불가능하면 has_next_meeting을 false로 설정
     """
     
-    response = await llm.ainvoke(prompt)
-    agent_output = str(response.content)
+    response = await complete(prompt, stage="preview", cache=True)
+    agent_output = response.text
     
     # JSON 파싱 시도
     try:
@@ -1,8 +1,9 @@
 # 역할 분배 agent (lang_role.py)
-from langchain_openai import ChatOpenAI
-import json
 from typing import List, Dict, Any
-import re
+from app.schemas.agent_output import RoleAssignmentOutput
+from app.services.llm_gateway import complete
+from app.services.model_routing import route_model
+from app.services.prompt_budget import SECTION_PLACEHOLDER, compact_json, fill_section, truncate_to_tokens
 
 async def assign_roles(subject: str, full_meeting_sentences: List[str], attendees_list: List[Dict[str, Any]], output: dict, agenda: str = "", meeting_date: str = "") -> dict:
     """
@@ -16,7 +17,6 @@ async def assign_roles(subject: str, full_meeting_sentences: List[str], attendee
     # print(f"[assign_roles] 전달받은 output: {output}", flush=True)
     print(f"[assign_roles] 전달받은 full_meeting_sentences: {full_meeting_sentences}", flush=True)
     print(f"[assign_roles] 전달받은 attendees_list: {attendees_list}", flush=True)
-    llm = ChatOpenAI(model="gpt-4", temperature=0)
 
     # 참석자 이름 리스트 생성
     attendee_names = ", ".join([a.get("name", "") for a in attendees_list])
@@ -62,33 +62,29 @@ async def assign_roles(subject: str, full_meeting_sentences: List[str], attendee
 지금부터 아래 정보를 참고하여 담당자를 배정해라:
 
 [참석자 목록]
-{json.dumps(attendees_list, ensure_ascii=False)}
+{compact_json(attendees_list)}
 
 [할일 리스트]
-{json.dumps(todos, ensure_ascii=False, indent=2)}
+{compact_json(todos)}
 
 [회의 원문 텍스트]
-{meeting_text}
+{SECTION_PLACEHOLDER}
 '''
-
-    response = await llm.ainvoke(prompt)
-    agent_output = response.content
-    print("[assign_roles] agent_output:", agent_output, flush=True)
-
-    # JSON 파싱 시도
-    try:
-        agent_output = agent_output.strip()
-        if agent_output.startswith("```json"):
-            agent_output = agent_output.removeprefix("```json").removesuffix("``` ").strip()
-        match = re.search(r'\{.*\}', agent_output, re.DOTALL)
-        if match:
-            agent_output = match.group()
-            result_json = json.loads(agent_output)
-        else:
-            result_json = {"assigned_todos": [], "error": "넘겨 받은 할일 리스트가 없습니다.", "raw": agent_output}
-    except Exception as e:
-        print(f"[assign_roles] JSON 파싱 오류: {e}", flush=True)
-        result_json = {"assigned_todos": [], "error": str(e), "raw": agent_output}
+    # 회의 원문은 남은 토큰 예산에 맞춰 앞에서부터 자름
+    model = route_model("role")
+    prompt = fill_section(
+        prompt,
+        lambda max_tokens: truncate_to_tokens(meeting_text, max_tokens, model),
+        agent="role",
+        model=model,
+    )
+
+    assigned = await complete(prompt, stage="role", schema=RoleAssignmentOutput, cache=True)
+    if assigned is not None:
+        result_json = assigned.model_dump()
+    else:
+        result_json = {"assigned_todos": [], "error": "역할 분배 결과를 구조화하지 못했습니다."}
+    print("[assign_roles] agent_output:", result_json, flush=True)
 
     # schedule 항목 추가: action/context가 일치하는 output['todos']에서 schedule을 찾아서 넣기
     if result_json.get("assigned_todos") and todos:
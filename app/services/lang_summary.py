@@ -1,18 +1,178 @@
-from langchain_openai import ChatOpenAI
+import asyncio
 import datetime
-import re, json
+from typing import List, Optional
+
+import numpy as np
+
+from app.core.config import settings
+from app.schemas.agent_output import SummaryOutput
+from app.services.llm_budget import get_current_budget
+from app.services.llm_gateway import complete
+from app.services.meeting_events import PartialResultPublisher
+from app.services.model_routing import route_model
+from app.services.sentence_table import as_sentence_table
+from app.services.prompt_budget import (
+    SECTION_PLACEHOLDER,
+    compact_json,
+    count_tokens_batch,
+    fill_section,
+    group_by_tokens,
+    pack_sentences,
+    remaining_budget,
+    truncate_to_tokens,
+)
+
+def _partial_sections(partial: dict) -> dict:
+    # 부분 파싱된 SummaryOutput → 저장 형식 {"항목 제목": ["내용", ...]} (제목이 완성된 항목만)
+    return {
+        section["title"]: section.get("items", [])
+        for section in partial.get("sections", [])
+        if isinstance(section, dict) and section.get("title")
+    }
+
+def _use_map_reduce(table, relevant_mask, prompt: str, model: str) -> bool:
+    # 'auto'는 중요 문장 전체가 한 번의 요약 프롬프트 예산을 넘을 때만 (넘치면 단일 호출은 낮은 점수 문장을 버림)
+    if settings.SUMMARY_MAP_REDUCE == "always":
+        return True
+    if settings.SUMMARY_MAP_REDUCE != "auto" or not relevant_mask.any():
+        return False
+    lines = table.sentences(relevant_mask)
+    total = sum(count_tokens_batch(lines, model)) + len(lines)
+    return total > remaining_budget("summary", model, prompt.replace(SECTION_PLACEHOLDER, ""))
+
+
+async def _map_reduce_summary(table, relevant_mask, subject, guidelines, on_delta=None) -> Optional[SummaryOutput]:
+    """
+    중요 문장을 발화 순서대로 토큰 예산 크기의 구간으로 나눠 병렬 요약(map)한 뒤 하나로 병합(reduce)
+    구간 수는 회의 길이에 비례하고(최대 SUMMARY_MAP_MAX_SEGMENTS) 구간 요약은 동시에 실행되므로
+    전체 지연은 구간 요약 1회 + 병합 호출 수준으로 유지된다. 구간 요약이 모두 실패하면 None (단일 호출로 대체)
+    """
+    map_model = route_model("summary_map")
+    map_prompt = f"""
+    너는 회의록 작성 전문가야.
+
+    회의 주제: {subject}
+
+    아래는 긴 회의를 {{count}}개 구간으로 나눈 것 중 {{position}}번째 구간에서 중요한 문장(점수 1~3)만 추린 리스트야 (한 줄에 한 문장):
+    {SECTION_PLACEHOLDER}
+
+    이 구간에 나온 내용만 정리해. 다른 구간 요약과 나중에 합쳐지므로 항목 제목은 구체적으로 써줘.
+""" + guidelines
+    segment_budget = remaining_budget("summary_map", map_model, map_prompt.replace(SECTION_PLACEHOLDER, ""))
+
+    rows = np.flatnonzero(relevant_mask)
+    costs = np.asarray(count_tokens_batch(table.sentences(relevant_mask), map_model)) + 1
+    # 구간이 너무 많아지면 구간을 키움 (구간 안에서는 pack_sentences가 점수 높은 문장부터 담음)
+    segment_tokens = max(segment_budget, -(-int(costs.sum()) // max(1, settings.SUMMARY_MAP_MAX_SEGMENTS)))
+    segments = group_by_tokens(costs, segment_tokens)
+    print(f"[lang_summary] map-reduce: 중요 문장 {len(rows)}개 → {len(segments)}개 구간 ({map_model})", flush=True)
+
+    semaphore = asyncio.Semaphore(max(1, settings.SUMMARY_MAP_CONCURRENCY))
+
+    async def summarize_segment(position: int, start: int, end: int) -> Optional[SummaryOutput]:
+        mask = np.zeros(len(table), dtype=bool)
+        mask[rows[start:end]] = True
+        prompt = map_prompt.replace("{count}", str(len(segments))).replace("{position}", str(position + 1))
+        prompt = fill_section(
+            prompt,
+            lambda max_tokens: "\n".join(pack_sentences(table, max_tokens, map_model, mask=mask, agent="summary_map")),
+            agent="summary_map",
+            model=map_model,
+        )
+        async with semaphore:
+            try:
+                return await complete(prompt, stage="summary_map", schema=SummaryOutput, cache=True)
+            except Exception as e:
+                print(f"[lang_summary] {position + 1}번째 구간 요약 실패: {e}", flush=True)
+                return None
+
+    partials = await asyncio.gather(*[
+        summarize_segment(position, start, end) for position, (start, end) in enumerate(segments)
+    ])
+    partials = [partial for partial in partials if partial is not None and partial.sections]
+    if not partials:
+        return None
+    return await _reduce_summaries(partials, subject, semaphore, on_delta)
 
-async def lang_summary(subject, chunks, tag_result, attendees_list=None, agenda=None, meeting_date=None):
-    llm = ChatOpenAI(model="gpt-4", temperature=0)
 
+async def _reduce_summaries(partials: List[SummaryOutput], subject, semaphore, on_delta=None) -> Optional[SummaryOutput]:
+    """
+    구간 요약 병합, 한 번에 들어가지 않으면 인접 구간끼리 먼저 병합하는 단계를 반복 (계층 병합)
+    """
+    model = route_model("summary")
+    reduce_prompt = f"""
+    너는 회의록 작성 전문가야.
+
+    회의 주제: {subject}
+
+    아래는 긴 회의를 구간별로 나눠 정리한 부분 요약이야 (한 줄에 한 구간, 발화 순서대로, JSON):
+    {SECTION_PLACEHOLDER}
+
+    부분 요약들을 하나의 회의록으로 합쳐줘.
+    - 같은 주제의 항목은 하나로 합치고, 중복된 내용은 한 번만 남겨
+    - 여러 구간에 흩어진 일정, 담당자, 결정사항, 우려사항은 관련 항목 아래로 모아
+    - 괄호 안에 적힌 실제 날짜 표기는 그대로 유지해
+    - 부분 요약에 없는 내용은 추가하지 말고, 전체 내용은 **명사형 중심**으로 구성해
+
+    **결과 형식:**
+    각 항목은 sections 배열의 원소 하나로 반환해.
+    - title: 항목 제목
+    - items: 핵심 정보, 담당자/일정/우선순위 등 구체 정보
+    """
+    fixed = reduce_prompt.replace(SECTION_PLACEHOLDER, "")
+    level = 0
+    while len(partials) > 1:
+        lines = [compact_json(partial.model_dump()["sections"]) for partial in partials]
+        costs = [cost + 1 for cost in count_tokens_batch(lines, model)]
+        groups = group_by_tokens(costs, remaining_budget("summary_map", route_model("summary_map"), fixed))
+        if sum(costs) <= remaining_budget("summary", model, fixed) or len(groups) >= len(partials):
+            break
+        # 중간 병합은 구간 요약과 같은 모델로 병렬 실행
+        level += 1
+        print(f"[lang_summary] 부분 요약 {len(partials)}개 → {len(groups)}개로 중간 병합 (단계 {level})", flush=True)
+
+        async def merge(start: int, end: int) -> Optional[SummaryOutput]:
+            if end - start == 1:
+                return partials[start]
+            async with semaphore:
+                try:
+                    return await complete(
+                        reduce_prompt.replace(SECTION_PLACEHOLDER, "\n".join(lines[start:end])),
+                        stage="summary_map",
+                        schema=SummaryOutput,
+                        cache=True,
+                    )
+                except Exception as e:
+                    print(f"[lang_summary] 중간 병합 실패, 부분 요약 유지: {e}", flush=True)
+                    return None
+
+        merged = await asyncio.gather(*[merge(start, end) for start, end in groups])
+        # 실패한 그룹은 원래 부분 요약을 그대로 다음 단계로
+        partials = [
+            item
+            for (start, end), result in zip(groups, merged)
+            for item in ([result] if result is not None and result.sections else partials[start:end])
+        ]
+        if all(result is None for result in merged):
+            break
+
+    lines = [compact_json(partial.model_dump()["sections"]) for partial in partials]
+    prompt = fill_section(
+        reduce_prompt,
+        lambda max_tokens: truncate_to_tokens("\n".join(lines), max_tokens, model),
+        agent="summary",
+        model=model,
+    )
+    return await complete(prompt, stage="summary", schema=SummaryOutput, cache=True, on_delta=on_delta)
+
+
+async def lang_summary(subject, chunks, tag_result, attendees_list=None, agenda=None, meeting_date=None):
+    table = as_sentence_table(tag_result)
     # 점수 1~3인 문장만 추출
-    filtered_tag = [
-        s for s in tag_result if isinstance(s, dict) and s.get("score", 0) > 0
-    ]
+    relevant_mask = table.score_between(1, 3)
+    filtered_tag = table.records(relevant_mask)
     # 점수 0인 문장은 문맥 파악용
-    context_only = [
-        s for s in tag_result if isinstance(s, dict) and s.get("score", 0) == 0
-    ]
+    context_only = table.records(table.score_between(0, 0))
 
     # meeting_date를 기반으로 날짜 계산
     if meeting_date:
@@ -60,9 +220,11 @@ async def lang_summary(subject, chunks, tag_result, attendees_list=None, agenda=
     참석자 목록:
     {attendees_list_str}
 
-    아래는 회의에서 중요한 문장(점수 1~3)만 추린 리스트야:
-    {[s['sentence'] for s in filtered_tag]}
-
+    아래는 회의에서 중요한 문장(점수 1~3)만 추린 리스트야 (한 줄에 한 문장):
+    {SECTION_PLACEHOLDER}
+"""
+    # 정리 지침 (구간 요약에도 같은 지침 사용)
+    guidelines = f"""
     이 문장들을 참고해서, 회의 내용을 명사 위주의 항목별로 보기 좋게 정리해줘.
     각 항목은 회의 내용에 따라 너가 판단해서 자유롭게 정하되,
     - 제목은 간결하고 명확하게 작성하고
@@ -80,46 +242,36 @@ async def lang_summary(subject, chunks, tag_result, attendees_list=None, agenda=
     - 날짜가 여러 번 등장하면 모두 변환해서 표기하고,
     - 해석이 애매할 경우 반드시 회의 날짜를 기준으로 유추해.
 
-    **결과는 반드시 아래와 같은 JSON 형식으로만 반환해.**
-    항목 수나 항목 이름은 자유롭게 정해도 되지만, 전체는 무조건 JSON으로 출력해.
-
-    ```json
-    {{
-      "항목 제목 A": [
-        "핵심 키워드 또는 개요 설명",
-        "담당자, 일정, 우선순위 등 구체 정보",
-        "실행 계획 또는 협업 방식 등"
-      ],
-      "항목 제목 B": [
-        "... 관련 내용들"
-      ]
-    }}
+    **결과 형식:**
+    항목 수나 항목 이름은 자유롭게 정해도 되지만, 각 항목은 sections 배열의 원소 하나로 반환해.
+    - title: 항목 제목 (예: "항목 제목 A")
+    - items: 핵심 키워드 또는 개요 설명, 담당자/일정/우선순위 등 구체 정보, 실행 계획 또는 협업 방식 등
     """
+    prompt += guidelines
+
+    # 생성 중인 항목을 회의 이벤트로 먼저 전달 (저장은 파이프라인 끝에서 최종본으로)
+    budget = get_current_budget()
+    publisher = PartialResultPublisher(budget.meeting_id if budget else None, "summary")
+    on_delta = publisher.json_handler(_partial_sections) if publisher.enabled else None
+
+    model = route_model("summary")
+    summary = None
+    if _use_map_reduce(table, relevant_mask, prompt, model):
+        # 긴 회의: 구간별 병렬 요약 후 병합
+        summary = await _map_reduce_summary(table, relevant_mask, subject, guidelines, on_delta)
+    if summary is None:
+        # 토큰 예산 안에서 점수가 높은 문장부터 채움 (라우팅 1순위 모델 기준)
+        prompt = fill_section(
+            prompt,
+            lambda max_tokens: "\n".join(pack_sentences(table, max_tokens, model, mask=relevant_mask, agent="summary")),
+            agent="summary",
+            model=model,
+        )
+        summary = await complete(prompt, stage="summary", schema=SummaryOutput, cache=True, on_delta=on_delta)
+    summary_json = summary.to_dict() if summary else {}
+    await publisher.publish(summary_json, done=True)
 
-    response = await llm.ainvoke(prompt)
-    agent_output = response.content
-
-    # JSON 파싱 시도 (코드블록 제거)
-    try:
-        content = str(agent_output).strip()
-        if content.startswith("```json"):
-            content = content.removeprefix("```json").removesuffix("```").strip()
-        match = re.search(r'\{.*\}', content, re.DOTALL)
-        if match:
-            content = match.group()
-            result_json = json.loads(content)
-            # summary 키가 있으면 그 값만, 없으면 전체 딕셔너리 반환
-            if "summary" in result_json and isinstance(result_json["summary"], dict):
-                summary_json = result_json["summary"]
-            else:
-                summary_json = result_json
-        else:
-            summary_json = {}
-    except Exception as e:
-        print(f"[lang_summary] JSON 파싱 오류: {e}", flush=True)
-        summary_json = {}
-
-    print("[lang_summary] agent_output:", agent_output, flush=True)
+    print("[lang_summary] agent_output:", summary_json, flush=True)
     return {
         "tag_result": filtered_tag,
         "agent_output": summary_json
@@ -1,13 +1,14 @@
-import openai
-import os
 import json
 import re
 import datetime
 import calendar
 from typing import List, Dict, Any
 from app.services.lang_role import assign_roles
-
-openai_client = openai.AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+from app.schemas.agent_output import TodoOutput
+from app.services.llm_gateway import complete
+from app.services.model_routing import route_model
+from app.services.sentence_table import as_sentence_table
+from app.services.prompt_budget import SECTION_PLACEHOLDER, fill_section, pack_sentences
 
 def parse_relative_schedule(schedule_str: str, meeting_date: str) -> str:
     """
@@ -76,17 +77,15 @@ async def extract_todos(subject: str, chunks: List[str], attendees_list: List[Di
         subject (str): 회의 주제
         chunks (List[str]): 회의 내용 청크 리스트
         attendees_list (List[Dict[str, Any]]): 참석자 리스트 (이름/직무/이메일 포함)
-        sentence_scores (List[Dict[str, Any]]): 문장별 점수와 평가 정보
+        sentence_scores (List[Dict[str, Any]] | SentenceTable): 문장별 점수와 평가 정보
         agenda (str, optional): 회의 안건
         meeting_date (str, optional): 회의 일시
         
     Returns:
         Dict[str, Any]: 추출된 할 일 목록과 역할분배 결과 등
     """
-    relevant_sentences = [
-        score["sentence"] for score in sentence_scores 
-        if score["score"] is not None and score["score"] >= 2
-    ]
+    table = as_sentence_table(sentence_scores)
+    relevant_mask = table.score_between(2, 3)
 
     prompt = f'''
 너는 회의 대화록에서 "정말 해야 하는 업무 (Action)"만 정확하게 추출하는 역할을 한다.
@@ -160,20 +159,28 @@ async def extract_todos(subject: str, chunks: List[str], attendees_list: List[Di
 지금부터 아래 대화록을 분석하여 위 기준으로 Action만 추출해줘:
 
 <<< 회의 대화록 텍스트 >>>
-{chr(10).join(relevant_sentences)}
+{SECTION_PLACEHOLDER}
 '''
+    # 토큰 예산 안에서 점수가 높은 문장부터 채움 (발화 순서 유지)
+    model = route_model("todo")
+    prompt = fill_section(
+        prompt,
+        lambda max_tokens: "\n".join(pack_sentences(table, max_tokens, model, mask=relevant_mask, agent="todo")),
+        agent="todo",
+        model=model,
+        output_tokens=1200,
+    )
 
     try:
-        response = await openai_client.chat.completions.create(
-            model="gpt-4-turbo",
-            messages=[{"role": "user", "content": prompt}],
+        result = await complete(
+            prompt,
+            stage="todo",
+            schema=TodoOutput,
             temperature=0.2,
             max_tokens=1200,
         )
-        
-        content = response.choices[0].message.content.strip()
-        if not content:
-            # 빈 응답일 때
+        if result is None:
+            # 구조화 출력 검증/복구 모두 실패
             output = {
                 "todos": [],
                 "summary": "이번 회의에서는 구체적인 실행 업무가 아직 논의되지 않았습니다.",
@@ -181,30 +188,13 @@ async def extract_todos(subject: str, chunks: List[str], attendees_list: List[Di
             }
             print("[lang_todo] extract_todos 결과:", flush=True)
             print(json.dumps(output, ensure_ascii=False, indent=2), flush=True)
-            if not output["todos"]:
-                print("[lang_todo] [경고] 추출된 Action이 없습니다. (todos가 빈 리스트)", flush=True)
-            else:
-                print(f"[lang_todo] 추출된 Action 개수: {len(output['todos'])}", flush=True)
+            print("[lang_todo] [경고] 추출된 Action이 없습니다. (todos가 빈 리스트)", flush=True)
             return output
 
-        # 코드블록 제거 및 JSON만 추출
-        if content.startswith("```json"):
-            content = content.removeprefix("```json").removesuffix("```").strip()
-        match = re.search(r'\{.*\}', content, re.DOTALL)
-        if match:
-            content = match.group()
-            result = json.loads(content)
-        else:
-            # JSON이 없을 때
-            result = {
-                "todos": [],
-                "summary": "이번 회의에서는 구체적인 실행 업무가 아직 논의되지 않았습니다.",
-                "total_count": 0
-            }
         output = {
-            "todos": result.get("todos", []),
-            "summary": result.get("summary", "이번 회의에서는 구체적인 실행 업무가 아직 논의되지 않았습니다."),
-            "total_count": result.get("total_count", len(result.get("todos", [])))
+            "todos": [todo.model_dump() for todo in result.todos],
+            "summary": result.summary or "이번 회의에서는 구체적인 실행 업무가 아직 논의되지 않았습니다.",
+            "total_count": len(result.todos)
         }
         # schedule 변환 적용
         if meeting_date and output["todos"]:
@@ -0,0 +1,174 @@
+# 회의 단위 LLM 토큰 예산 관리 (llm_budget.py)
+import time
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from langchain_core.callbacks import AsyncCallbackHandler
+
+from app.core.config import settings
+from app.services.llm_telemetry import LlmCallRecord, add_call_usage, current_call, log_llm_call
+
+# 예산 사용률에 따른 단계별 품질 저하 순서 (단계 이름, 사용률 임계값)
+# 앞 단계일수록 먼저 적용된다: 저렴한 평가 모델 → 효율성 분석 생략 → 문서 검색 생략
+DEGRADATION_STEPS: List[Tuple[str, float]] = [
+    ("cheap_scoring_model", 0.5),
+    ("skip_efficiency_analysis", 0.75),
+    ("skip_docs_search", 0.9),
+]
+
+_STEP_THRESHOLDS = dict(DEGRADATION_STEPS)
+
+
+class MeetingTokenBudget:
+    """
+    회의 한 건의 분석 파이프라인 전체에서 사용하는 토큰 예산
+
+    limit이 None이면 사용량만 집계하고 품질 저하는 하지 않는다.
+    """
+
+    def __init__(self, limit: Optional[int] = None, meeting_id: Optional[str] = None, company_id: Optional[str] = None):
+        self.limit = limit if limit and limit > 0 else None
+        self.meeting_id = str(meeting_id) if meeting_id else None
+        self.company_id = str(company_id) if company_id else None
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.calls = 0
+        self.usage_by_stage: Dict[str, int] = {}
+        self.degradations: List[Dict[str, Any]] = []
+
+    @property
+    def used_tokens(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
+
+    @property
+    def remaining_tokens(self) -> Optional[int]:
+        if self.limit is None:
+            return None
+        return max(self.limit - self.used_tokens, 0)
+
+    def used_ratio(self, projected_tokens: int = 0) -> float:
+        if self.limit is None:
+            return 0.0
+        return (self.used_tokens + projected_tokens) / self.limit
+
+    def record(self, stage: str, prompt_tokens: int, completion_tokens: int) -> None:
+        self.prompt_tokens += prompt_tokens
+        self.completion_tokens += completion_tokens
+        self.calls += 1
+        self.usage_by_stage[stage] = self.usage_by_stage.get(stage, 0) + prompt_tokens + completion_tokens
+
+    def is_degraded(self, step: str) -> bool:
+        return any(d["step"] == step for d in self.degradations)
+
+    def should_degrade(self, step: str, projected_tokens: int = 0) -> bool:
+        """
+        해당 품질 저하 단계를 적용해야 하는지 판단하고, 처음 적용될 때 기록을 남긴다.
+
+        Args:
+            step: DEGRADATION_STEPS의 단계 이름
+            projected_tokens: 이번 단계에서 추가로 사용할 것으로 예상되는 토큰 수
+        """
+        if step not in _STEP_THRESHOLDS:
+            raise ValueError(f"알 수 없는 품질 저하 단계: {step}")
+        if self.is_degraded(step):
+            return True
+        if self.limit is None or self.used_ratio(projected_tokens) < _STEP_THRESHOLDS[step]:
+            return False
+        self.degradations.append({
+            "step": step,
+            "used_tokens": self.used_tokens,
+            "projected_tokens": projected_tokens,
+            "limit": self.limit,
+            "applied_at": datetime.now().isoformat(),
+        })
+        print(f"[llm_budget] meeting_id={self.meeting_id} 품질 저하 적용: {step} (사용 {self.used_tokens}/{self.limit} 토큰)", flush=True)
+        return True
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "limit": self.limit,
+            "used_tokens": self.used_tokens,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "calls": self.calls,
+            "usage_by_stage": dict(self.usage_by_stage),
+            "degradations": list(self.degradations),
+        }
+
+
+# 현재 분석 중인 회의의 예산 (백그라운드 작업 단위로 설정)
+current_budget: ContextVar[Optional[MeetingTokenBudget]] = ContextVar("current_budget", default=None)
+
+
+def start_meeting_budget(limit: Optional[int] = None, meeting_id: Optional[str] = None, company_id: Optional[str] = None) -> MeetingTokenBudget:
+    """회의 분석 시작 시 예산을 생성하고 현재 컨텍스트에 등록"""
+    if limit is None:
+        limit = settings.MEETING_TOKEN_BUDGET
+    budget = MeetingTokenBudget(limit=limit, meeting_id=meeting_id, company_id=company_id)
+    current_budget.set(budget)
+    return budget
+
+
+def get_current_budget() -> Optional[MeetingTokenBudget]:
+    return current_budget.get()
+
+
+def extract_token_usage(response: Any) -> Tuple[int, int]:
+    """
+    OpenAI SDK 응답 또는 LangChain 메시지에서 (prompt_tokens, completion_tokens)를 추출
+    """
+    usage = getattr(response, "usage", None)
+    if usage is not None and hasattr(usage, "prompt_tokens"):
+        return usage.prompt_tokens or 0, usage.completion_tokens or 0
+    usage_metadata = getattr(response, "usage_metadata", None)
+    if usage_metadata:
+        return usage_metadata.get("input_tokens", 0) or 0, usage_metadata.get("output_tokens", 0) or 0
+    token_usage = (getattr(response, "response_metadata", None) or {}).get("token_usage") or {}
+    return token_usage.get("prompt_tokens", 0) or 0, token_usage.get("completion_tokens", 0) or 0
+
+
+def record_usage(stage: str, response: Any) -> None:
+    """LLM 응답의 토큰 사용량을 현재 회의 예산과 진행 중인 호출 기록에 반영"""
+    budget = current_budget.get()
+    if response is None or (budget is None and current_call.get() is None):
+        return
+    prompt_tokens, completion_tokens = extract_token_usage(response)
+    add_call_usage(prompt_tokens, completion_tokens)
+    if budget is not None:
+        budget.record(stage, prompt_tokens, completion_tokens)
+
+
+class TokenBudgetCallback(AsyncCallbackHandler):
+    """
+    LangChain Agent 내부 LLM 호출의 토큰 사용량을 예산에 반영하고 호출 단위로 기록하는 콜백
+    """
+
+    def __init__(self, stage: str):
+        self.stage = stage
+        self._started: Dict[Any, Tuple[float, str]] = {}
+
+    async def on_chat_model_start(self, serialized, messages, *, run_id, **kwargs) -> None:
+        params = kwargs.get("invocation_params") or {}
+        model = params.get("model") or params.get("model_name") or "unknown"
+        self._started[run_id] = (time.perf_counter(), str(model))
+
+    async def on_llm_end(self, response, *, run_id=None, **kwargs) -> None:
+        started, model = self._started.pop(run_id, (None, "unknown"))
+        record = LlmCallRecord(stage=self.stage, provider="google" if "gemini" in model else "openai", model=model)
+        for generations in response.generations:
+            for generation in generations:
+                message = getattr(generation, "message", None)
+                if message is not None:
+                    record_usage(self.stage, message)
+                    prompt_tokens, completion_tokens = extract_token_usage(message)
+                    record.prompt_tokens += prompt_tokens
+                    record.completion_tokens += completion_tokens
+        if started is not None:
+            log_llm_call(record, (time.perf_counter() - started) * 1000)
+
+    async def on_llm_error(self, error, *, run_id=None, **kwargs) -> None:
+        started, model = self._started.pop(run_id, (None, "unknown"))
+        if started is not None:
+            record = LlmCallRecord(stage=self.stage, provider="google" if "gemini" in model else "openai", model=model, status="error")
+            log_llm_call(record, (time.perf_counter() - started) * 1000)
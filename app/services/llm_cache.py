@@ -0,0 +1,124 @@
+# LLM 응답 완전 일치 캐시 (프로세스 내 LRU + Postgres, TTL)
+import hashlib
+import json
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.core.config import settings
+from app.db.db_session import AsyncSessionLocal
+from app.models.llm_response_cache import LlmResponseCache
+
+# 이 횟수만큼 저장할 때마다 만료된 행을 정리
+PURGE_EVERY_PUTS = 500
+
+
+def make_llm_cache_key(provider: str, model: str, temperature: float, messages: Any, request: Optional[Dict[str, Any]] = None) -> str:
+    """
+    provider + 모델 + temperature + 프롬프트(메시지 전체)로 캐시 키 생성
+    request: 응답 형식에 영향을 주는 추가 인자 (구조화 출력 스키마 이름, max_tokens 등)
+    """
+    prompt_hash = hashlib.sha256(
+        json.dumps(messages, ensure_ascii=False, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+    raw = "\x1f".join([
+        provider,
+        model,
+        repr(float(temperature)),
+        json.dumps(request or {}, ensure_ascii=False, sort_keys=True, default=str),
+        prompt_hash,
+    ])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class LlmResponseCacheStore:
+    """
+    LRU에 없으면 DB에서 조회하고, 새 응답은 LRU와 DB에 함께 저장 (만료 시각 지난 항목은 무시)
+    캐시 오류는 LLM 호출을 막지 않도록 로그만 남긴다.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: int):
+        self.max_size = max_size
+        self.ttl = timedelta(seconds=ttl_seconds)
+        self._lru: "OrderedDict[str, Tuple[str, datetime]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._puts = 0
+
+    def _remember(self, key: str, response: str, expires_at: datetime) -> None:
+        self._lru[key] = (response, expires_at)
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.max_size:
+            self._lru.popitem(last=False)
+
+    async def get(self, key: str) -> Optional[str]:
+        now = datetime.now()
+        cached = self._lru.get(key)
+        if cached is not None:
+            response, expires_at = cached
+            if expires_at > now:
+                self._lru.move_to_end(key)
+                self.hits += 1
+                return response
+            del self._lru[key]
+        try:
+            async with AsyncSessionLocal() as db:
+                result = await db.execute(
+                    select(LlmResponseCache.response, LlmResponseCache.expires_at)
+                    .where(LlmResponseCache.cache_key == key, LlmResponseCache.expires_at > now)
+                )
+                row = result.first()
+        except Exception as e:
+            print(f"[llm_cache] 캐시 조회 오류: {e}", flush=True)
+            row = None
+        if row is None:
+            self.misses += 1
+            return None
+        self._remember(key, row.response, row.expires_at)
+        self.hits += 1
+        return row.response
+
+    async def put(self, key: str, response: str, provider: str, model: str, temperature: float, stage: Optional[str] = None) -> None:
+        now = datetime.now()
+        expires_at = now + self.ttl
+        self._remember(key, response, expires_at)
+        values = {
+            "cache_key": key,
+            "provider": provider,
+            "model": model,
+            "temperature": float(temperature),
+            "stage": stage,
+            "response": response,
+            "created_at": now,
+            "expires_at": expires_at,
+        }
+        try:
+            async with AsyncSessionLocal() as db:
+                stmt = pg_insert(LlmResponseCache).values(**values)
+                await db.execute(stmt.on_conflict_do_update(
+                    index_elements=["cache_key"],
+                    set_={"response": stmt.excluded.response, "created_at": now, "expires_at": expires_at},
+                ))
+                self._puts += 1
+                if self._puts % PURGE_EVERY_PUTS == 0:
+                    await db.execute(delete(LlmResponseCache).where(LlmResponseCache.expires_at <= now))
+                await db.commit()
+        except Exception as e:
+            print(f"[llm_cache] 캐시 저장 오류: {e}", flush=True)
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+            "lru_size": len(self._lru),
+            "lru_max_size": self.max_size,
+            "ttl_seconds": int(self.ttl.total_seconds()),
+        }
+
+
+llm_cache = LlmResponseCacheStore(max_size=settings.LLM_CACHE_LRU_SIZE, ttl_seconds=settings.LLM_CACHE_TTL_SECONDS)
@@ -0,0 +1,311 @@
+# LLM 공용 게이트웨이 (provider별 클라이언트/연결 풀 공유 + 단일 complete() API)
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Type, TypeVar, Union
+
+import httpx
+from openai import AsyncOpenAI
+from pydantic import BaseModel, ValidationError
+
+from app.core.config import settings
+from app.services.llm_budget import record_usage
+from app.services.llm_cache import llm_cache, make_llm_cache_key
+from app.services.llm_telemetry import count_http_attempt, llm_call_writer, track_llm_call
+from app.services.llm_resilience import resilient_call
+from app.services.model_routing import provider_for, resolve_models, should_fall_back
+from app.services.structured_output import langchain_structured, openai_structured, parse_structured, structured_request
+
+T = TypeVar("T", bound=BaseModel)
+
+# 스트리밍 호출 시 누적 응답(구조화 출력이면 JSON 조각)을 받는 콜백
+DeltaHandler = Callable[[str], Awaitable[None]]
+
+# 기본 Gemini 모델 (문서 추천/검색/챗봇 Agent)
+DEFAULT_GEMINI_MODEL = "gemini-2.5-flash"
+
+_http_client: Optional[httpx.AsyncClient] = None
+_openai_client: Optional[AsyncOpenAI] = None
+# (provider, model, temperature, max_tokens, max_retries) → LangChain 채팅 모델
+_chat_models: Dict[Tuple[str, str, float, Optional[int], int], Any] = {}
+_search_client = None
+
+
+@dataclass
+class Completion:
+    text: str
+    raw: Any  # 원본 응답 (OpenAI ChatCompletion 또는 LangChain AIMessage), logprobs 등 조회용
+    model: str
+    provider: str
+    cached: bool = False  # 응답 캐시 적중 (raw 없음)
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    OpenAI SDK / LangChain ChatOpenAI가 함께 쓰는 keep-alive HTTP 연결 풀
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=settings.LLM_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.LLM_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=settings.LLM_KEEPALIVE_EXPIRY_SECONDS,
+            ),
+            timeout=httpx.Timeout(settings.LLM_REQUEST_TIMEOUT_SECONDS, connect=10.0),
+            # 호출별 재시도 횟수 집계
+            event_hooks={"request": [count_http_attempt]},
+        )
+    return _http_client
+
+
+def get_openai_client() -> AsyncOpenAI:
+    """프로세스 공용 AsyncOpenAI (Chat, Whisper, 구조화 출력 복구 등)"""
+    global _openai_client
+    if _openai_client is None:
+        _openai_client = AsyncOpenAI(
+            api_key=settings.OPENAI_API_KEY,
+            base_url=settings.OPENAI_BASE_URL,
+            http_client=get_http_client(),
+            max_retries=settings.LLM_MAX_RETRIES,
+            timeout=settings.LLM_REQUEST_TIMEOUT_SECONDS,
+        )
+    return _openai_client
+
+
+def get_chat_model(model: str, temperature: float = 0, max_tokens: Optional[int] = None, max_retries: Optional[int] = None):
+    """
+    LangChain 채팅 모델을 설정별로 한 번만 만들어 재사용 (Agent/Tool 바인딩용)
+    OpenAI 모델은 공용 HTTP 연결 풀을, Gemini 모델은 인스턴스별 gRPC 채널을 공유한다.
+    """
+    provider = provider_for(model)
+    retries = settings.LLM_MAX_RETRIES if max_retries is None else max_retries
+    key = (provider, model, temperature, max_tokens, retries)
+    chat_model = _chat_models.get(key)
+    if chat_model is not None:
+        return chat_model
+    if provider == "google":
+        from langchain_google_genai import ChatGoogleGenerativeAI
+
+        endpoint = {}
+        if settings.GEMINI_API_ENDPOINT:
+            # 대역 서버는 REST(generateContent)만 지원
+            endpoint = {"client_options": {"api_endpoint": settings.GEMINI_API_ENDPOINT}, "transport": "rest"}
+        chat_model = ChatGoogleGenerativeAI(
+            model=model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            timeout=settings.LLM_REQUEST_TIMEOUT_SECONDS,
+            max_retries=retries,
+            google_api_key=settings.GOOGLE_API_KEY,
+            **endpoint,
+        )
+    else:
+        from langchain_openai import ChatOpenAI
+
+        chat_model = ChatOpenAI(
+            model=model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            timeout=settings.LLM_REQUEST_TIMEOUT_SECONDS,
+            max_retries=retries,
+            api_key=settings.OPENAI_API_KEY,
+            base_url=settings.OPENAI_BASE_URL,
+            http_async_client=get_http_client(),
+        )
+    _chat_models[key] = chat_model
+    return chat_model
+
+
+def get_search_client():
+    """
+    공용 SerpAPI 검색 래퍼 (SERPAPI_BASE_URL이 있으면 해당 주소로 요청)
+    """
+    global _search_client
+    if _search_client is None:
+        from langchain_community.utilities import SerpAPIWrapper
+
+        _search_client = SerpAPIWrapper()
+        if settings.SERPAPI_BASE_URL:
+            from serpapi import SerpApiClient
+
+            SerpApiClient.BACKEND = settings.SERPAPI_BASE_URL.rstrip("/")
+    return _search_client
+
+
+def _as_messages(prompt: Union[str, List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    if isinstance(prompt, str):
+        return [{"role": "user", "content": prompt}]
+    return prompt
+
+
+def _message_text(content: Any) -> str:
+    # Gemini 응답 content는 리스트일 수 있음
+    if isinstance(content, list):
+        return " ".join(item.get("text", "") if isinstance(item, dict) else str(item) for item in content)
+    return str(content or "")
+
+
+async def complete(
+    prompt: Union[str, List[Dict[str, Any]]],
+    model: Optional[str] = None,
+    *,
+    stage: str,
+    schema: Optional[Type[T]] = None,
+    temperature: float = 0,
+    max_tokens: Optional[int] = None,
+    cache: bool = False,
+    on_delta: Optional[DeltaHandler] = None,
+    **kwargs,
+) -> Union[Completion, T, None]:
+    """
+    모든 Agent가 사용하는 단일 LLM 호출 API
+
+    Args:
+        prompt: 프롬프트 문자열 또는 [{"role", "content"}] 메시지 리스트
+        model: 모델 이름 (gemini-* 는 Google, 그 외는 OpenAI)
+               생략하면 stage의 라우팅 순서대로 호출하고, 일시 오류/구조화 실패 시 다음 모델로 넘어간다.
+        stage: 토큰 예산 집계 및 모델 라우팅 단계 이름 ('summary', 'scoring' 등)
+        schema: 지정하면 구조화 출력으로 호출하고 검증된 Pydantic 모델(실패 시 None)을 반환
+        cache: 같은 요청의 응답을 재사용 (temperature 0 호출만 적용, 캐시 적중 시 raw 없음)
+        on_delta: 지정하면 OpenAI 모델은 스트리밍으로 호출하고 지금까지 받은 응답 전체를 조각마다 전달
+                  (Gemini 모델과 캐시 적중은 스트리밍하지 않으며, 결과는 반환값으로만 받는다)
+        kwargs: OpenAI 호출 추가 인자 (logprobs, top_logprobs 등)
+
+    Returns:
+        schema가 없으면 Completion, 있으면 schema 인스턴스 또는 None
+    """
+    messages = _as_messages(prompt)
+    chain = [model] if model else resolve_models(stage)
+    for position, candidate in enumerate(chain):
+        last = position == len(chain) - 1
+        try:
+            result = await _complete_cached(messages, candidate, stage, schema, temperature, max_tokens, cache, on_delta, **kwargs)
+        except Exception as e:
+            if last or not should_fall_back(e):
+                raise
+            print(f"[llm_gateway] {stage} {candidate} 호출 실패, {chain[position + 1]}로 재시도: {e}", flush=True)
+            continue
+        if result is None and not last:
+            print(f"[llm_gateway] {stage} {candidate} 구조화 출력 실패, {chain[position + 1]}로 재시도", flush=True)
+            continue
+        return result
+
+
+async def _complete_cached(
+    messages: List[Dict[str, Any]],
+    model: str,
+    stage: str,
+    schema: Optional[Type[T]],
+    temperature: float,
+    max_tokens: Optional[int],
+    cache: bool,
+    on_delta: Optional[DeltaHandler] = None,
+    **kwargs,
+) -> Union[Completion, T, None]:
+    provider = provider_for(model)
+    cache_key = None
+    if cache and settings.LLM_CACHE_ENABLED and temperature == 0:
+        cache_key = make_llm_cache_key(
+            provider, model, temperature, messages,
+            {"schema": schema.__name__ if schema else None, "max_tokens": max_tokens, **kwargs},
+        )
+        cached = await llm_cache.get(cache_key)
+        if cached is not None:
+            if schema is None:
+                return Completion(text=cached, raw=None, model=model, provider=provider, cached=True)
+            try:
+                return schema.model_validate_json(cached)
+            except ValidationError:
+                # 스키마가 바뀐 뒤 남은 캐시는 다시 호출
+                pass
+
+    async with track_llm_call(stage, provider, model):
+        # 제한 시간 / 헤지 요청 / provider 서킷 브레이커 적용
+        result = await resilient_call(
+            lambda: _complete(messages, model, provider, stage, schema, temperature, max_tokens, on_delta, **kwargs),
+            provider, model, stage,
+        )
+
+    if cache_key is not None and result is not None:
+        response = result.model_dump_json() if schema is not None else result.text
+        if response:
+            await llm_cache.put(cache_key, response, provider, model, temperature, stage)
+    return result
+
+
+async def _complete(
+    messages: List[Dict[str, Any]],
+    model: str,
+    provider: str,
+    stage: str,
+    schema: Optional[Type[T]],
+    temperature: float,
+    max_tokens: Optional[int],
+    on_delta: Optional[DeltaHandler] = None,
+    **kwargs,
+) -> Union[Completion, T, None]:
+    if provider == "google":
+        chat_model = get_chat_model(model, temperature, max_tokens)
+        if schema is not None:
+            return await langchain_structured(chat_model, schema, messages, stage, get_openai_client())
+        response = await chat_model.ainvoke(messages, **kwargs)
+        record_usage(stage, response)
+        return Completion(text=_message_text(response.content).strip(), raw=response, model=model, provider=provider)
+
+    if max_tokens is not None:
+        kwargs["max_tokens"] = max_tokens
+    client = get_openai_client()
+    if on_delta is not None:
+        return await _stream_openai(messages, model, stage, schema, on_delta, temperature=temperature, **kwargs)
+    if schema is not None:
+        return await openai_structured(schema, messages, model, stage, client, temperature=temperature, **kwargs)
+    response = await client.chat.completions.create(model=model, messages=messages, temperature=temperature, **kwargs)
+    record_usage(stage, response)
+    return Completion(text=(response.choices[0].message.content or "").strip(), raw=response, model=model, provider=provider)
+
+
+async def _stream_openai(
+    messages: List[Dict[str, Any]],
+    model: str,
+    stage: str,
+    schema: Optional[Type[T]],
+    on_delta: DeltaHandler,
+    **kwargs,
+) -> Union[Completion, T, None]:
+    """
+    OpenAI 스트리밍 호출: 본문(또는 강제 tool 인자) 조각을 누적해 on_delta로 전달하고
+    마지막 사용량 청크로 토큰을 집계한 뒤 비스트리밍 호출과 같은 결과를 반환
+    """
+    client = get_openai_client()
+    request = structured_request(schema, model) if schema is not None else {}
+    stream = await client.chat.completions.create(
+        model=model, messages=messages, stream=True, stream_options={"include_usage": True}, **request, **kwargs
+    )
+    parts: List[str] = []
+    async for chunk in stream:
+        if chunk.usage is not None:
+            record_usage(stage, chunk)
+        if not chunk.choices:
+            continue
+        delta = chunk.choices[0].delta
+        piece = delta.content or "".join(
+            call.function.arguments or "" for call in (delta.tool_calls or []) if call.function is not None
+        )
+        if piece:
+            parts.append(piece)
+            await on_delta("".join(parts))
+
+    raw = "".join(parts)
+    if schema is not None:
+        return await parse_structured(schema, raw, model, stage, client)
+    return Completion(text=raw.strip(), raw=None, model=model, provider="openai")
+
+
+async def aclose_llm_clients() -> None:
+    """앱 종료 시 남은 호출 기록 저장 및 공용 연결 풀 정리"""
+    global _http_client, _openai_client
+    await llm_call_writer.aclose()
+    if _http_client is not None and not _http_client.is_closed:
+        await _http_client.aclose()
+    _http_client = None
+    _openai_client = None
+    _chat_models.clear()
@@ -0,0 +1,231 @@
+# LLM 호출 복원력 계층 (호출별 제한 시간, p95 기반 헤지 요청, provider별 서킷 브레이커)
+import asyncio
+import json
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Tuple
+
+import openai
+
+from app.core.config import settings
+
+# 단계별 호출 제한 시간(초), 없으면 LLM_CALL_DEADLINE_SECONDS
+DEFAULT_STAGE_DEADLINES: Dict[str, float] = {
+    "scoring": 30,
+    "scoring_reason": 30,
+    "split": 45,
+    "preview": 60,
+    "docs_agent": 180,
+}
+
+
+def _load_deadlines() -> Dict[str, float]:
+    deadlines = dict(DEFAULT_STAGE_DEADLINES)
+    if settings.LLM_STAGE_DEADLINES:
+        try:
+            deadlines.update({k: float(v) for k, v in json.loads(settings.LLM_STAGE_DEADLINES).items()})
+        except (ValueError, AttributeError):
+            print(f"[llm_resilience] LLM_STAGE_DEADLINES 설정을 읽을 수 없어 무시합니다: {settings.LLM_STAGE_DEADLINES}", flush=True)
+    return deadlines
+
+
+STAGE_DEADLINES = _load_deadlines()
+HEDGE_STAGES = {stage.strip() for stage in settings.LLM_HEDGE_STAGES.split(",") if stage.strip()}
+
+
+def stage_deadline(stage: str) -> float:
+    return STAGE_DEADLINES.get(stage, settings.LLM_CALL_DEADLINE_SECONDS)
+
+
+class CircuitOpenError(Exception):
+    """
+    provider 서킷이 열려 호출하지 않고 바로 실패 (게이트웨이는 다음 모델로, 문장 평가는 백오프 후 재시도)
+    """
+    status_code = 503
+    throttled = True
+
+    def __init__(self, provider: str, retry_in: float):
+        super().__init__(f"{provider} 서킷 열림 ({retry_in:.0f}초 후 재시도)")
+        self.provider = provider
+        self.retry_in = retry_in
+
+
+def is_provider_failure(error: Exception) -> bool:
+    """
+    provider 장애로 볼 오류: 연결 실패/HTTP 타임아웃, 5xx
+    (429는 동시성 제어가, 4xx는 요청 문제라 서킷에 반영하지 않음)
+    단계별 제한 시간 초과(TimeoutError)는 느린 모델/긴 요청 탓일 수 있어 provider 전체 서킷에 반영하지 않는다.
+    (한 단계의 느린 gpt-4 호출 때문에 같은 provider의 다른 단계까지 차단되지 않도록)
+    """
+    if isinstance(error, (CircuitOpenError, TimeoutError)):
+        return False
+    if isinstance(error, openai.APIConnectionError):
+        return True
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(error, "code", None)
+    return isinstance(status, int) and status >= 500
+
+
+class CircuitBreaker:
+    """
+    연속 실패가 failure_threshold회면 cooldown 동안 호출 차단(open),
+    이후 한 건만 시험 호출(half-open)해 성공하면 다시 허용(closed)
+    """
+
+    def __init__(self, name: str, failure_threshold: int, cooldown_seconds: float):
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.cooldown = cooldown_seconds
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+        self.times_opened = 0
+        self._probing = False
+
+    def check(self) -> None:
+        """호출 가능 여부 확인, 차단 중이면 CircuitOpenError"""
+        if self.state == "closed":
+            return
+        elapsed = time.monotonic() - self.opened_at
+        if self.state == "open" and elapsed >= self.cooldown:
+            self.state = "half_open"
+        if self.state == "half_open" and not self._probing:
+            self._probing = True
+            return
+        raise CircuitOpenError(self.name, max(0.0, self.cooldown - elapsed))
+
+    def record_success(self) -> None:
+        if self.state != "closed":
+            print(f"[llm_resilience] {self.name} 서킷 닫힘 (시험 호출 성공)", flush=True)
+        self.state = "closed"
+        self.failures = 0
+        self._probing = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self._probing = False
+        if self.state == "half_open" or (self.state == "closed" and self.failures >= self.failure_threshold):
+            self.state = "open"
+            self.opened_at = time.monotonic()
+            self.times_opened += 1
+            print(f"[llm_resilience] {self.name} 서킷 열림 (연속 실패 {self.failures}회, {self.cooldown:g}초 차단)", flush=True)
+
+    def record_neutral(self) -> None:
+        # 장애와 무관한 실패(4xx 등): 시험 호출만 해제
+        self._probing = False
+
+    def stats(self) -> Dict[str, Any]:
+        return {"state": self.state, "consecutive_failures": self.failures, "times_opened": self.times_opened}
+
+
+class LatencyTracker:
+    """(provider, model, stage)별 최근 응답 시간으로 헤지 지연(p95) 계산"""
+
+    def __init__(self, window: int = 200):
+        self.samples: Deque[float] = deque(maxlen=window)
+
+    def add(self, seconds: float) -> None:
+        self.samples.append(seconds)
+
+    def quantile(self, q: float) -> Optional[float]:
+        if len(self.samples) < settings.LLM_HEDGE_MIN_SAMPLES:
+            return None
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_latencies: Dict[Tuple[str, str, str], LatencyTracker] = {}
+hedge_stats = {"hedged": 0, "hedge_wins": 0, "deadline_exceeded": 0}
+
+
+def get_breaker(provider: str) -> CircuitBreaker:
+    breaker = _breakers.get(provider)
+    if breaker is None:
+        breaker = _breakers[provider] = CircuitBreaker(
+            provider,
+            failure_threshold=settings.LLM_CIRCUIT_FAILURE_THRESHOLD,
+            cooldown_seconds=settings.LLM_CIRCUIT_COOLDOWN_SECONDS,
+        )
+    return breaker
+
+
+async def _first_success(make_call: Callable[[], Awaitable[Any]], hedge_delay: Optional[float], label: str) -> Any:
+    """
+    첫 요청이 hedge_delay 안에 끝나지 않으면 같은 요청을 하나 더 보내고 먼저 성공한 결과 사용
+    """
+    first = asyncio.ensure_future(make_call())
+    tasks = [first]
+    try:
+        if hedge_delay is None:
+            return await first
+        done, _ = await asyncio.wait({first}, timeout=hedge_delay)
+        if done:
+            return first.result()
+        hedge_stats["hedged"] += 1
+        second = asyncio.ensure_future(make_call())
+        tasks.append(second)
+        pending = {first, second}
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    if task is second:
+                        hedge_stats["hedge_wins"] += 1
+                        print(f"[llm_resilience] {label} 헤지 요청이 먼저 응답 ({hedge_delay:.1f}초 후 발송)", flush=True)
+                    return task.result()
+                error = task.exception()
+        raise error
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+
+
+async def resilient_call(make_call: Callable[[], Awaitable[Any]], provider: str, model: str, stage: str) -> Any:
+    """
+    provider 서킷 확인 → 제한 시간 안에서 (필요 시 헤지하며) 호출 → 결과를 서킷/지연 통계에 반영
+    make_call은 호출할 때마다 새 요청을 만드는 함수여야 한다. (헤지 시 두 번 호출됨)
+    """
+    breaker = get_breaker(provider)
+    breaker.check()
+    tracker = _latencies.setdefault((provider, model, stage), LatencyTracker())
+    hedge_delay = None
+    if settings.LLM_HEDGE_ENABLED and stage in HEDGE_STAGES:
+        hedge_delay = tracker.quantile(settings.LLM_HEDGE_QUANTILE)
+    deadline = stage_deadline(stage)
+    label = f"{stage} {model}"
+
+    started = time.monotonic()
+    try:
+        result = await asyncio.wait_for(_first_success(make_call, hedge_delay, label), timeout=deadline)
+    except asyncio.CancelledError:
+        breaker.record_neutral()
+        raise
+    except Exception as e:
+        if isinstance(e, TimeoutError):
+            hedge_stats["deadline_exceeded"] += 1
+            print(f"[llm_resilience] {label} 제한 시간 {deadline:g}초 초과", flush=True)
+        if is_provider_failure(e):
+            breaker.record_failure()
+        else:
+            breaker.record_neutral()
+        raise
+    tracker.add(time.monotonic() - started)
+    breaker.record_success()
+    return result
+
+
+def resilience_stats() -> Dict[str, Any]:
+    return {
+        "circuits": {name: breaker.stats() for name, breaker in _breakers.items()},
+        "hedging": dict(hedge_stats),
+        "hedge_delays": {
+            f"{provider}/{model}/{stage}": round(delay, 2)
+            for (provider, model, stage), tracker in _latencies.items()
+            if (delay := tracker.quantile(settings.LLM_HEDGE_QUANTILE)) is not None
+        },
+        "deadlines": {**STAGE_DEADLINES, "default": settings.LLM_CALL_DEADLINE_SECONDS},
+    }
@@ -0,0 +1,199 @@
+# LLM / 음성 전사 호출 단위 계측 (토큰, 지연, 재시도, 예상 비용) + 비동기 일괄 저장
+import asyncio
+import time
+import uuid
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import insert
+
+from app.core.config import settings
+from app.db.db_session import AsyncSessionLocal
+from app.models.llm_call_log import LlmCallLog
+from app.services.adaptive_concurrency import is_rate_limit_error
+
+# 모델별 100만 토큰당 가격(USD, 입력/출력), 접두어가 긴 항목부터 매칭
+MODEL_PRICES: Dict[str, Tuple[float, float]] = {
+    "gpt-4o-mini": (0.15, 0.60),
+    "gpt-4o": (2.50, 10.00),
+    "gpt-4.1-mini": (0.40, 1.60),
+    "gpt-4.1": (2.00, 8.00),
+    "gpt-4-turbo": (10.00, 30.00),
+    "gpt-4": (30.00, 60.00),
+    "gpt-3.5-turbo": (0.50, 1.50),
+    "gemini-2.5-flash": (0.30, 2.50),
+}
+# 음성 전사 분당 가격(USD)
+AUDIO_PRICES_PER_MINUTE: Dict[str, float] = {
+    "whisper-1": 0.006,
+}
+_PRICE_PREFIXES = sorted(MODEL_PRICES, key=len, reverse=True)
+
+
+def estimate_cost(model: str, prompt_tokens: int, completion_tokens: int, audio_seconds: Optional[float] = None) -> float:
+    """가격표에 없는 모델은 0 (집계 시 모델별로 확인)"""
+    if model in AUDIO_PRICES_PER_MINUTE:
+        return round(AUDIO_PRICES_PER_MINUTE[model] * (audio_seconds or 0) / 60, 6)
+    name = model.split("/")[-1]
+    for prefix in _PRICE_PREFIXES:
+        if name.startswith(prefix):
+            input_price, output_price = MODEL_PRICES[prefix]
+            return round((prompt_tokens * input_price + completion_tokens * output_price) / 1_000_000, 6)
+    return 0.0
+
+
+@dataclass
+class LlmCallRecord:
+    stage: str
+    provider: str
+    model: str
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    audio_seconds: Optional[float] = None
+    attempts: int = 0  # 공용 HTTP 클라이언트가 보낸 요청 수
+    status: str = "ok"
+
+    @property
+    def retries(self) -> int:
+        return max(0, self.attempts - 1)
+
+
+# 현재 진행 중인 호출 (record_usage / HTTP 요청 훅이 여기에 누적)
+current_call: ContextVar[Optional[LlmCallRecord]] = ContextVar("current_llm_call", default=None)
+
+
+def add_call_usage(prompt_tokens: int, completion_tokens: int) -> None:
+    record = current_call.get()
+    if record is not None:
+        record.prompt_tokens += prompt_tokens
+        record.completion_tokens += completion_tokens
+
+
+async def count_http_attempt(request) -> None:
+    """httpx 요청 훅: 호출 한 번에 실제로 나간 HTTP 요청 수 (재시도 집계용)"""
+    record = current_call.get()
+    if record is not None:
+        record.attempts += 1
+
+
+class LlmCallLogWriter:
+    """
+    호출 기록을 메모리 큐에 쌓아 두고 백그라운드 작업이 묶음 INSERT로 저장
+    호출 경로에서는 큐에 넣기만 하며, 큐가 가득 차면 기록을 버린다. (LLM 호출을 막지 않음)
+    """
+
+    def __init__(self, batch_size: int, flush_seconds: float, max_queue: int):
+        self.batch_size = batch_size
+        self.flush_seconds = flush_seconds
+        self.max_queue = max_queue
+        self.dropped = 0
+        self.written = 0
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def _ensure_started(self) -> None:
+        if self._task is None or self._task.done():
+            self._queue = asyncio.Queue(maxsize=self.max_queue)
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def submit(self, row: Dict[str, Any]) -> None:
+        if not settings.LLM_CALL_LOG_ENABLED:
+            return
+        try:
+            self._ensure_started()
+            self._queue.put_nowait(row)
+        except (asyncio.QueueFull, RuntimeError):
+            self.dropped += 1
+
+    async def _run(self) -> None:
+        queue = self._queue
+        while True:
+            rows = [await queue.get()]
+            deadline = time.monotonic() + self.flush_seconds
+            while len(rows) < self.batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    rows.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            await self._write(rows)
+
+    async def _write(self, rows: List[Dict[str, Any]]) -> None:
+        try:
+            async with AsyncSessionLocal() as db:
+                await db.execute(insert(LlmCallLog), rows)
+                await db.commit()
+            self.written += len(rows)
+        except Exception as e:
+            self.dropped += len(rows)
+            print(f"[llm_telemetry] 호출 기록 {len(rows)}건 저장 실패: {e}", flush=True)
+
+    async def aclose(self) -> None:
+        """남은 기록을 저장하고 백그라운드 작업 종료 (앱 종료 시)"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        rows = []
+        while not self._queue.empty():
+            rows.append(self._queue.get_nowait())
+        for start in range(0, len(rows), self.batch_size):
+            await self._write(rows[start:start + self.batch_size])
+        self._task = None
+
+
+llm_call_writer = LlmCallLogWriter(
+    batch_size=settings.LLM_CALL_LOG_BATCH_SIZE,
+    flush_seconds=settings.LLM_CALL_LOG_FLUSH_SECONDS,
+    max_queue=settings.LLM_CALL_LOG_QUEUE_SIZE,
+)
+
+
+def log_llm_call(record: LlmCallRecord, latency_ms: float) -> None:
+    """호출 한 건을 현재 회의(예산 컨텍스트)와 함께 기록 큐에 넣는다."""
+    from app.services.llm_budget import get_current_budget
+
+    budget = get_current_budget()
+    llm_call_writer.submit({
+        "call_id": uuid.uuid4(),
+        "meeting_id": budget.meeting_id if budget else None,
+        "company_id": budget.company_id if budget else None,
+        "stage": record.stage,
+        "provider": record.provider,
+        "model": record.model,
+        "prompt_tokens": record.prompt_tokens,
+        "completion_tokens": record.completion_tokens,
+        "audio_seconds": record.audio_seconds,
+        "latency_ms": round(latency_ms, 1),
+        "retries": record.retries,
+        "status": record.status,
+        "cost_usd": estimate_cost(record.model, record.prompt_tokens, record.completion_tokens, record.audio_seconds),
+        "created_at": datetime.now(timezone.utc),
+    })
+
+
+@asynccontextmanager
+async def track_llm_call(stage: str, provider: str, model: str, audio_seconds: Optional[float] = None):
+    """
+    with 블록 안의 LLM 호출 한 건(구조화 출력 복구 포함)을 계측해 기록
+    토큰은 record_usage, 재시도는 공용 HTTP 클라이언트 요청 훅이 누적한다.
+    """
+    record = LlmCallRecord(stage=stage, provider=provider, model=model, audio_seconds=audio_seconds)
+    token = current_call.set(record)
+    started = time.perf_counter()
+    try:
+        yield record
+    except Exception as e:
+        record.status = "rate_limited" if is_rate_limit_error(e) else "error"
+        raise
+    finally:
+        current_call.reset(token)
+        log_llm_call(record, (time.perf_counter() - started) * 1000)
@@ -0,0 +1,209 @@
+# 회의 분석 진행 이벤트 발행/구독 (Postgres LISTEN/NOTIFY 기반)
+import asyncio
+import json
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Set
+
+import asyncpg
+import jiter
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.db.db_session import engine
+
+# 모든 API 레플리카가 LISTEN 하는 채널
+MEETING_EVENT_CHANNEL = "meeting_analysis"
+
+# Postgres NOTIFY payload 최대 크기는 8000 bytes
+MAX_PAYLOAD_BYTES = 7800
+
+# 분석 파이프라인 단계 (발행 순서)
+ANALYSIS_STAGES = ["stt", "scoring", "summary", "todo", "feedback", "docs", "completed"]
+
+# 이 시간 동안 새 이벤트가 없는 분석은 진행 중으로 보지 않음 (종료 이벤트를 놓친 경우 대비)
+RUNNING_ANALYSIS_TTL_SECONDS = 2 * 60 * 60
+
+
+def _listen_dsn() -> str:
+    # asyncpg는 SQLAlchemy 드라이버 접두사 없는 DSN을 사용
+    return settings.CONNECTION_STRING.replace("postgresql+asyncpg://", "postgresql://")
+
+
+async def publish_meeting_event(meeting_id: Any, stage: str, status: str = "completed", data: Optional[Dict[str, Any]] = None) -> None:
+    """
+    회의 분석 단계 이벤트를 NOTIFY로 발행
+    파이프라인 트랜잭션과 분리된 별도 커넥션으로 즉시 커밋되며, 실패해도 분석을 중단하지 않는다.
+
+    Args:
+        meeting_id: 회의 ID
+        stage: 단계 이름 (ANALYSIS_STAGES 참고)
+        status: 'started' | 'completed' | 'failed' | 'partial' (생성 중 중간 결과, PartialResultPublisher 참고)
+        data: 클라이언트에 함께 전달할 작은 부가 정보
+    """
+    event = {
+        "meeting_id": str(meeting_id),
+        "stage": stage,
+        "status": status,
+        "data": data or {},
+        "at": datetime.now().isoformat(),
+    }
+    payload = json.dumps(event, ensure_ascii=False, default=str)
+    if len(payload.encode("utf-8")) > MAX_PAYLOAD_BYTES:
+        # 큰 데이터는 전달하지 않고 단계 완료 사실만 알림 (클라이언트가 결과 API로 조회)
+        event["data"] = {"truncated": True}
+        payload = json.dumps(event, ensure_ascii=False, default=str)
+    try:
+        async with engine.begin() as conn:
+            await conn.execute(
+                text("SELECT pg_notify(:channel, :payload)"),
+                {"channel": MEETING_EVENT_CHANNEL, "payload": payload}
+            )
+    except Exception as e:
+        print(f"[meeting_events] 이벤트 발행 오류: meeting_id={meeting_id}, stage={stage}, 오류={e}", flush=True)
+
+
+def _payload_size(data: Dict[str, Any]) -> int:
+    return len(json.dumps(data, ensure_ascii=False, default=str).encode("utf-8"))
+
+
+class PartialResultPublisher:
+    """
+    생성 중인 단계 결과(요약, 피드백)를 status='partial' 이벤트로 발행
+    data = {"changes": {필드: 값}, "done": bool} - 직전 발행 이후 바뀐 필드만 보내므로
+    클라이언트는 changes를 화면의 결과에 덮어쓰면 되고, 최종본은 단계 완료 이벤트 후 결과 API로 조회한다.
+    스트리밍 조각마다 호출돼도 interval 간격으로만 발행하며, 회의 ID가 없으면 아무것도 하지 않는다.
+    """
+
+    def __init__(self, meeting_id: Any, stage: str, interval: Optional[float] = None):
+        self.meeting_id = meeting_id
+        self.stage = stage
+        self.enabled = meeting_id is not None and settings.STREAM_PARTIAL_RESULTS
+        self.interval = settings.STREAM_PUBLISH_INTERVAL_SECONDS if interval is None else interval
+        self.events = 0
+        self._sent: Dict[str, Any] = {}
+        self._last = 0.0
+
+    def due(self) -> bool:
+        return self.enabled and time.monotonic() - self._last >= self.interval
+
+    def _batches(self, changes: Dict[str, Any]) -> List[Dict[str, Any]]:
+        # NOTIFY 크기 제한 안에서 필드를 나눠 담음 (한 필드가 너무 크면 publish_meeting_event가 생략 처리)
+        limit = MAX_PAYLOAD_BYTES - 400
+        batches: List[Dict[str, Any]] = [{}]
+        for key, value in changes.items():
+            if batches[-1] and _payload_size({**batches[-1], key: value}) > limit:
+                batches.append({})
+            batches[-1][key] = value
+        return batches
+
+    async def publish(self, fields: Dict[str, Any], done: bool = False) -> None:
+        """fields 중 바뀐 필드 발행 (done이면 마지막 이벤트에 완료 표시)"""
+        if not self.enabled:
+            return
+        changes = {key: value for key, value in fields.items() if key not in self._sent or self._sent[key] != value}
+        if not changes and not done:
+            return
+        self._last = time.monotonic()
+        batches = self._batches(changes)
+        for position, batch in enumerate(batches):
+            last = position == len(batches) - 1
+            await publish_meeting_event(self.meeting_id, self.stage, "partial", {"changes": batch, "done": done and last})
+            self.events += 1
+        self._sent.update(changes)
+
+    def json_handler(self, transform: Callable[[Dict[str, Any]], Dict[str, Any]]):
+        """
+        구조화 출력 스트리밍(llm_gateway.complete on_delta)용 콜백
+        지금까지 받은 JSON 조각을 부분 파싱(완성된 문자열만)해 transform 결과를 발행
+        """
+        async def on_delta(raw: str) -> None:
+            if not self.due():
+                return
+            try:
+                value = jiter.from_json(raw.encode("utf-8"), partial_mode=True)
+            except ValueError:
+                return
+            if isinstance(value, dict):
+                await self.publish(transform(value))
+        return on_delta
+
+
+class MeetingEventHub:
+    """
+    프로세스당 하나의 LISTEN 커넥션을 유지하고, 회의별 구독자 큐로 이벤트를 분배
+    """
+
+    def __init__(self, queue_size: int = 100):
+        self._conn: Optional[asyncpg.Connection] = None
+        self._lock = asyncio.Lock()
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = {}
+        self._queue_size = queue_size
+        # 진행 중인 분석 {meeting_id: 마지막 이벤트 시각(monotonic)}, 모든 레플리카의 NOTIFY로 갱신
+        self._running: Dict[str, float] = {}
+
+    async def ensure_listener(self) -> None:
+        async with self._lock:
+            if self._conn is not None and not self._conn.is_closed():
+                return
+            self._conn = await asyncpg.connect(_listen_dsn())
+            self._conn.add_termination_listener(self._on_terminate)
+            await self._conn.add_listener(MEETING_EVENT_CHANNEL, self._on_notify)
+            print(f"[meeting_events] LISTEN {MEETING_EVENT_CHANNEL} 시작", flush=True)
+
+    def _on_terminate(self, connection) -> None:
+        print("[meeting_events] LISTEN 커넥션 종료됨, 다음 구독 시 재연결", flush=True)
+        self._conn = None
+
+    def _on_notify(self, connection, pid, channel, payload) -> None:
+        try:
+            event = json.loads(payload)
+        except json.JSONDecodeError:
+            return
+        key = event.get("meeting_id")
+        if event.get("stage") == "completed" or event.get("status") == "failed":
+            self._running.pop(key, None)
+        else:
+            self._running[key] = time.monotonic()
+        for queue in list(self._subscribers.get(key, ())):
+            if queue.full():
+                # 느린 클라이언트는 가장 오래된 이벤트를 버림
+                queue.get_nowait()
+            queue.put_nowait(event)
+
+    def is_running(self, meeting_id: Any) -> bool:
+        """
+        이 프로세스가 LISTEN 중에 분석 시작/단계 이벤트를 받았고 아직 completed/failed를 받지 못한 회의인지
+        (앱 시작 시 ensure_listener로 LISTEN을 시작해야 다른 레플리카에서 시작된 분석도 알 수 있음)
+        """
+        key = str(meeting_id)
+        last_event = self._running.get(key)
+        if last_event is None:
+            return False
+        if time.monotonic() - last_event > RUNNING_ANALYSIS_TTL_SECONDS:
+            del self._running[key]
+            return False
+        return True
+
+    @asynccontextmanager
+    async def subscribe(self, meeting_id: Any):
+        await self.ensure_listener()
+        key = str(meeting_id)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self._queue_size)
+        self._subscribers.setdefault(key, set()).add(queue)
+        try:
+            yield queue
+        finally:
+            subscribers = self._subscribers.get(key)
+            if subscribers is not None:
+                subscribers.discard(queue)
+                if not subscribers:
+                    del self._subscribers[key]
+
+
+meeting_event_hub = MeetingEventHub()
+
+
+def format_sse(event: Dict[str, Any], event_name: str = "stage") -> str:
+    return f"event: {event_name}\ndata: {json.dumps(event, ensure_ascii=False, default=str)}\n\n"
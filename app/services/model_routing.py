@@ -0,0 +1,175 @@
+# 파이프라인 단계(stage)별 모델 라우팅 (모델 등급 + 대체 모델 순서, 회사별 재정의)
+import json
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional
+
+import openai
+
+from app.core.config import settings
+from app.services.adaptive_concurrency import is_rate_limit_error
+
+# 모델 등급 → 호출 순서 (앞 모델이 일시 오류/구조화 실패면 다음 모델로 재시도)
+DEFAULT_MODEL_TIERS: Dict[str, List[str]] = {
+    "flagship": ["gpt-4", "gpt-4o"],
+    "standard": ["gpt-4-turbo", "gpt-4o"],
+    "analysis": ["gpt-4o", "gpt-4-turbo"],
+    "fast": [settings.SCORING_FALLBACK_MODEL, "gemini-2.5-flash"],
+    "long_context": ["gemini-2.5-flash", "gpt-4o"],
+}
+
+# 단계 → 모델 등급 (기본값은 기존 하드코딩 모델과 같음)
+DEFAULT_STAGE_TIERS: Dict[str, str] = {
+    "summary": "flagship",
+    "summary_map": "fast",
+    "role": "flagship",
+    "preview": "flagship",
+    "refine": "flagship",
+    "scoring": "standard",
+    "split": "standard",
+    "todo": "standard",
+    "feedback": "analysis",
+    "docs_describe": "analysis",
+    "docs": "long_context",
+    "docs_agent": "long_context",
+    "scoring_fallback": "fast",
+    "scoring_reason": "fast",
+}
+DEFAULT_TIER = "standard"
+
+
+def _load_json(name: str, raw: Optional[str]) -> Dict[str, Any]:
+    if not raw:
+        return {}
+    try:
+        value = json.loads(raw)
+        if isinstance(value, dict):
+            return value
+    except ValueError:
+        pass
+    print(f"[model_routing] {name} 설정을 읽을 수 없어 무시합니다: {raw}", flush=True)
+    return {}
+
+
+MODEL_TIERS: Dict[str, List[str]] = {**DEFAULT_MODEL_TIERS, **_load_json("LLM_MODEL_TIERS", settings.LLM_MODEL_TIERS)}
+STAGE_TIERS: Dict[str, Any] = {**DEFAULT_STAGE_TIERS, **_load_json("LLM_STAGE_TIERS", settings.LLM_STAGE_TIERS)}
+
+# provider 장애 시 다른 provider 모델로 넘어가도 되는 단계 (logprobs 등 provider 전용 기능을 쓰지 않는 단계)
+FAILOVER_STAGES = {stage.strip() for stage in settings.LLM_FAILOVER_STAGES.split(",") if stage.strip()}
+FAILOVER_MODELS: Dict[str, str] = _load_json("LLM_FAILOVER_MODELS", settings.LLM_FAILOVER_MODELS)
+
+# 라우팅에 쓸 수 있는 모델 (등급에 포함된 모델 + 대체 모델 + LLM_EXTRA_MODELS)
+KNOWN_MODELS = {model for chain in MODEL_TIERS.values() for model in chain}
+KNOWN_MODELS |= {model for model in FAILOVER_MODELS.values() if isinstance(model, str)}
+KNOWN_MODELS |= {settings.SCORING_FALLBACK_MODEL}
+KNOWN_MODELS |= {model.strip() for model in settings.LLM_EXTRA_MODELS.split(",") if model.strip()}
+
+# 숫자 점수 확신도를 logprobs로 계산하는 단계 (문장 평가는 이 단계의 1순위 모델만 직접 지정해 호출)
+LOGPROB_STAGES = {"scoring", "scoring_fallback"}
+
+# 현재 분석 중인 회의의 회사별 라우팅 재정의 {stage: 등급 | 모델 | [모델, ...]}
+current_routing: ContextVar[Optional[Dict[str, Any]]] = ContextVar("current_model_routing", default=None)
+
+
+def provider_for(model: str) -> str:
+    return "google" if (model or "").startswith(("gemini", "models/gemini")) else "openai"
+
+
+def supports_logprobs(model: str) -> bool:
+    # OpenAI 채팅 모델만 logprobs 제공 (Gemini, o-시리즈 추론 모델은 미지원)
+    return provider_for(model) == "openai" and not model.startswith(("o1", "o3", "o4"))
+
+
+def set_company_routing(overrides: Optional[Dict[str, Any]]) -> None:
+    """
+    회의 분석 시작 시 회사별 라우팅 재정의를 현재 컨텍스트에 등록 (없으면 기본 라우팅)
+    저장된 재정의가 현재 검증 규칙에 맞지 않으면 (모델 목록 변경 등) 무시하고 기본 라우팅 사용
+    """
+    if overrides:
+        try:
+            validate_routing(overrides)
+        except ValueError as e:
+            print(f"[model_routing] 회사별 라우팅 재정의를 무시합니다: {e}", flush=True)
+            overrides = None
+    current_routing.set(overrides or None)
+
+
+def _as_chain(target: Any) -> List[str]:
+    # 등급 이름이면 해당 순서, 문자열이면 모델 하나, 리스트면 모델(또는 등급) 순서 그대로
+    if isinstance(target, str):
+        return list(MODEL_TIERS.get(target, [target]))
+    if isinstance(target, (list, tuple)):
+        chain: List[str] = []
+        for item in target:
+            for model in _as_chain(item):
+                if model not in chain:
+                    chain.append(model)
+        return chain
+    return []
+
+
+def resolve_models(stage: str, overrides: Optional[Dict[str, Any]] = None) -> List[str]:
+    """
+    단계에 사용할 모델 순서 (회사별 재정의 > LLM_STAGE_TIERS > 기본값)
+    FAILOVER_STAGES 단계는 다른 provider 대체 모델을 순서 끝에 붙인다.
+    """
+    overrides = current_routing.get() if overrides is None else overrides
+    target = (overrides or {}).get(stage) or STAGE_TIERS.get(stage) or DEFAULT_TIER
+    chain = _as_chain(target) or _as_chain(DEFAULT_TIER)
+    if stage in FAILOVER_STAGES:
+        # 순서에 있는 provider마다 지정된 다른 provider 대체 모델을 (없으면) 끝에 추가
+        for provider in dict.fromkeys(provider_for(model) for model in chain):
+            backup = FAILOVER_MODELS.get(provider)
+            if backup and backup not in chain:
+                chain.append(backup)
+    return chain
+
+
+def route_model(stage: str) -> str:
+    """단계의 1순위 모델 (프롬프트 토큰 계산, 점수 캐시 키 등에 사용)"""
+    return resolve_models(stage)[0]
+
+
+def routing_table(overrides: Optional[Dict[str, Any]] = None) -> Dict[str, List[str]]:
+    """단계별 실제 적용 모델 순서 (관리자 조회용)"""
+    stages = set(STAGE_TIERS) | set(overrides or {})
+    return {stage: resolve_models(stage, overrides or {}) for stage in sorted(stages)}
+
+
+def validate_routing(overrides: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    회사별 재정의 값 검증: 값은 등급 이름, 모델 이름 또는 그 리스트
+    """
+    if not isinstance(overrides, dict):
+        raise ValueError("라우팅 설정은 {stage: 등급 | 모델 | [모델, ...]} 형식이어야 합니다.")
+    for stage, target in overrides.items():
+        items = target if isinstance(target, list) else [target]
+        if not items or not all(isinstance(item, str) and item for item in items):
+            raise ValueError(f"{stage}: 등급 또는 모델 이름(리스트)이어야 합니다.")
+        unknown = [item for item in items if item not in MODEL_TIERS and item not in KNOWN_MODELS]
+        if unknown:
+            raise ValueError(f"{stage}: 알 수 없는 등급/모델 {unknown} (모델은 LLM_EXTRA_MODELS에 등록 필요)")
+    for stage in LOGPROB_STAGES & set(overrides):
+        model = resolve_models(stage, overrides)[0]
+        if not supports_logprobs(model):
+            raise ValueError(f"{stage}: {model}은(는) logprobs를 지원하지 않아 숫자 점수 평가에 쓸 수 없습니다.")
+    return overrides
+
+
+# 환경 변수 라우팅(LLM_STAGE_TIERS)도 시작 시 같은 규칙으로 검증 (잘못된 설정이면 앱이 시작되지 않음)
+validate_routing(STAGE_TIERS)
+
+
+def should_fall_back(error: Exception) -> bool:
+    """
+    다음 모델로 넘어갈 오류: 속도 제한, 서버 오류(5xx), 연결/타임아웃
+    요청 자체가 잘못된 오류(4xx)는 다른 모델로 바꿔도 같으므로 그대로 전달한다.
+    """
+    if is_rate_limit_error(error):
+        return True
+    if isinstance(error, (openai.APIConnectionError, TimeoutError)):
+        return True
+    status = getattr(error, "status_code", None)
+    if status is None:
+        # google.api_core 예외는 code에 HTTP 상태 코드가 있음
+        status = getattr(error, "code", None)
+    return isinstance(status, int) and (status >= 500 or status in (408, 429))
@@ -0,0 +1,195 @@
+# 프롬프트 토큰 예산 계산 및 문장 패킹 (tiktoken)
+import json
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.services.sentence_table import SentenceTable, UNSCORED
+
+# 모델별 컨텍스트 윈도우 (입력 + 출력 토큰)
+MODEL_CONTEXT_WINDOWS: Dict[str, int] = {
+    "gpt-4": 8192,
+    "gpt-4-turbo": 128000,
+    "gpt-4o": 128000,
+    "gpt-4o-mini": 128000,
+    "gpt-3.5-turbo": 16385,
+    "gemini-2.5-flash": 1048576,
+}
+DEFAULT_CONTEXT_WINDOW = 8192
+
+# Agent별 입력 프롬프트 최대 토큰 (비용 상한, 모델 컨텍스트가 더 작으면 그쪽을 따름)
+AGENT_INPUT_BUDGETS: Dict[str, int] = {
+    "summary": 6000,
+    "summary_map": 3000,
+    "feedback": 8000,
+    "agenda_analysis": 6000,
+    "efficiency": 10000,
+    "todo": 6000,
+    "role": 6000,
+    "preview": 4000,
+    "docs_agent": 8000,
+}
+DEFAULT_INPUT_BUDGET = 6000
+
+# 응답용으로 남겨 두는 토큰 수 (max_tokens 미지정 호출 기준)
+DEFAULT_OUTPUT_RESERVE = 1500
+
+TRUNCATION_MARKER = "\n...(이하 생략)"
+# 프롬프트에서 예산에 맞춰 채울 본문 자리
+SECTION_PLACEHOLDER = "<<본문>>"
+
+
+@lru_cache(maxsize=None)
+def _encoding(model: str):
+    """
+    모델에 맞는 tiktoken 인코딩, 인코딩 파일을 받을 수 없는 환경이면 None (근사치 사용)
+    """
+    import tiktoken
+
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        pass
+    except Exception as e:
+        print(f"[prompt_budget] tiktoken 인코딩 로드 실패, 글자 수 기반 근사 사용: {e}", flush=True)
+        return None
+    try:
+        return tiktoken.get_encoding("o200k_base" if model.startswith(("gpt-4o", "gpt-4.1", "o")) else "cl100k_base")
+    except Exception as e:
+        print(f"[prompt_budget] tiktoken 인코딩 로드 실패, 글자 수 기반 근사 사용: {e}", flush=True)
+        return None
+
+
+def count_tokens(text: str, model: str = "gpt-4") -> int:
+    encoding = _encoding(model)
+    if encoding is None:
+        # 한국어는 대략 글자당 1토큰 이하라 글자 수로 보수적으로 추정
+        return len(text)
+    return len(encoding.encode_ordinary(text))
+
+
+def count_tokens_batch(texts: List[str], model: str = "gpt-4") -> List[int]:
+    encoding = _encoding(model)
+    if encoding is None:
+        return [len(t) for t in texts]
+    return [len(tokens) for tokens in encoding.encode_ordinary_batch(texts)]
+
+
+def input_budget(agent: str, model: str, output_tokens: Optional[int] = None) -> int:
+    """
+    Agent 입력 프롬프트에 쓸 수 있는 토큰 수
+    min(Agent 예산, 모델 컨텍스트 - 응답 예약분)
+    """
+    window = MODEL_CONTEXT_WINDOWS.get(model, DEFAULT_CONTEXT_WINDOW)
+    reserve = output_tokens if output_tokens is not None else DEFAULT_OUTPUT_RESERVE
+    return max(0, min(AGENT_INPUT_BUDGETS.get(agent, DEFAULT_INPUT_BUDGET), window - reserve))
+
+
+def remaining_budget(agent: str, model: str, *fixed_parts: str, output_tokens: Optional[int] = None) -> int:
+    """
+    고정 프롬프트(지시문, 메타 정보 등)를 제외하고 가변 본문에 쓸 수 있는 토큰 수
+    """
+    used = sum(count_tokens(part, model) for part in fixed_parts if part)
+    return max(0, input_budget(agent, model, output_tokens) - used)
+
+
+def fill_section(
+    prompt: str,
+    build: Callable[[int], str],
+    agent: str,
+    model: str,
+    output_tokens: Optional[int] = None,
+    placeholder: str = SECTION_PLACEHOLDER,
+) -> str:
+    """
+    프롬프트의 placeholder 자리에 남은 예산만큼의 본문을 채운다.
+    build(max_tokens)는 예산 안에 들어가는 본문 문자열을 만들어야 한다.
+    """
+    budget = remaining_budget(agent, model, prompt.replace(placeholder, ""), output_tokens=output_tokens)
+    return prompt.replace(placeholder, build(budget))
+
+
+def truncate_to_tokens(text: str, max_tokens: int, model: str = "gpt-4") -> str:
+    """
+    토큰 수 기준으로 앞에서부터 자르고 생략 표시를 붙인다. (같은 입력이면 항상 같은 결과)
+    줄 단위로 끊을 수 있으면 마지막 완전한 줄까지만 남긴다.
+    """
+    if count_tokens(text, model) <= max_tokens:
+        return text
+    limit = max(0, max_tokens - count_tokens(TRUNCATION_MARKER, model))
+    encoding = _encoding(model)
+    if encoding is None:
+        head = text[:limit]
+    else:
+        head = encoding.decode(encoding.encode_ordinary(text)[:limit])
+    cut = head.rfind("\n")
+    if cut > len(head) // 2:
+        head = head[:cut]
+    return head.rstrip() + TRUNCATION_MARKER
+
+
+def group_by_tokens(costs: Sequence[int], max_tokens: int) -> List[Tuple[int, int]]:
+    """
+    순서를 유지한 채 토큰 합이 max_tokens 이하가 되도록 연속 구간 [start, end)으로 나눔
+    (혼자서 예산을 넘는 항목은 단독 구간)
+    """
+    groups: List[Tuple[int, int]] = []
+    start, used = 0, 0
+    for i, cost in enumerate(costs):
+        if i > start and used + cost > max_tokens:
+            groups.append((start, i))
+            start, used = i, 0
+        used += int(cost)
+    if start < len(costs):
+        groups.append((start, len(costs)))
+    return groups
+
+
+def compact_json(value: Any) -> str:
+    """프롬프트용 JSON (공백/들여쓰기 없이, 한글 그대로)"""
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+def pack_sentences(
+    table: SentenceTable,
+    max_tokens: int,
+    model: str = "gpt-4",
+    mask: Optional[np.ndarray] = None,
+    line: Optional[Callable[[int], str]] = None,
+    agent: str = "",
+) -> List[str]:
+    """
+    점수가 높은 문장부터 예산 안에 들어가는 만큼 담고, 결과는 원래 발화 순서로 반환
+    같은 점수끼리는 앞쪽 문장이 우선이라 결과가 항상 같다.
+
+    Args:
+        table: 문장 테이블
+        max_tokens: 문장 본문에 쓸 수 있는 토큰 수
+        mask: 후보 문장 (None이면 전체)
+        line: 문장 번호 → 프롬프트 한 줄 (기본: 문장 그대로)
+        agent: 로그용 Agent 이름
+    """
+    rows = table.index if mask is None else np.flatnonzero(mask)
+    if len(rows) == 0:
+        return []
+    line = line or table.sentence
+    lines = [line(int(i)) for i in rows]
+    # 줄바꿈 1토큰 포함
+    costs = np.asarray(count_tokens_batch(lines, model), dtype=np.int64) + 1
+    if costs.sum() <= max_tokens:
+        return lines
+
+    scores = table.score[rows].astype(np.int16)
+    scores[scores == UNSCORED] = -1
+    # 점수 내림차순, 같은 점수는 발화 순서
+    order = np.lexsort((rows, -scores))
+    selected = np.zeros(len(rows), dtype=bool)
+    used = 0
+    for pos in order:
+        if used + costs[pos] > max_tokens:
+            continue
+        selected[pos] = True
+        used += int(costs[pos])
+    print(f"[prompt_budget] {agent} 문장 {int(selected.sum())}/{len(rows)}개 포함 ({used}/{max_tokens} 토큰)", flush=True)
+    return [lines[pos] for pos in np.flatnonzero(selected)]
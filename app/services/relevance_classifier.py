@@ -0,0 +1,269 @@
+# 과거 LLM 문장 평가 결과로 학습한 로컬 관련도 분류기 (임베딩 + 소프트맥스 로지스틱 회귀)
+import json
+import os
+import random
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.services.sentence_embedding import encode_texts_async, EMBEDDING_MODEL_NAME
+
+# 특징 구성이 바뀌면 올려서 이전 모델을 사용하지 않도록 함
+FEATURE_VERSION = 1
+NUM_CLASSES = 4
+
+
+def build_features(sentence_vectors: np.ndarray, topic_vectors: np.ndarray) -> np.ndarray:
+    """
+    문장 임베딩 + 주제와의 요소곱 + 코사인 유사도(본인/앞/뒤 문장)
+    sentence_vectors, topic_vectors: L2 정규화된 임베딩
+    """
+    similarities = sentence_vectors @ topic_vectors.T
+    best_topic = topic_vectors[similarities.argmax(axis=1)]
+    own = similarities.max(axis=1)
+    prev = np.concatenate([own[:1], own[:-1]]) if len(own) else own
+    nxt = np.concatenate([own[1:], own[-1:]]) if len(own) else own
+    return np.hstack([
+        sentence_vectors,
+        sentence_vectors * best_topic,
+        np.stack([own, prev, nxt], axis=1),
+    ]).astype(np.float32)
+
+
+class RelevanceClassifier:
+    """
+    0~3점 다중 클래스 로지스틱 회귀 (NumPy 경사하강법, 클래스 불균형 보정)
+    """
+
+    def __init__(self, weights: np.ndarray = None, bias: np.ndarray = None, mean: np.ndarray = None, std: np.ndarray = None, metadata: Dict[str, Any] = None):
+        self.weights = weights
+        self.bias = bias
+        self.mean = mean
+        self.std = std
+        self.metadata = metadata or {}
+
+    def _standardize(self, X: np.ndarray) -> np.ndarray:
+        return (X - self.mean) / self.std
+
+    @staticmethod
+    def _softmax(logits: np.ndarray) -> np.ndarray:
+        logits = logits - logits.max(axis=1, keepdims=True)
+        exp = np.exp(logits)
+        return exp / exp.sum(axis=1, keepdims=True)
+
+    def fit(self, X: np.ndarray, y: np.ndarray, epochs: int = 300, learning_rate: float = 0.5, l2: float = 1e-3) -> "RelevanceClassifier":
+        self.mean = X.mean(axis=0)
+        self.std = X.std(axis=0) + 1e-6
+        Xs = self._standardize(X)
+        n, d = Xs.shape
+        self.weights = np.zeros((d, NUM_CLASSES), dtype=np.float32)
+        self.bias = np.zeros(NUM_CLASSES, dtype=np.float32)
+        onehot = np.eye(NUM_CLASSES, dtype=np.float32)[y]
+        # 적은 클래스(보통 3점)에 가중치를 더 줌
+        counts = np.bincount(y, minlength=NUM_CLASSES).astype(np.float32)
+        class_weight = n / (NUM_CLASSES * np.clip(counts, 1, None))
+        sample_weight = class_weight[y][:, None]
+        for _ in range(epochs):
+            probs = self._softmax(Xs @ self.weights + self.bias)
+            grad = (probs - onehot) * sample_weight / n
+            self.weights -= learning_rate * (Xs.T @ grad + l2 * self.weights)
+            self.bias -= learning_rate * grad.sum(axis=0)
+        return self
+
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        return self._softmax(self._standardize(X) @ self.weights + self.bias)
+
+    def save(self, path: str) -> None:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        np.savez_compressed(
+            path,
+            weights=self.weights,
+            bias=self.bias,
+            mean=self.mean,
+            std=self.std,
+            metadata=np.array(json.dumps(self.metadata, ensure_ascii=False, default=str)),
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "RelevanceClassifier":
+        with np.load(path, allow_pickle=False) as data:
+            return cls(
+                weights=data["weights"],
+                bias=data["bias"],
+                mean=data["mean"],
+                std=data["std"],
+                metadata=json.loads(str(data["metadata"])),
+            )
+
+
+def classifier_path(company_id: Any = None) -> str:
+    name = str(company_id) if company_id else "global"
+    return os.path.join(settings.RELEVANCE_CLASSIFIER_DIR, f"{name}.npz")
+
+
+_classifier_cache: Dict[str, Tuple[float, RelevanceClassifier]] = {}
+
+
+def load_classifier(company_id: Any = None) -> Optional[RelevanceClassifier]:
+    """
+    회사 전용 모델 -> 공용 모델 순으로 조회 (파일 수정 시간 기준 캐시)
+    특징 버전이나 임베딩 모델이 다른 모델은 사용하지 않음
+    """
+    for path in ([classifier_path(company_id)] if company_id else []) + [classifier_path()]:
+        if not os.path.exists(path):
+            continue
+        mtime = os.path.getmtime(path)
+        cached = _classifier_cache.get(path)
+        if cached is None or cached[0] != mtime:
+            try:
+                cached = (mtime, RelevanceClassifier.load(path))
+            except Exception as e:
+                print(f"[relevance_classifier] 모델 로드 실패 ({path}): {e}", flush=True)
+                continue
+            _classifier_cache[path] = cached
+        classifier = cached[1]
+        if classifier.metadata.get("feature_version") != FEATURE_VERSION or classifier.metadata.get("embedding_model") != EMBEDDING_MODEL_NAME:
+            print(f"[relevance_classifier] 호환되지 않는 모델 무시: {path}", flush=True)
+            continue
+        return classifier
+    return None
+
+
+async def embed_meeting(subject: str, agenda: Optional[str], sentences: List[str]) -> Optional[np.ndarray]:
+    topics = [t for t in (subject, agenda) if t and str(t).strip()]
+    if not topics or not sentences:
+        return None
+    vectors = await encode_texts_async(topics + list(sentences))
+    return build_features(vectors[len(topics):], vectors[:len(topics)])
+
+
+async def classify_sentences(classifier: RelevanceClassifier, subject: str, agenda: Optional[str], sentences: List[str]) -> Optional[Dict[str, Any]]:
+    """
+    로컬 분류기로 전체 문장 평가
+    확신도가 RELEVANCE_CLASSIFIER_MIN_CONFIDENCE 미만인 문장과
+    RELEVANCE_CLASSIFIER_SPOT_CHECK_RATE 비율의 표본은 LLM으로 다시 평가하도록 표시
+
+    Returns: relevance_triage.triage_sentences와 같은 형식
+    """
+    try:
+        features = await embed_meeting(subject, agenda, sentences)
+    except Exception as e:
+        print(f"[relevance_classifier] 임베딩 실패, LLM 평가로 진행: {e}", flush=True)
+        return None
+    if features is None:
+        return None
+    probs = classifier.predict_proba(features)
+    predicted = probs.argmax(axis=1)
+    confidence = probs.max(axis=1)
+    scores: Dict[int, Dict[str, Any]] = {}
+    llm_indices: List[int] = []
+    audit_indices: List[int] = []
+    for idx, (score, conf) in enumerate(zip(predicted.tolist(), confidence.tolist())):
+        if conf < settings.RELEVANCE_CLASSIFIER_MIN_CONFIDENCE:
+            llm_indices.append(idx)
+            continue
+        scores[idx] = {"score": int(score), "reason": f"로컬 분류기 판정 (확신도 {conf:.2f})"}
+        if random.random() < settings.RELEVANCE_CLASSIFIER_SPOT_CHECK_RATE:
+            audit_indices.append(idx)
+    print(
+        f"[relevance_classifier] 전체 {len(sentences)}문장 중 로컬 판정 {len(scores)}, "
+        f"LLM 평가 {len(llm_indices)}, 검증 샘플 {len(audit_indices)}",
+        flush=True
+    )
+    return {
+        "method": "classifier",
+        "source": "classifier",
+        "scores": scores,
+        "llm_indices": sorted(llm_indices + audit_indices),
+        "audit_indices": audit_indices,
+        "sentence_count": len(sentences),
+        "thresholds": {"min_confidence": settings.RELEVANCE_CLASSIFIER_MIN_CONFIDENCE, "trained_at": classifier.metadata.get("trained_at")},
+    }
+
+
+async def load_training_meetings(db: AsyncSession, company_id: Any = None, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    prompt_log(summary)에 저장된 LLM 문장 평가 결과를 회의 단위로 수집
+    임베딩/분류기로 자동 판정된 문장은 학습에서 제외
+    """
+    from app.models import PromptLog, Meeting, Project
+    stmt = (
+        select(PromptLog.prompt_output)
+        .join(Meeting, Meeting.meeting_id == PromptLog.prompt_meeting_id)
+        .join(Project, Project.project_id == Meeting.project_id)
+        .where(PromptLog.agent_type == "summary")
+        .order_by(PromptLog.prompt_output_date.desc())
+    )
+    if company_id:
+        stmt = stmt.where(Project.company_id == company_id)
+    if limit:
+        stmt = stmt.limit(limit)
+    result = await db.execute(stmt)
+    meetings = []
+    for (prompt_output,) in result.all():
+        try:
+            output = json.loads(prompt_output)
+        except (TypeError, json.JSONDecodeError):
+            continue
+        scores = output.get("sentence_scores") if isinstance(output, dict) else None
+        if not scores:
+            continue
+        metadata = output.get("metadata") or {}
+        meetings.append({
+            "subject": metadata.get("subject"),
+            "agenda": metadata.get("agenda"),
+            "sentences": [s.get("sentence", "") for s in scores],
+            "labels": [
+                s.get("score") if s.get("source", "llm") == "llm" and s.get("score") in (0, 1, 2, 3) else None
+                for s in scores
+            ],
+        })
+    return meetings
+
+
+async def build_training_set(meetings: List[Dict[str, Any]]) -> Tuple[np.ndarray, np.ndarray]:
+    features, labels = [], []
+    for meeting in meetings:
+        X = await embed_meeting(meeting["subject"], meeting["agenda"], meeting["sentences"])
+        if X is None:
+            continue
+        # 문맥 특징(앞/뒤 문장)을 위해 회의 전체를 임베딩한 뒤 라벨 있는 문장만 사용
+        for idx, label in enumerate(meeting["labels"]):
+            if label is not None:
+                features.append(X[idx])
+                labels.append(label)
+    if not features:
+        return np.zeros((0, 0), dtype=np.float32), np.zeros(0, dtype=np.int64)
+    return np.vstack(features), np.array(labels, dtype=np.int64)
+
+
+def train_classifier(X: np.ndarray, y: np.ndarray, company_id: Any = None, holdout: float = 0.2, epochs: int = 300) -> RelevanceClassifier:
+    """
+    holdout 비율로 검증 정확도를 측정한 뒤 전체 데이터로 다시 학습
+    """
+    rng = np.random.default_rng(42)
+    order = rng.permutation(len(y))
+    split = int(len(y) * (1 - holdout))
+    train_idx, test_idx = order[:split], order[split:]
+    accuracy = within_one = None
+    if len(test_idx):
+        probe = RelevanceClassifier().fit(X[train_idx], y[train_idx], epochs=epochs)
+        predicted = probe.predict_proba(X[test_idx]).argmax(axis=1)
+        accuracy = float((predicted == y[test_idx]).mean())
+        within_one = float((np.abs(predicted - y[test_idx]) <= 1).mean())
+    classifier = RelevanceClassifier().fit(X, y, epochs=epochs)
+    classifier.metadata = {
+        "feature_version": FEATURE_VERSION,
+        "embedding_model": EMBEDDING_MODEL_NAME,
+        "company_id": str(company_id) if company_id else None,
+        "trained_at": datetime.now().isoformat(),
+        "sample_count": int(len(y)),
+        "class_counts": np.bincount(y, minlength=NUM_CLASSES).tolist(),
+        "holdout_accuracy": accuracy,
+        "holdout_within_one": within_one,
+    }
+    return classifier
@@ -0,0 +1,107 @@
+# 임베딩 유사도 기반 문장 관련도 1차 분류 (확실한 문장은 LLM 평가 생략)
+import random
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from app.core.config import settings
+from app.services.sentence_embedding import encode_texts_async
+
+# 앞뒤 문장 유사도 반영 비율 (LLM 평가처럼 문맥을 조금 고려)
+NEIGHBOR_WEIGHT = 0.15
+
+
+def _smoothed_similarity(sentence_vectors: np.ndarray, topic_vectors: np.ndarray) -> np.ndarray:
+    # 문장별로 주제/안건 중 가장 가까운 쪽과의 코사인 유사도
+    own = (sentence_vectors @ topic_vectors.T).max(axis=1)
+    if len(own) < 3:
+        return own
+    prev = np.concatenate([own[:1], own[:-1]])
+    nxt = np.concatenate([own[1:], own[-1:]])
+    return (1 - 2 * NEIGHBOR_WEIGHT) * own + NEIGHBOR_WEIGHT * (prev + nxt)
+
+
+async def triage_sentences(subject: str, agenda: Optional[str], sentences: List[str]) -> Optional[Dict[str, Any]]:
+    """
+    회의 주제/안건과 전체 문장을 한 번에 임베딩해 관련도를 1차 분류
+
+    Returns:
+        {
+            "scores": {index: {"score", "reason"}},  # 임베딩만으로 확정한 문장
+            "llm_indices": [...],                    # LLM 평가가 필요한 문장 (애매한 구간 + 검증 샘플)
+            "audit_indices": [...],                  # 확정했지만 일치율 측정을 위해 LLM도 평가하는 문장
+            "sentence_count": 전체 문장 수,
+            ...
+        }
+        임베딩 모델을 사용할 수 없으면 None (전체 LLM 평가로 진행)
+    """
+    if not sentences:
+        return None
+    topics = [t for t in (subject, agenda) if t and str(t).strip()]
+    if not topics:
+        return None
+    try:
+        vectors = await encode_texts_async(topics + list(sentences))
+    except Exception as e:
+        print(f"[relevance_triage] 임베딩 실패, LLM 평가로 진행: {e}", flush=True)
+        return None
+    similarities = _smoothed_similarity(vectors[len(topics):], vectors[:len(topics)])
+
+    low, high = settings.RELEVANCE_TRIAGE_LOW, settings.RELEVANCE_TRIAGE_HIGH
+    scores: Dict[int, Dict[str, Any]] = {}
+    llm_indices: List[int] = []
+    audit_indices: List[int] = []
+    for idx, similarity in enumerate(similarities.tolist()):
+        if similarity >= high:
+            score = 3
+        elif similarity <= low:
+            score = 0
+        else:
+            llm_indices.append(idx)
+            continue
+        scores[idx] = {"score": score, "reason": f"임베딩 유사도 {similarity:.2f} (자동 판정)"}
+        if random.random() < settings.RELEVANCE_TRIAGE_AUDIT_RATE:
+            audit_indices.append(idx)
+    print(
+        f"[relevance_triage] 전체 {len(sentences)}문장 중 자동 판정 {len(scores)} "
+        f"(관련 {sum(1 for s in scores.values() if s['score'] == 3)}, 무관 {sum(1 for s in scores.values() if s['score'] == 0)}), "
+        f"LLM 평가 {len(llm_indices)}, 검증 샘플 {len(audit_indices)}",
+        flush=True
+    )
+    return {
+        "method": "embedding_triage",
+        "source": "embedding",
+        "scores": scores,
+        "llm_indices": sorted(llm_indices + audit_indices),
+        "audit_indices": audit_indices,
+        "sentence_count": len(sentences),
+        "thresholds": {"low": low, "high": high},
+    }
+
+
+def triage_agreement(triage: Dict[str, Any], llm_scores: Dict[int, Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    검증 샘플에서 자동 판정(임베딩/로컬 분류기)과 LLM 점수의 일치율 계산 (임계값 조정용)
+    - exact: 점수 완전 일치, direction: 관련(2~3)/무관(0~1) 방향 일치
+    """
+    pairs = []
+    for idx in triage["audit_indices"]:
+        llm_score = llm_scores.get(idx, {}).get("score")
+        if llm_score is None:
+            continue
+        pairs.append((triage["scores"][idx]["score"], int(llm_score)))
+    stats = {
+        "method": triage["method"],
+        "sentence_count": triage["sentence_count"],
+        "auto_scored": len(triage["scores"]),
+        "llm_scored": len(triage["llm_indices"]) - len(triage["audit_indices"]),
+        "audited": len(pairs),
+        "exact_agreement": None,
+        "direction_agreement": None,
+        "thresholds": triage["thresholds"],
+    }
+    if pairs:
+        stats["exact_agreement"] = round(sum(1 for t, l in pairs if t == l) / len(pairs), 3)
+        stats["direction_agreement"] = round(sum(1 for t, l in pairs if (t >= 2) == (l >= 2)) / len(pairs), 3)
+    print(f"[relevance_triage] 검증 일치율: {stats}", flush=True)
+    return stats
@@ -0,0 +1,118 @@
+# 문장 관련도 점수 캐시 (프로세스 내 LRU + Postgres)
+import hashlib
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Iterable, List
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.core.config import settings
+from app.db.db_session import AsyncSessionLocal
+from app.models.sentence_score_cache import SentenceScoreCache
+
+# 한 번에 조회/저장하는 키 수 (IN 절, VALUES 크기 제한)
+DB_CHUNK_SIZE = 500
+
+
+def make_score_key(subject: str, sentences: List[str], index: int, model: str, context: int) -> str:
+    """
+    평가기 버전 + 모델 + 회의 주제 + 앞뒤 문맥 + 대상 문장으로 캐시 키 생성
+    평가 프롬프트/방식이 바뀌면 SCORING_CACHE_VERSION을 올려 기존 캐시를 무효화
+    """
+    before = sentences[max(0, index - context):index]
+    after = sentences[index + 1:index + 1 + context]
+    raw = "\x1f".join([
+        settings.SCORING_CACHE_VERSION,
+        settings.SCORING_MODE,
+        model,
+        subject or "",
+        "\x1e".join(before),
+        sentences[index],
+        "\x1e".join(after),
+    ])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class SentenceScoreCacheStore:
+    """
+    LRU에 없으면 DB에서 한 번에 조회하고, 새 점수는 LRU와 DB에 함께 저장
+    캐시 오류는 분석을 막지 않도록 로그만 남긴다.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._lru: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _remember(self, key: str, value: Dict[str, Any]) -> None:
+        self._lru[key] = value
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.max_size:
+            self._lru.popitem(last=False)
+
+    async def get_many(self, keys: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        found: Dict[str, Dict[str, Any]] = {}
+        missing = []
+        unique_keys = list(dict.fromkeys(keys))
+        for key in unique_keys:
+            value = self._lru.get(key)
+            if value is not None:
+                self._lru.move_to_end(key)
+                found[key] = value
+            else:
+                missing.append(key)
+        if missing:
+            try:
+                async with AsyncSessionLocal() as db:
+                    for start in range(0, len(missing), DB_CHUNK_SIZE):
+                        result = await db.execute(
+                            select(SentenceScoreCache.cache_key, SentenceScoreCache.score, SentenceScoreCache.reason, SentenceScoreCache.confidence)
+                            .where(
+                                SentenceScoreCache.cache_key.in_(missing[start:start + DB_CHUNK_SIZE]),
+                                SentenceScoreCache.scorer_version == settings.SCORING_CACHE_VERSION
+                            )
+                        )
+                        for row in result.all():
+                            value = {"score": row.score, "reason": row.reason, "confidence": row.confidence}
+                            self._remember(row.cache_key, value)
+                            found[row.cache_key] = value
+            except Exception as e:
+                print(f"[score_cache] 캐시 조회 오류: {e}", flush=True)
+        self.hits += len(found)
+        self.misses += len(unique_keys) - len(found)
+        return found
+
+    async def put_many(self, entries: Dict[str, Dict[str, Any]], model: str) -> None:
+        rows = []
+        now = datetime.now()
+        for key, value in entries.items():
+            score = value.get("score")
+            if score not in (0, 1, 2, 3):
+                # 파싱 실패/API 오류 결과는 캐시하지 않음
+                continue
+            # 확신도도 함께 저장해야 캐시 적중 문장도 확신도 낮은 문장 이유 생성 대상이 됨
+            self._remember(key, {"score": score, "reason": value.get("reason"), "confidence": value.get("confidence")})
+            rows.append({
+                "cache_key": key,
+                "scorer_version": settings.SCORING_CACHE_VERSION,
+                "model": model,
+                "score": score,
+                "reason": value.get("reason"),
+                "confidence": value.get("confidence"),
+                "created_at": now,
+            })
+        if not rows:
+            return
+        try:
+            async with AsyncSessionLocal() as db:
+                for start in range(0, len(rows), DB_CHUNK_SIZE):
+                    stmt = pg_insert(SentenceScoreCache).values(rows[start:start + DB_CHUNK_SIZE])
+                    await db.execute(stmt.on_conflict_do_nothing(index_elements=["cache_key"]))
+                await db.commit()
+        except Exception as e:
+            print(f"[score_cache] 캐시 저장 오류: {e}", flush=True)
+
+
+score_cache = SentenceScoreCacheStore(max_size=settings.SCORE_CACHE_LRU_SIZE)
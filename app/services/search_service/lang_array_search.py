@@ -3,10 +3,9 @@ import aiohttp
 from langchain.tools import tool
 from langchain.agents import initialize_agent
 from langchain.agents.agent_types import AgentType
-from langchain_community.utilities import SerpAPIWrapper
 # from langchain_openai import ChatOpenAI
 from app.core.config import settings
-from langchain_google_genai import ChatGoogleGenerativeAI
+from app.services.llm_gateway import get_chat_model, get_search_client, DEFAULT_GEMINI_MODEL
 from langchain_core.tools import Tool
 from langgraph.prebuilt import create_react_agent
 # openai_api_key = settings.OPENAI_API_KEY
@@ -17,17 +16,10 @@ serperapi_api_key = settings.SERPAPI_API_KEY
 if not google_api_key or not serperapi_api_key:
     print("Warning: API keys not loaded.")
 
-search = SerpAPIWrapper()
+search = get_search_client()
 
 # llm = ChatOpenAI(temperature=0)
-llm = ChatGoogleGenerativeAI(
-    model="gemini-2.5-flash",
-    temperature=0,
-    max_tokens=None,
-    timeout=None,
-    max_retries=5,
-    # other params...
-)
+llm = get_chat_model(DEFAULT_GEMINI_MODEL, max_retries=5)
 
 
 system_message = """
@@ -74,13 +66,14 @@ async def check_link_validity(url: str) -> str:
         return f"Invalid (error): {url} - {e}"
 
 @tool(description=search_description)
-def search_and_extract_links(keywords: str) -> str:
+async def search_and_extract_links(keywords: str) -> str:
     keyword_list = [k.strip() for k in keywords.split(",")]
     results = {}
 
     for keyword in keyword_list:
         try:
-            serp_results = search.results(keyword)
+            # SerpAPI 래퍼는 동기 HTTP 호출이라 스레드에서 실행 (이벤트 루프 차단 방지)
+            serp_results = await asyncio.to_thread(search.results, keyword)
             links = [
                 r.get("link")
                 for r in serp_results.get("organic_results", [])
@@ -135,7 +128,7 @@ async def run_batch_keyword_search(keywords: list[str]) -> dict:
     #     for keyword in keywords:
     #         results[keyword] = [f"검색 중 오류 발생: {e}"]
     last_response = None
-    for step in agent.stream(
+    async for step in agent.astream(
         {"messages": [{"role": "user", "content": keywords}]},
         stream_mode="values",
     ):
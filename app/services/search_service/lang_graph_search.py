@@ -1,8 +1,7 @@
 import asyncio
 import aiohttp
 from langchain.tools import tool
-from langchain_openai import ChatOpenAI
-from langchain_community.utilities import SerpAPIWrapper
+from app.services.llm_gateway import get_chat_model, get_search_client
 from langgraph.graph import StateGraph, END
 from langgraph.pregel import Pregel
 from app.core.config import settings
@@ -15,8 +14,8 @@ if not google_api_key or not serperapi_api_key:
     print("Warning: API keys not loaded.")
 
 # 1. 환경 설정 및 LLM 초기화
-search = SerpAPIWrapper()
-llm = ChatOpenAI(temperature=0)
+search = get_search_client()
+llm = get_chat_model("gpt-3.5-turbo")
 
 # 2. 도구 정의
 @tool(description="Check if a URL is valid and reachable")
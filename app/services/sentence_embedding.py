@@ -0,0 +1,39 @@
+# 문장 임베딩 공용 모델 (distiluse, 최초 사용 시 1회 로드)
+import asyncio
+import threading
+from typing import List
+
+import numpy as np
+
+EMBEDDING_MODEL_NAME = "sentence-transformers/distiluse-base-multilingual-cased-v2"
+
+_model = None
+_model_lock = threading.Lock()
+
+
+def get_embedding_model():
+    global _model
+    if _model is None:
+        with _model_lock:
+            if _model is None:
+                from sentence_transformers import SentenceTransformer
+                _model = SentenceTransformer(EMBEDDING_MODEL_NAME)
+    return _model
+
+
+def encode_texts(texts: List[str], batch_size: int = 64) -> np.ndarray:
+    """
+    텍스트 목록을 한 번에 임베딩하여 L2 정규화된 (N, dim) 배열로 반환
+    (정규화되어 있으므로 내적이 곧 코사인 유사도)
+    """
+    if not texts:
+        return np.zeros((0, 0), dtype=np.float32)
+    vectors = get_embedding_model().encode(texts, batch_size=batch_size, convert_to_numpy=True, show_progress_bar=False)
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.clip(norms, 1e-12, None)
+
+
+async def encode_texts_async(texts: List[str], batch_size: int = 64) -> np.ndarray:
+    # 모델 추론은 CPU 작업이므로 이벤트 루프를 막지 않도록 스레드에서 실행
+    return await asyncio.to_thread(encode_texts, texts, batch_size)
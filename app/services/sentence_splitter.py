@@ -0,0 +1,131 @@
+# 한국어 문장 분리기 (LLM 호출 없이 프로세스 내에서 동작)
+import re
+from typing import List
+
+# 문장 종결 부호
+TERMINATORS = ".!?…"
+# 종결 부호 뒤에 붙을 수 있는 닫는 따옴표/괄호
+CLOSERS = "\"'”’)]」』"
+# 여는/닫는 따옴표 쌍 (따옴표 안에서는 문장을 나누지 않음)
+QUOTE_PAIRS = {"“": "”", "‘": "’", "「": "」", "『": "』"}
+# 열고 닫는 문자가 같은 따옴표
+SYMMETRIC_QUOTES = "\"'"
+# 따옴표가 이 글자 수 안에 닫히지 않으면 짝 없는 따옴표(STT의 잘못된 아포스트로피 등)로 보고 무시
+MAX_QUOTE_CHARS = 200
+
+# 문장 부호가 빠진 경우 종결 어미로 문장 끝을 추정 (뒤에 공백이 올 때만)
+SENTENCE_ENDINGS = re.compile(
+    r"(습니다|습니까|니다|니까|세요|네요|군요|거든요|잖아요|어요|아요|에요|예요|이에요|해요|죠|까요|래요|대요|나요|던데요|는데요)(?=\s)"
+)
+
+# 숫자 사이 마침표(3.5), 영문 약어(e.g., Mr.) 뒤에서는 나누지 않음
+ABBREVIATIONS = {"e.g", "i.e", "etc", "mr", "mrs", "ms", "dr", "vs", "no"}
+
+
+def _is_decimal_point(text: str, i: int) -> bool:
+    return text[i] == "." and 0 < i < len(text) - 1 and text[i - 1].isdigit() and text[i + 1].isdigit()
+
+
+def _is_abbreviation(text: str, i: int) -> bool:
+    if text[i] != ".":
+        return False
+    match = re.search(r"([A-Za-z.]+)$", text[:i])
+    return bool(match) and match.group(1).lower() in ABBREVIATIONS
+
+
+def _split_by_endings(segment: str) -> List[str]:
+    """
+    종결 부호 없이 이어진 구간을 종결 어미 기준으로 나누고 마침표를 보충
+    """
+    if any(segment.count(q) >= 2 for q in SYMMETRIC_QUOTES) or any(q in segment and c in segment for q, c in QUOTE_PAIRS.items()):
+        # 인용문이 있는 구간은 인용문 안을 잘못 나눌 수 있어 그대로 둠 (짝 없는 따옴표 하나는 무시)
+        return [segment.strip()]
+    parts = []
+    start = 0
+    for match in SENTENCE_ENDINGS.finditer(segment):
+        part = segment[start:match.end()].strip()
+        if part:
+            parts.append(part + ".")
+        start = match.end()
+    rest = segment[start:].strip()
+    if rest:
+        parts.append(rest)
+    return parts
+
+
+def split_korean_sentences(text: str) -> List[str]:
+    """
+    한국어 텍스트를 문장 단위로 분리
+    - 종결 부호(. ! ? …) 뒤에서 분리하고, 뒤따르는 닫는 따옴표/괄호는 앞 문장에 포함
+    - 따옴표 안의 종결 부호에서는 분리하지 않음 (줄이 바뀌거나 MAX_QUOTE_CHARS 안에 닫히지 않는 따옴표는 무시)
+    - 소수점, 영문 약어의 마침표에서는 분리하지 않음
+    - 문장 부호가 빠진 구간은 종결 어미로 문장 끝을 추정해 마침표를 보충
+    """
+    if not text or not text.strip():
+        return []
+    # 공백은 하나로 줄이되 줄바꿈은 남겨 따옴표 상태를 줄마다 초기화하는 데 사용
+    text = re.sub(r"\s*\n\s*", "\n", re.sub(r"[^\S\n]+", " ", text.strip()))
+    sentences = []
+    open_quotes = []
+    # 짝 없는 따옴표로 판정된 위치 (다시 훑을 때 여는 따옴표로 보지 않음)
+    stray_quotes = set()
+    quote_start = 0
+    start = 0
+    i = 0
+    n = len(text)
+    while i <= n:
+        if open_quotes and (i == n or text[i] == "\n" or i - quote_start > MAX_QUOTE_CHARS):
+            # 줄이 바뀌거나 일정 길이 안에 닫히지 않은 따옴표는 인용문이 아님 → 따옴표 다음부터 다시 분리
+            stray_quotes.add(quote_start)
+            open_quotes = []
+            i = quote_start + 1
+            continue
+        if i == n:
+            break
+        ch = text[i]
+        if i in stray_quotes:
+            pass
+        elif ch in QUOTE_PAIRS:
+            if not open_quotes:
+                quote_start = i
+            open_quotes.append(QUOTE_PAIRS[ch])
+        elif open_quotes and ch == open_quotes[-1]:
+            open_quotes.pop()
+            # 문장 전체가 종결 부호로 끝난 인용문이면 닫는 따옴표 뒤에서 분리 ("좋아요." 다음 문장)
+            if not open_quotes and not text[start:quote_start].strip() and text[i - 1] in TERMINATORS and (i + 1 == n or text[i + 1].isspace()):
+                sentences.append(text[start:i + 1].strip())
+                start = i + 1
+        elif ch in SYMMETRIC_QUOTES and (i == 0 or text[i - 1].isspace() or text[i - 1] in "(["):
+            if not open_quotes:
+                quote_start = i
+            open_quotes.append(ch)
+        elif ch in TERMINATORS and not open_quotes and not _is_decimal_point(text, i) and not _is_abbreviation(text, i):
+            end = i + 1
+            # 연속된 종결 부호(?!, ...)와 닫는 따옴표/괄호까지 포함
+            while end < n and (text[end] in TERMINATORS or text[end] in CLOSERS):
+                end += 1
+            if end == n or text[end].isspace():
+                sentences.append(text[start:end].strip())
+                start = end
+            i = end
+            continue
+        i += 1
+    tail = text[start:].strip()
+    if tail:
+        sentences.append(tail)
+
+    result = []
+    for sentence in sentences:
+        if sentence[-1] in TERMINATORS or sentence[-1] in CLOSERS:
+            # 문장 내부에 부호 없이 이어진 문장이 있으면 종결 어미로 추가 분리
+            body, mark = sentence.rstrip(TERMINATORS + CLOSERS), sentence[len(sentence.rstrip(TERMINATORS + CLOSERS)):]
+            parts = _split_by_endings(body) if body else []
+            if len(parts) > 1:
+                parts[-1] = parts[-1].rstrip(".") + mark
+                result.extend(parts)
+            else:
+                result.append(sentence)
+        else:
+            result.extend(_split_by_endings(sentence))
+    # 문장 안에 남은 줄바꿈은 공백으로
+    return [" ".join(s.split()) for s in result if s.strip()]
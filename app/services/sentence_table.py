@@ -0,0 +1,123 @@
+# 분석 파이프라인 공용 문장 테이블 (문장/점수를 NumPy 컬럼으로 보관)
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+# 점수가 없는 문장 (평가 실패 등)
+UNSCORED = -1
+
+
+class SentenceTable:
+    """
+    문장 리스트(dict)를 컬럼 단위로 보관해 반복 필터링/집계를 벡터 연산으로 처리
+    - 문장 본문은 하나의 문자열에 이어 붙이고 (char_start, char_len) 오프셋으로 접근
+    - score: int8 (0~3, 점수 없음은 UNSCORED)
+    - start_min / end_min: 회의 길이를 문장 수로 균등 분배한 추정 시각(분), 길이 정보 없으면 NaN
+    """
+
+    __slots__ = ("index", "char_start", "char_len", "score", "start_min", "end_min", "reasons", "_text")
+
+    def __init__(self, sentences: Sequence[str], scores: Sequence[Optional[int]], reasons: Sequence[Optional[str]] = None, duration_minutes: Optional[float] = None):
+        n = len(sentences)
+        self._text = "".join(sentences)
+        self.char_len = np.fromiter((len(s) for s in sentences), dtype=np.int32, count=n)
+        self.char_start = np.zeros(n, dtype=np.int64)
+        if n:
+            np.cumsum(self.char_len[:-1], out=self.char_start[1:])
+        self.index = np.arange(n, dtype=np.int32)
+        self.score = np.fromiter(
+            (s if s in (0, 1, 2, 3) else UNSCORED for s in scores), dtype=np.int8, count=n
+        )
+        self.reasons = list(reasons) if reasons is not None else [None] * n
+        if duration_minutes is not None and n:
+            per_sentence = duration_minutes / n
+            self.start_min = self.index * per_sentence
+            self.end_min = np.minimum((self.index + 1) * per_sentence, duration_minutes)
+        else:
+            self.start_min = np.full(n, np.nan)
+            self.end_min = np.full(n, np.nan)
+
+    @classmethod
+    def from_scores(cls, sentence_scores: Sequence[Dict[str, Any]], duration_minutes: Optional[float] = None) -> "SentenceTable":
+        rows = [s for s in sentence_scores if isinstance(s, dict)]
+        return cls(
+            [s.get("sentence") or "" for s in rows],
+            [s.get("score") for s in rows],
+            [s.get("reason") for s in rows],
+            duration_minutes,
+        )
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def sentence(self, i: int) -> str:
+        start = int(self.char_start[i])
+        return self._text[start:start + int(self.char_len[i])]
+
+    def sentences(self, mask: Optional[np.ndarray] = None) -> List[str]:
+        rows = self.index if mask is None else np.flatnonzero(mask)
+        return [self.sentence(i) for i in rows]
+
+    def records(self, mask: Optional[np.ndarray] = None) -> List[Dict[str, Any]]:
+        """
+        기존 sentence_scores 형식(dict 리스트)으로 변환 (프롬프트 구성용)
+        """
+        rows = self.index if mask is None else np.flatnonzero(mask)
+        return [
+            {
+                "index": int(i),
+                "sentence": self.sentence(i),
+                "score": int(self.score[i]) if self.score[i] != UNSCORED else None,
+                "reason": self.reasons[i],
+            }
+            for i in rows
+        ]
+
+    def score_between(self, low: int = 0, high: int = 3) -> np.ndarray:
+        # 점수 없는 문장은 항상 제외
+        return (self.score >= low) & (self.score <= high)
+
+    def score_histogram(self) -> np.ndarray:
+        """0~3점별 문장 수"""
+        scored = self.score[self.score != UNSCORED]
+        return np.bincount(scored, minlength=4)[:4]
+
+    def score_char_percent(self) -> Dict[int, float]:
+        """0~3점별 글자 수 비율(%) (점수 없는 문장 제외)"""
+        scored = self.score != UNSCORED
+        chars = np.bincount(self.score[scored], weights=self.char_len[scored], minlength=4)[:4]
+        total = chars.sum()
+        if not total:
+            return {score: 0 for score in range(4)}
+        return {score: round(float(chars[score] / total * 100), 1) for score in range(4)}
+
+    def runs(self, mask: np.ndarray) -> List[Tuple[int, int]]:
+        """mask가 연속으로 True인 구간 [(시작 index, 끝 index), ...]"""
+        padded = np.concatenate(([0], mask.astype(np.int8), [0]))
+        edges = np.flatnonzero(np.diff(padded))
+        return [(int(s), int(e) - 1) for s, e in zip(edges[::2], edges[1::2])]
+
+    def run_minutes(self, mask: np.ndarray) -> List[Tuple[float, float]]:
+        """
+        mask 연속 구간의 추정 시각(분) 범위, 맞닿거나 겹치는 구간은 병합
+        회의 길이 정보가 없으면 빈 리스트
+        """
+        runs = self.runs(mask)
+        if not runs or np.isnan(self.start_min[0]):
+            return []
+        merged: List[Tuple[float, float]] = []
+        for start, end in runs:
+            s = round(float(self.start_min[start]), 1)
+            e = round(float(self.end_min[end]), 1)
+            if merged and s <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], e))
+            else:
+                merged.append((s, e))
+        return merged
+
+
+def as_sentence_table(tag_result: Union[SentenceTable, Sequence[Dict[str, Any]]], duration_minutes: Optional[float] = None) -> SentenceTable:
+    # 기존 dict 리스트로 호출하는 경우도 지원
+    if isinstance(tag_result, SentenceTable):
+        return tag_result
+    return SentenceTable.from_scores(tag_result or [], duration_minutes)
@@ -0,0 +1,147 @@
+# LLM 구조화 출력 공용 레이어 (JSON schema / function calling + Pydantic 검증 + 1회 복구)
+# Agent에서는 llm_gateway.complete(schema=...)로 호출한다.
+import json
+from typing import Any, Dict, List, Optional, Type, TypeVar
+
+import openai
+from openai import AsyncOpenAI
+from pydantic import BaseModel, ValidationError
+
+from app.core.config import settings
+from app.services.llm_budget import record_usage
+
+T = TypeVar("T", bound=BaseModel)
+
+# response_format=json_schema(strict)를 지원하는 OpenAI 모델 접두어
+# 나머지 모델(gpt-4, gpt-4-turbo, Gemini 등)은 함수 호출(tool calling)을 강제해 같은 스키마로 받는다.
+JSON_SCHEMA_MODEL_PREFIXES = ("gpt-4o", "gpt-4.1", "o1", "o3", "o4")
+
+
+def supports_json_schema(model: str) -> bool:
+    return (model or "").startswith(JSON_SCHEMA_MODEL_PREFIXES)
+
+
+def _validate(schema: Type[T], raw: Optional[str]) -> T:
+    if not raw:
+        raise ValueError("빈 응답")
+    return schema.model_validate_json(raw)
+
+
+async def repair_structured_output(schema: Type[T], raw: Optional[str], error: Any, stage: str, client: AsyncOpenAI) -> Optional[T]:
+    """
+    스키마 검증에 실패한 응답을 저렴한 모델로 한 번만 고쳐 받는다.
+    원래 작업을 다시 하지 않고, 이미 받은 내용을 스키마에 맞게 옮기기만 하도록 지시한다.
+    """
+    if not raw:
+        return None
+    try:
+        response = await client.beta.chat.completions.parse(
+            model=settings.STRUCTURED_REPAIR_MODEL,
+            messages=[
+                {
+                    "role": "system",
+                    "content": "너는 JSON 형식 교정기야. 주어진 출력의 내용은 바꾸지 말고, 주어진 스키마에 맞는 JSON으로만 옮겨 적어.",
+                },
+                {
+                    "role": "user",
+                    "content": f"[검증 오류]\n{error}\n\n[원래 출력]\n{raw}",
+                },
+            ],
+            response_format=schema,
+            temperature=0,
+        )
+        record_usage(f"{stage}_repair", response)
+        message = response.choices[0].message
+        if message.refusal or message.parsed is None:
+            return None
+        print(f"[structured_output] {stage} 응답 복구 성공", flush=True)
+        return message.parsed
+    except Exception as e:
+        print(f"[structured_output] {stage} 응답 복구 실패: {e}", flush=True)
+        return None
+
+
+def structured_request(schema: Type[BaseModel], model: str) -> Dict[str, Any]:
+    """
+    OpenAI 호출 인자
+    - json_schema 지원 모델: response_format=json_schema(strict)
+    - 그 외: 스키마와 같은 함수 하나를 tool_choice로 강제
+    """
+    tool = openai.pydantic_function_tool(schema)
+    if supports_json_schema(model):
+        return {
+            "response_format": {
+                "type": "json_schema",
+                "json_schema": {
+                    "name": tool["function"]["name"],
+                    "schema": tool["function"]["parameters"],
+                    "strict": True,
+                },
+            },
+        }
+    return {
+        "tools": [tool],
+        "tool_choice": {"type": "function", "function": {"name": tool["function"]["name"]}},
+    }
+
+
+async def parse_structured(schema: Type[T], raw: Optional[str], model: str, stage: str, client: AsyncOpenAI) -> Optional[T]:
+    """응답 JSON 검증, 실패 시 repair_structured_output으로 1회 복구 (그래도 실패하면 None)"""
+    try:
+        return _validate(schema, raw)
+    except (ValidationError, ValueError) as e:
+        print(f"[structured_output] {stage} 스키마 검증 실패 (model={model}): {e}", flush=True)
+        return await repair_structured_output(schema, raw, e, stage, client)
+
+
+async def openai_structured(
+    schema: Type[T],
+    messages: List[Dict[str, Any]],
+    model: str,
+    stage: str,
+    client: AsyncOpenAI,
+    **kwargs,
+) -> Optional[T]:
+    """
+    OpenAI SDK 호출을 구조화 출력으로 수행하고 Pydantic 모델로 검증 (structured_request 참고)
+
+    검증 실패 시 repair_structured_output으로 1회 복구, 그래도 실패하면 None
+    429(rate limit)는 호출자의 동시성 제어가 처리하도록 그대로 전달한다.
+    """
+    request = structured_request(schema, model)
+    response = await client.chat.completions.create(model=model, messages=messages, **request, **kwargs)
+    record_usage(stage, response)
+
+    message = response.choices[0].message
+    if message.tool_calls:
+        raw = message.tool_calls[0].function.arguments
+    else:
+        raw = message.content
+    return await parse_structured(schema, raw, model, stage, client)
+
+
+async def langchain_structured(llm, schema: Type[T], prompt: Any, stage: str, repair_client: AsyncOpenAI) -> Optional[T]:
+    """
+    LangChain 채팅 모델(ChatOpenAI, ChatGoogleGenerativeAI)을 구조화 출력으로 호출
+    with_structured_output(include_raw=True)로 원본 메시지를 함께 받아 토큰 사용량을 기록한다.
+    """
+    model_name = getattr(llm, "model_name", None) or getattr(llm, "model", "") or ""
+    method = "json_schema" if supports_json_schema(str(model_name)) else "function_calling"
+    structured_llm = llm.with_structured_output(schema, method=method, include_raw=True)
+    result = await structured_llm.ainvoke(prompt)
+
+    raw_message = result.get("raw")
+    record_usage(stage, raw_message)
+    if result.get("parsed") is not None:
+        return result["parsed"]
+
+    error = result.get("parsing_error") or "구조화 출력 없음"
+    print(f"[structured_output] {stage} 스키마 검증 실패 (model={model_name}): {error}", flush=True)
+    raw = None
+    if raw_message is not None:
+        tool_calls = getattr(raw_message, "tool_calls", None) or []
+        if tool_calls:
+            raw = json.dumps(tool_calls[0].get("args", {}), ensure_ascii=False)
+        elif raw_message.content:
+            raw = str(raw_message.content)
+    return await repair_structured_output(schema, raw, error, stage, repair_client)
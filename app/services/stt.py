@@ -3,23 +3,25 @@ import torch
 import numpy as np
 from transformers.models.whisper import WhisperProcessor, WhisperForConditionalGeneration
 from pydub import AudioSegment
+import io
 import os
 import math
+import wave
 # import openai
 import re
 import tempfile
 import asyncio
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import aiofiles
-from openai import AsyncOpenAI
-
-openai_client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+from app.services.llm_gateway import complete, get_openai_client
+from app.services.llm_telemetry import track_llm_call
+from app.services.sentence_splitter import split_korean_sentences
 
 def split_sentences_with_overlap(text):
     chunk_size = 7
     stride = 2
-    sentences = re.split(r'(?<=[.!?])["”’]?[\s\n]+', text.strip())
-    sentences = [s.strip() for s in sentences if s.strip()]
+    # tagging 단계와 같은 분리기를 써야 청크 간 겹치는 2문장(stride)이 정확히 제거됨
+    sentences = split_korean_sentences(text)
     chunks = []
     n = len(sentences)
     start = 0
@@ -62,18 +64,22 @@ def split_audio_to_chunks(file_path: str, chunk_length_sec: int = 150, overlap_s
 
 async def transcribe_chunk(chunk_path: str) -> str:
     """
-    Whisper API로 청크 파일을 변환하는 함수 (AsyncOpenAI 사용)
+    Whisper API로 청크 파일을 변환하는 함수 (게이트웨이 공용 AsyncOpenAI 사용)
     """
     try:
         async with aiofiles.open(chunk_path, "rb") as audio_file:
             audio_data = await audio_file.read()
 
         # Whisper에 오디오 파일 전달 (주의: file은 바이너리 객체로 전달해야 함)
-        transcript = await openai_client.audio.transcriptions.create(
-            model="whisper-1",
-            file=(os.path.basename(chunk_path), audio_data),
-            response_format="text"
-        )
+        # 청크는 wav로 저장되므로 헤더로 길이 계산 (비용 집계용)
+        with wave.open(io.BytesIO(audio_data)) as wav:
+            audio_seconds = wav.getnframes() / wav.getframerate()
+        async with track_llm_call("transcription", "openai", "whisper-1", audio_seconds=audio_seconds):
+            transcript = await get_openai_client().audio.transcriptions.create(
+                model="whisper-1",
+                file=(os.path.basename(chunk_path), audio_data),
+                response_format="text"
+            )
         return str(transcript).strip()
 
     except Exception as e:
@@ -118,16 +124,9 @@ async def gpt_refine_text(raw_text: str) -> str:
         "4. 의미가 불분명한 부분은 생략하지 말고 그대로 유지해주세요\n"
         "\n텍스트:\n" + raw_text
     )
-    # openai_client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
     try:
-        response = await openai_client.chat.completions.create(
-            model="gpt-4",
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.3,
-            max_tokens=4096,
-        )
-        refined = response.choices[0].message.content.strip()
-        return refined
+        response = await complete(prompt, stage="refine", temperature=0.3, max_tokens=4096)
+        return response.text
     except Exception as e:
         return f"[GPT 후처리 오류] {e}\n{raw_text}"
 
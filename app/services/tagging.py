@@ -3,21 +3,39 @@ import os
 import asyncio
 import re
 import json
+import math
 from app.services.lang_summary import lang_summary
 from app.services.lang_feedback import feedback_agent
 from app.services.lang_role import assign_roles
 from app.services.lang_todo import extract_todos
 from app.services.lang_previewmeeting import lang_previewmeeting
-from typing import List, Dict, Any
-from app.crud.crud_meeting import insert_summary_log, insert_task_assign_log, insert_feedback_log, get_feedback_type_map, insert_prompt_log
+from typing import List, Dict, Any, Optional
+from app.crud.crud_meeting import insert_summary_log, insert_task_assign_log, insert_feedback_log, get_feedback_type_map, insert_prompt_log, upsert_meeting_duplicate_speech, upsert_meeting_users
 from sqlalchemy.orm import Session
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.services.notify_email_service import send_meeting_email
-from openai import AsyncOpenAI
+from app.services.adaptive_concurrency import scoring_limiter, run_sliding_window, is_rate_limit_error
 from app.services.calendar_service.calendar_crud import insert_calendar_from_task
+from app.services.llm_budget import get_current_budget, start_meeting_budget
+from app.services.meeting_events import publish_meeting_event
+from app.services.sentence_splitter import split_korean_sentences
+from app.services.relevance_triage import triage_sentences, triage_agreement
+from app.services.relevance_classifier import load_classifier, classify_sentences
+from app.services.score_cache import score_cache, make_score_key
+from app.services.sentence_table import SentenceTable
+from app.services.duplicate_speech import detect_duplicate_speech
+from app.services.llm_gateway import complete
+from app.services.model_routing import route_model
+from app.schemas.agent_output import SentenceScoreOutput, BatchSentenceScoreOutput, ScoreReasonOutput
+from app.core.config import settings
 from datetime import datetime
 
-openai_client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+# 문장 평가 1회 호출당 예상 토큰 수 (프롬프트 + 응답, 예산 사전 추정용)
+SCORING_TOKENS_PER_CALL = 350
+# 묶음 평가 시 문장 1개당 예상 토큰 수 (번호 + 문장 + 응답 항목)
+SCORING_TOKENS_PER_BATCHED_SENTENCE = 90
+# 묶음 앞뒤로 함께 보내는 문맥 문장 수 (평가 대상 아님)
+SCORING_CONTEXT_SENTENCES = 2
 
 async def save_prompt_log(db: AsyncSession, meeting_id: str, agent_type: str, prompt_output: Any, input_date: datetime = None, output_date: datetime = None):
     """
@@ -57,9 +75,10 @@ async def save_prompt_log(db: AsyncSession, meeting_id: str, agent_type: str, pr
     except Exception as e:
         print(f"[tagging.py] {agent_type.upper()} 프롬프트 로그 저장 오류: {e}", flush=True)
 
-async def gpt_score_sentence_async(subject, prev_sent, target_sent, next_sent):
+async def gpt_score_sentence_async(subject, prev_sent, target_sent, next_sent, model: Optional[str] = None):
     """
     GPT API를 비동기로 사용해 대상 문장을 0~3단계로 평가 (openai 1.x 최신버전 대응)
+    model: 평가 모델 (토큰 예산 부족 시 저렴한 모델로 교체됨, None이면 scoring 단계 라우팅)
     """
     prompt = (
         f'회의 주제: "{subject}"\n'
@@ -71,26 +90,257 @@ async def gpt_score_sentence_async(subject, prev_sent, target_sent, next_sent):
         "1: 약간 관련 있음 (빙빙 돌다 회의로 연결 가능)\n"
         "2: 관련 있음\n"
         "3: 핵심 관련\n"
-        "아래와 같은 JSON 형식으로만 답변해줘:\n"
-        '{\n  "score": (0~3 숫자),\n  "reason": "간단한 이유"\n}'
+        "점수(score)와 간단한 이유(reason)를 답변해줘."
     )
     try:
-        response = await openai_client.chat.completions.create(
-            model="gpt-4-turbo",        #gpt-3.5-turbo는 성능이 많이 떨어짐.
-            messages=[{"role": "user", "content": prompt}],
+        result = await complete(
+            prompt,
+            model=model,        #gpt-3.5-turbo는 성능이 많이 떨어짐.
+            stage="scoring",
+            schema=SentenceScoreOutput,
             temperature=0.2,
             max_tokens=256,
         )
-        content = response.choices[0].message.content.strip()
-        match = re.search(r'\{.*\}', content, re.DOTALL)
-        if match:
-            return json.loads(match.group())
-        else:
-            return {"score": None, "reason": "파싱 실패: " + content}
+        if result is None:
+            return {"score": None, "reason": "파싱 실패: 구조화 출력 검증 실패"}
+        return result.model_dump()
     except Exception as e:
         print(f"[gpt_score_sentence_async] 오류: {e}", flush=True)
         return {"score": None, "reason": f"API 오류: {e}"}
 
+def _collect_batch_scores(result: Optional[BatchSentenceScoreOutput], indices: List[int]) -> Dict[int, Dict[str, Any]]:
+    """
+    묶음 평가 구조화 응답을 {index: {"score", "reason"}}로 변환
+    요청하지 않은 번호는 버린다. (점수 범위는 스키마에서 검증됨)
+    """
+    if result is None:
+        return {}
+    expected = set(indices)
+    return {
+        item.index: {"score": item.score, "reason": item.reason}
+        for item in result.scores
+        if item.index in expected
+    }
+
+def _format_scoring_window(sentences: List[str], indices: List[int]) -> str:
+    """
+    평가 대상 문장과 앞뒤 SCORING_CONTEXT_SENTENCES개 문맥 문장을 [번호]와 함께 나열
+    떨어진 구간 사이는 '...'으로 표시
+    """
+    targets = set(indices)
+    shown = sorted({
+        i
+        for idx in targets
+        for i in range(max(0, idx - SCORING_CONTEXT_SENTENCES), min(len(sentences), idx + SCORING_CONTEXT_SENTENCES + 1))
+    })
+    lines = []
+    for pos, idx in enumerate(shown):
+        if pos > 0 and idx != shown[pos - 1] + 1:
+            lines.append("...")
+        marker = "" if idx in targets else " (문맥)"
+        lines.append(f'[{idx}]{marker} {sentences[idx]}')
+    return "\n".join(lines)
+
+SCORING_RUBRIC = (
+    "0: 전혀 관련 없음\n"
+    "1: 약간 관련 있음 (빙빙 돌다 회의로 연결 가능)\n"
+    "2: 관련 있음\n"
+    "3: 핵심 관련\n"
+)
+
+async def gpt_score_sentences_batch_async(subject: str, sentences: List[str], indices: List[int], model: Optional[str] = None) -> Dict[int, Dict[str, Any]]:
+    """
+    여러 문장을 번호를 붙여 한 번의 GPT 호출로 0~3단계 평가
+    indices: 평가할 문장 번호 (sentences 기준, 연속이 아니어도 됨)
+    각 대상 문장의 앞뒤 SCORING_CONTEXT_SENTENCES개 문장은 문맥으로만 함께 전달한다.
+    반환: {index: {"score": int, "reason": str}} (응답에서 누락/오류인 번호는 빠짐)
+    """
+    if not indices:
+        return {}
+    prompt = (
+        f'회의 주제: "{subject}"\n'
+        "\n아래는 회의 중 발화된 문장 목록이야. 각 줄 앞의 [번호]가 문장 번호이고, '(문맥)' 표시가 있는 문장은 참고용이라 평가하지 마.\n"
+        + _format_scoring_window(sentences, indices) +
+        "\n\n'(문맥)' 표시가 없는 모든 문장에 대해, 앞뒤 문장을 참고하여 회의 주제와 얼마나 관련 있는지 0~3점으로 평가해줘.\n"
+        + SCORING_RUBRIC +
+        f"평가 대상 문장 번호: {sorted(indices)}\n"
+        "평가 대상 문장마다 하나씩 빠짐없이 scores에 문장 번호(index), 점수(score), 간단한 이유(reason)를 담아 답변해줘."
+    )
+    try:
+        result = await complete(
+            prompt,
+            model=model,
+            stage="scoring",
+            schema=BatchSentenceScoreOutput,
+            temperature=0.2,
+            max_tokens=min(4096, 64 + 60 * len(indices)),
+        )
+        return _collect_batch_scores(result, indices)
+    except Exception as e:
+        if is_rate_limit_error(e):
+            # 429는 동시성 제어기가 감지해 동시 요청 수를 줄이고 재시도하도록 전달
+            raise
+        print(f"[gpt_score_sentences_batch_async] 오류: {e}", flush=True)
+        return {}
+
+def _digit_tokens(response) -> List[tuple]:
+    """
+    응답 토큰 중 0~3 숫자 토큰과 그 확률 [(score, probability), ...]
+    logprobs가 없으면 본문 숫자만 사용 (확률 None)
+    """
+    choice = response.choices[0]
+    logprobs = getattr(choice, "logprobs", None)
+    if logprobs is not None and getattr(logprobs, "content", None):
+        digits = []
+        for token in logprobs.content:
+            value = token.token.strip(" ,\n")
+            if value in ("0", "1", "2", "3"):
+                digits.append((int(value), round(math.exp(token.logprob), 4)))
+            elif any(ch.isdigit() for ch in value):
+                # 여러 숫자가 한 토큰으로 묶이면 위치를 신뢰할 수 없음
+                return []
+        return digits
+    return [(int(d), None) for d in re.findall(r'[0-3]', choice.message.content or "")]
+
+async def gpt_score_sentences_digits_async(subject: str, sentences: List[str], indices: List[int], model: Optional[str] = None) -> Dict[int, Dict[str, Any]]:
+    """
+    이유 없이 점수 숫자만 받는 묶음 평가 (문장당 출력 토큰 약 2개)
+    응답은 대상 문장 순서대로 '0,3,2' 형식이며, 숫자 토큰의 logprob를 확신도로 사용
+    반환: {index: {"score": int, "reason": None, "confidence": float | None}}
+    숫자 개수가 대상 문장 수와 다르면 위치를 맞출 수 없어 빈 dict (재시도 대상)
+    """
+    if not indices:
+        return {}
+    ordered = sorted(indices)
+    prompt = (
+        f'회의 주제: "{subject}"\n'
+        "\n아래는 회의 중 발화된 문장 목록이야. 각 줄 앞의 [번호]가 문장 번호이고, '(문맥)' 표시가 있는 문장은 참고용이라 평가하지 마.\n"
+        + _format_scoring_window(sentences, ordered) +
+        "\n\n'(문맥)' 표시가 없는 문장마다, 앞뒤 문장을 참고하여 회의 주제와 얼마나 관련 있는지 0~3점으로 평가해줘.\n"
+        + SCORING_RUBRIC +
+        f"평가 대상 문장 번호(이 순서대로 {len(ordered)}개): {ordered}\n"
+        "설명 없이 점수 숫자만 쉼표로 구분해 한 줄로 답변해줘. 예: 0,3,2"
+    )
+    try:
+        response = await complete(
+            prompt,
+            model=model,
+            stage="scoring",
+            temperature=0,
+            max_tokens=2 * len(ordered) + 4,
+            logprobs=True,
+        )
+        digits = _digit_tokens(response.raw)
+        if len(digits) != len(ordered):
+            print(f"[gpt_score_sentences_digits_async] 점수 개수 불일치: 기대 {len(ordered)}, 응답 {len(digits)}", flush=True)
+            return {}
+        return {
+            idx: {"score": score, "reason": None, "confidence": confidence}
+            for idx, (score, confidence) in zip(ordered, digits)
+        }
+    except Exception as e:
+        if is_rate_limit_error(e):
+            raise
+        print(f"[gpt_score_sentences_digits_async] 오류: {e}", flush=True)
+        return {}
+
+async def gpt_score_sentence_digit_async(subject: str, sentences: List[str], index: int, model: Optional[str] = None) -> Dict[str, Any]:
+    """
+    단일 문장 숫자 평가 (max_tokens=1), 상위 logprob로 확신도 계산
+    """
+    prompt = (
+        f'회의 주제: "{subject}"\n'
+        f'앞 문장: "{sentences[index-1] if index > 0 else ""}"\n'
+        f'대상 문장: "{sentences[index]}"\n'
+        f'다음 문장: "{sentences[index+1] if index < len(sentences)-1 else ""}"\n'
+        "\n대상 문장이 회의 주제와 얼마나 관련 있는지 0~3점으로 평가해줘.\n"
+        + SCORING_RUBRIC +
+        "숫자 하나만 답변해줘."
+    )
+    try:
+        response = await complete(
+            prompt,
+            model=model,
+            stage="scoring",
+            temperature=0,
+            max_tokens=1,
+            logprobs=True,
+            top_logprobs=4,
+        )
+        digits = _digit_tokens(response.raw)
+        if len(digits) != 1:
+            return {"score": None, "reason": "파싱 실패: " + response.text}
+        score, confidence = digits[0]
+        return {"score": score, "reason": None, "confidence": confidence}
+    except Exception as e:
+        print(f"[gpt_score_sentence_digit_async] 오류: {e}", flush=True)
+        return {"score": None, "reason": f"API 오류: {e}"}
+
+async def generate_score_reasons(subject: str, sentences: List[str], scored: Dict[int, int], model: Optional[str] = None) -> Dict[int, str]:
+    """
+    이미 매겨진 점수에 대한 간단한 이유를 한 번의 호출로 생성 (확신도 낮은 문장, 사용자가 조회한 문장용)
+    scored: {index: score}
+    """
+    if not scored:
+        return {}
+    indices = sorted(scored)
+    prompt = (
+        f'회의 주제: "{subject}"\n'
+        "\n아래는 회의 중 발화된 문장 목록이야. '(문맥)' 표시가 있는 문장은 참고용이야.\n"
+        + _format_scoring_window(sentences, indices) +
+        "\n\n각 문장은 회의 주제와의 관련도를 0~3점으로 평가받았어.\n"
+        + SCORING_RUBRIC +
+        "점수: " + ", ".join(f"[{idx}] {scored[idx]}점" for idx in indices) + "\n"
+        "각 문장이 그 점수를 받은 이유를 한 문장으로 설명해서 reasons에 문장 번호(index)와 이유(reason)를 담아 답변해줘."
+    )
+    try:
+        result = await complete(
+            prompt,
+            model=model,
+            stage="scoring_reason",
+            schema=ScoreReasonOutput,
+            temperature=0.2,
+            max_tokens=min(4096, 64 + 60 * len(indices)),
+        )
+        if result is None:
+            return {}
+        return {item.index: item.reason for item in result.reasons if item.index in scored and item.reason}
+    except Exception as e:
+        print(f"[generate_score_reasons] 오류: {e}", flush=True)
+        return {}
+
+async def score_sentence_window(subject: str, sentences: List[str], indices: List[int], model: Optional[str] = None) -> Dict[int, Dict[str, Any]]:
+    """
+    묶음 평가 + 누락 번호 재시도
+    SCORING_BATCH_MAX_RETRIES번까지 누락된 번호만 다시 묶어 요청하고,
+    그래도 남은 문장은 기존 단일 문장 평가로 채운다.
+    """
+    digits_mode = settings.SCORING_MODE == "digits"
+    score_batch = gpt_score_sentences_digits_async if digits_mode else gpt_score_sentences_batch_async
+    scores = await score_batch(subject, sentences, indices, model=model)
+    missing = [idx for idx in indices if idx not in scores]
+    retries = 0
+    while missing and retries < settings.SCORING_BATCH_MAX_RETRIES:
+        retries += 1
+        print(f"[score_sentence_window] 누락 문장 재평가 ({retries}회차): {missing}", flush=True)
+        scores.update(await score_batch(subject, sentences, missing, model=model))
+        missing = [idx for idx in indices if idx not in scores]
+    if missing:
+        results = await asyncio.gather(*[
+            gpt_score_sentence_digit_async(subject, sentences, idx, model=model) if digits_mode else
+            gpt_score_sentence_async(
+                subject,
+                sentences[idx-1] if idx > 0 else "",
+                sentences[idx],
+                sentences[idx+1] if idx < len(sentences)-1 else "",
+                model=model
+            )
+            for idx in missing
+        ])
+        for idx, score_result in zip(missing, results):
+            scores[idx] = score_result
+    return scores
+
 def deduplicate_sentences(sentences):
     deduped = []
     prev = None
@@ -103,6 +353,7 @@ def deduplicate_sentences(sentences):
 async def gpt_split_sentences(text: str) -> list:
     """
     GPT API를 사용해 입력 텍스트를 문장 단위로 분리하여 리스트로 반환
+    SENTENCE_SPLITTER=llm 일 때만 사용 (기본은 split_korean_sentences)
     """
     prompt = (
         "다음 한국어 텍스트를 문장 단위로 분리해서 각 문장을 한 줄씩 줄바꿈으로만 나열해줘. "
@@ -111,13 +362,8 @@ async def gpt_split_sentences(text: str) -> list:
         "텍스트:\n" + text
     )
     try:
-        response = await openai_client.chat.completions.create(
-            model="gpt-4-turbo",
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.2,
-            max_tokens=1024,
-        )
-        content = response.choices[0].message.content.strip()
+        response = await complete(prompt, stage="split", temperature=0.2, max_tokens=1024)
+        content = response.text
         # 줄바꿈으로만 분리, 불필요한 문자 제거 없이 문장만 리스트로 반환
         lines = [line.strip() for line in content.splitlines() if line.strip()]
         return lines
@@ -131,11 +377,18 @@ async def tag_chunks_async(project_name: str, subject: str, chunks: list, attend
     print(f"[tag_chunks] 전달받은 agenda: {agenda}", flush=True)
     print(f"[tag_chunks] 전달받은 meeting_date: {meeting_date}", flush=True)
     print(f"[tag_chunks] 전달받은 chunks: {chunks}", flush=True)
+    # 회의 단위 토큰 예산 (백그라운드 작업에서 설정하지 않은 경우 기본 예산 사용)
+    budget = get_current_budget()
+    if budget is None:
+        budget = start_meeting_budget(meeting_id=meeting_id)
     chunk_sentences = []
     for idx, chunk in enumerate(chunks):
         print(f"  청크 {idx+1}: {chunk}", flush=True)
         try:
-            sentences = await gpt_split_sentences(chunk)
+            if settings.SENTENCE_SPLITTER == "llm":
+                sentences = await gpt_split_sentences(chunk)
+            else:
+                sentences = split_korean_sentences(chunk)
             if idx == 0:
                 used_sentences = sentences
             else:
@@ -152,41 +405,161 @@ async def tag_chunks_async(project_name: str, subject: str, chunks: list, attend
         print(f"  [{idx+1}] {sent}", flush=True)
     deduped_sentences = deduplicate_sentences(all_sentences)
 
-    # 문장별 0~3단계 평가 (7개씩 비동기 병렬)
+    # 로컬 분류기(학습된 경우) 또는 임베딩 1차 분류로 확실한 문장은 바로 점수를 정하고 나머지만 LLM 평가
+    triage = None
+    if settings.RELEVANCE_SCORER == "local":
+        classifier = load_classifier(budget.company_id)
+        if classifier is not None:
+            triage = await classify_sentences(classifier, subject, agenda, all_sentences)
+        else:
+            print(f"[tag_chunks] 학습된 로컬 분류기 없음 (company_id={budget.company_id}), LLM 평가로 진행", flush=True)
+    if triage is None and settings.RELEVANCE_TRIAGE_ENABLED:
+        triage = await triage_sentences(subject, agenda, all_sentences)
+    llm_indices = triage["llm_indices"] if triage else list(range(len(all_sentences)))
+
+    # 문장별 0~3단계 평가 (SCORING_BATCH_SIZE개씩 묶어 요청)
+    # 슬라이딩 윈도우로 항상 N개 요청을 유지하고, N은 지연/429에 따라 AIMD로 조절
+    batch_size = max(1, settings.SCORING_BATCH_SIZE)
+    windows = [llm_indices[start:start + batch_size] for start in range(0, len(llm_indices), batch_size)]
+    scoring_state = {"model": route_model("scoring"), "remaining": len(llm_indices)}
+
+    async def score_window(window):
+        # 남은 문장 평가 비용까지 고려해 예산이 부족하면 저렴한 모델로 전환
+        projected_tokens = scoring_state["remaining"] * SCORING_TOKENS_PER_BATCHED_SENTENCE
+        if budget.should_degrade("cheap_scoring_model", projected_tokens=projected_tokens):
+            scoring_state["model"] = route_model("scoring_fallback")
+        model = scoring_state["model"]
+        # 같은 주제/문맥/문장을 같은 평가기로 평가한 적이 있으면 캐시 사용
+        keys = {idx: make_score_key(subject, all_sentences, idx, model, SCORING_CONTEXT_SENTENCES) for idx in window}
+        cached = await score_cache.get_many(keys.values())
+        window_scores = {idx: {**cached[key], "cached": True} for idx, key in keys.items() if key in cached}
+        uncached = [idx for idx in window if idx not in window_scores]
+        if uncached:
+            new_scores = await score_sentence_window(subject, all_sentences, uncached, model=model)
+            window_scores.update(new_scores)
+            await score_cache.put_many({keys[idx]: value for idx, value in new_scores.items()}, model=model)
+        scoring_state["remaining"] -= len(window)
+        return window_scores
+
+    window_results = await run_sliding_window(windows, score_window, scoring_limiter)
+    llm_scores = {}
+    for window_scores in window_results:
+        llm_scores.update(window_scores or {})
+    triage_stats = triage_agreement(triage, llm_scores) if triage else None
+    cache_hits = sum(1 for value in llm_scores.values() if value.get("cached"))
+    print(f"[tag_chunks] 문장 점수 캐시 적중 {cache_hits}/{len(llm_indices)}", flush=True)
     sentence_scores = []
-    batch_size = 7
-    i = 0
-    while i < len(all_sentences):
-        tasks = []
-        for j in range(i, min(i + batch_size, len(all_sentences))):
-            prev_sent = all_sentences[j-1] if j > 0 else ""
-            next_sent = all_sentences[j+1] if j < len(all_sentences)-1 else ""
-            tasks.append(gpt_score_sentence_async(subject, prev_sent, all_sentences[j], next_sent))
+    for idx, sentence in enumerate(all_sentences):
+        # LLM이 평가한 문장(검증 샘플 포함)은 LLM 점수 우선
+        if idx in llm_scores:
+            score_result = llm_scores[idx]
+            source = "cache" if score_result.get("cached") else "llm"
+        elif triage and idx in triage["scores"]:
+            score_result, source = triage["scores"][idx], triage["source"]
+        else:
+            score_result, source = {}, "llm"
+        sentence_scores.append({
+            "index": idx,
+            "sentence": sentence,
+            "score": score_result.get("score"),
+            "reason": score_result.get("reason"),
+            "source": source,
+            "confidence": score_result.get("confidence")
+        })
+
+    # 숫자 평가 모드에서는 이유를 생략하므로, 확신도가 낮은 문장만 이유를 한 번에 생성
+    # (캐시 적중 문장도 저장된 확신도로 판단, 확신도 저장 전에 캐시된 항목은 확신도가 없어 대상에서 제외)
+    # (나머지는 사용자가 조회할 때 /meetings/sentence-reason 에서 생성)
+    low_confidence = {
+        s["index"]: s["score"]
+        for s in sentence_scores
+        if s["reason"] is None and s["score"] is not None
+        and s["confidence"] is not None and s["confidence"] < settings.SCORING_REASON_CONFIDENCE
+    }
+    if low_confidence:
+        reason_batches = [dict(list(low_confidence.items())[i:i + batch_size]) for i in range(0, len(low_confidence), batch_size)]
+        reason_results = await run_sliding_window(
+            reason_batches,
+            lambda batch: generate_score_reasons(subject, all_sentences, batch),
+            scoring_limiter
+        )
+        for reasons in reason_results:
+            for idx, reason in (reasons or {}).items():
+                sentence_scores[idx]["reason"] = reason
+        print(f"[tag_chunks] 확신도 낮은 문장 {len(low_confidence)}개 이유 생성", flush=True)
+
+    # 요약/피드백/할 일 agent가 공유하는 컬럼형 문장 테이블 (한 번만 구성)
+    sentence_table = SentenceTable.from_scores(sentence_scores, meeting_duration_minutes)
+
+    # 중복 발언 감지 (LLM 없이 MinHash/LSH + 임베딩 확인, 결과는 대시보드 집계용으로 회의별 저장)
+    duplicate_speech = None
+    if settings.DUPLICATE_SPEECH_DETECTION:
         try:
-            results = await asyncio.gather(*tasks)
-            for k, score_result in enumerate(results):
-                idx = i + k
-                sentence_scores.append({
-                    "index": idx,
-                    "sentence": all_sentences[idx],
-                    "score": score_result.get("score"),
-                    "reason": score_result.get("reason")
-                })
+            duplicate_report = await detect_duplicate_speech(sentence_table)
+            duplicate_speech = duplicate_report.to_record(sentence_table)
+            print(f"[tag_chunks] 중복 발언 감지: 후보 {duplicate_report.candidate_pairs}쌍 → 중복 {duplicate_speech['duplicate_pairs']}쌍, 되풀이 문장 {duplicate_speech['duplicate_sentences']}개 ({duplicate_speech['method']})", flush=True)
         except Exception as e:
-            print(f"[tag_chunks] 문장 평가 오류: {e}", flush=True)
-        i += batch_size
+            print(f"[tag_chunks] 중복 발언 감지 오류: {e}", flush=True)
+
+    if meeting_id:
+        await publish_meeting_event(meeting_id, "scoring", data={"sentence_count": len(sentence_scores)})
 
     print("[tag_chunks] 문장별 평가 결과:", flush=True)
     for s in sentence_scores:
         print(f"  [{s['index']+1}] 점수: {s['score']} / 이유: {s['reason']} / 문장: {s['sentence']}", flush=True)
 
+    # 각 agent가 끝나는 즉시 결과를 저장하고 단계 이벤트 발행 (클라이언트가 단계별로 결과를 조회)
+    saved_stages = set()
+
+    async def save_summary(summary_result):
+        if db is not None:
+            # print(f"[tagging.py] insert_summary_log 호출: summary_result={summary_result}", flush=True)
+            await insert_summary_log(db, summary_result["summary"] if isinstance(summary_result, dict) and "summary" in summary_result else summary_result, meeting_id)
+            await publish_meeting_event(meeting_id, "summary")
+        saved_stages.add("summary")
+
+    async def save_feedback(feedback_result):
+        if db is not None:
+            # 피드백 유형 매핑 및 저장
+            feedback_type_map = await get_feedback_type_map(db)
+            if isinstance(feedback_result, dict):
+                for feedbacktype_name, feedback_detail in feedback_result.items():
+                    feedbacktype_id = feedback_type_map.get(feedbacktype_name, '')
+                    if feedbacktype_id:
+                        await insert_feedback_log(db, feedback_detail, feedbacktype_id, meeting_id)
+                    else:
+                        print(f"Unknown feedbacktype_name: {feedbacktype_name}", flush=True)
+            else:
+                await insert_feedback_log(db, feedback_result, '', meeting_id)
+            if meeting_id and duplicate_speech is not None:
+                await upsert_meeting_duplicate_speech(db, meeting_id, duplicate_speech)
+            await publish_meeting_event(meeting_id, "feedback")
+        saved_stages.add("feedback")
+
+    async def save_todos(assigned_roles):
+        if db is not None:
+            # print(f"[tagging.py] insert_task_assign_log 호출: assigned_roles={assigned_roles}", flush=True)
+            task_assign_log = await insert_task_assign_log(db, assigned_roles or {}, meeting_id)
+            if hasattr(task_assign_log, '__dict__'):
+                print(f"[tagging.py] insert_task_assign_log 결과: {task_assign_log.__dict__}", flush=True)
+            else:
+                print(f"[tagging.py] insert_task_assign_log 결과: {task_assign_log}", flush=True)
+            print(f"[tagging.py] updated_task_assign_contents: {getattr(task_assign_log, 'updated_task_assign_contents', None)}", flush=True)
+            
+            # 캘린더 insert
+            calendar_log = await insert_calendar_from_task(db, task_assign_log)
+            print(f"[tagging.py] insert_calendar_from_task 결과: {calendar_log}", flush=True)
+            await publish_meeting_event(meeting_id, "todo")
+        saved_stages.add("todo")
+
     try:
         # Summary Agent 시작 시간 기록
         summary_start_time = datetime.now()
         print(f"[tagging.py] Summary Agent 시작: {summary_start_time}", flush=True)
         
         # lang_summary 호출
-        summary_result = await lang_summary(subject, chunks, sentence_scores, attendees_list, agenda, meeting_date) if attendees_list is not None else await lang_summary(subject, chunks, sentence_scores, None, agenda, meeting_date)
+        summary_result = await lang_summary(subject, chunks, sentence_table, attendees_list, agenda, meeting_date) if attendees_list is not None else await lang_summary(subject, chunks, sentence_table, None, agenda, meeting_date)
+        await save_summary(summary_result)
         
         # lang_previewmeeting 호출 (예정된 회의 추출)
         if db is not None and meeting_id is not None:
@@ -251,29 +624,24 @@ async def tag_chunks_async(project_name: str, subject: str, chunks: list, attend
                         # MeetingUser 테이블에 참석자들 insert
                         if attendees_list:
                             print(f"[tagging.py] === MeetingUser INSERT 시작 ===", flush=True)
-                            from app.models.meeting_user import MeetingUser
                             
                             # role_id 정의
                             HOST_ROLE_ID = "20ea65e2-d3b7-4adb-a8ce-9e67a2f21999"  # is_host True
                             MEMBER_ROLE_ID = "a55afc22-b4c1-48a4-9513-c66ff6ed3965"  # is_host False
                             
-                            for attendee in attendees_list:
+                            # 호스트를 앞에 두어 호스트가 참석자 목록에도 있으면 호스트 역할로 한 번만 등록
+                            participants = []
+                            for attendee in sorted(attendees_list, key=lambda a: not a.get('is_host', False)):
                                 user_id = attendee.get('id')
+                                if not user_id:
+                                    continue
                                 is_host = attendee.get('is_host', False)
-                                role_id = HOST_ROLE_ID if is_host else MEMBER_ROLE_ID
-                                
                                 print(f"[tagging.py] 참석자 추가: {attendee.get('name')} (user_id: {user_id}, is_host: {is_host})", flush=True)
-                                
-                                meeting_user = MeetingUser(
-                                    user_id=user_id,
-                                    meeting_id=new_meeting.meeting_id,
-                                    role_id=role_id
-                                )
-                                db.add(meeting_user)
+                                participants.append({"user_id": user_id, "role_id": HOST_ROLE_ID if is_host else MEMBER_ROLE_ID})
                             
-                            await db.commit()
+                            await upsert_meeting_users(db, new_meeting.meeting_id, participants)
                             print(f"[tagging.py] === MeetingUser INSERT 완료 ===", flush=True)
-                            print(f"[tagging.py] 총 {len(attendees_list)}명의 참석자 등록 완료", flush=True)
+                            print(f"[tagging.py] 총 {len(participants)}명의 참석자 등록 완료", flush=True)
                         
                         print(f"[tagging.py] 예정된 회의 등록 완료: {preview_meeting_data['meeting_title']}", flush=True)
                     else:
@@ -282,13 +650,17 @@ async def tag_chunks_async(project_name: str, subject: str, chunks: list, attend
                     print(f"[tagging.py] project_id를 찾을 수 없음: meeting_id={meeting_id}", flush=True)
             except Exception as e:
                 print(f"[tagging.py] 예정된 회의 처리 오류: {e}", flush=True)
+                # 실패한 트랜잭션을 정리해야 이후 요약/피드백/프롬프트 로그 저장이 같은 세션을 쓸 수 있음
+                await db.rollback()
         
         # lang_feedback 호출
-        feedback_result = await feedback_agent(subject, chunks, sentence_scores, attendees_list, agenda, meeting_date, meeting_duration_minutes) if attendees_list is not None else await feedback_agent(subject, chunks, sentence_scores, None, agenda, meeting_date, meeting_duration_minutes)
+        feedback_result = await feedback_agent(subject, chunks, sentence_table, attendees_list, agenda, meeting_date, meeting_duration_minutes) if attendees_list is not None else await feedback_agent(subject, chunks, sentence_table, None, agenda, meeting_date, meeting_duration_minutes)
+        await save_feedback(feedback_result)
         
         # 할 일 추출 agent 호출
-        todos_result = await extract_todos(subject, chunks, attendees_list, sentence_scores, agenda, meeting_date)
+        todos_result = await extract_todos(subject, chunks, attendees_list, sentence_table, agenda, meeting_date)
         assigned_roles = todos_result.get("assigned_roles")
+        await save_todos(assigned_roles)
         
         # Summary Agent 완료 시간 기록
         summary_end_time = datetime.now()
@@ -296,41 +668,20 @@ async def tag_chunks_async(project_name: str, subject: str, chunks: list, attend
         
     except Exception as e:
         print(f"[tag_chunks] 에이전트 호출 오류: {e}", flush=True)
-        summary_result = "에이전트 호출 중 오류가 발생했습니다."
-        feedback_result = {"오류": "에이전트 호출 중 오류가 발생했습니다."}
-        assigned_roles = {}
-        summary_start_time = datetime.now()
         summary_end_time = datetime.now()
+        # 아직 저장하지 못한 단계만 오류 결과로 저장 (이미 저장된 단계의 결과는 유지)
+        if "summary" not in saved_stages:
+            summary_result = "에이전트 호출 중 오류가 발생했습니다."
+            await save_summary(summary_result)
+        if "feedback" not in saved_stages:
+            feedback_result = {"오류": "에이전트 호출 중 오류가 발생했습니다."}
+            await save_feedback(feedback_result)
+        if "todo" not in saved_stages:
+            assigned_roles = {}
+            await save_todos(assigned_roles)
     
     # DB 저장 (db가 있을 때만)
     if db is not None:
-        # print(f"[tagging.py] insert_summary_log 호출: summary_result={summary_result}", flush=True)
-        await insert_summary_log(db, summary_result["summary"] if isinstance(summary_result, dict) and "summary" in summary_result else summary_result, meeting_id)
-        
-        # print(f"[tagging.py] insert_task_assign_log 호출: assigned_roles={assigned_roles}", flush=True)
-        task_assign_log = await insert_task_assign_log(db, assigned_roles or {}, meeting_id)
-        if hasattr(task_assign_log, '__dict__'):
-            print(f"[tagging.py] insert_task_assign_log 결과: {task_assign_log.__dict__}", flush=True)
-        else:
-            print(f"[tagging.py] insert_task_assign_log 결과: {task_assign_log}", flush=True)
-        print(f"[tagging.py] updated_task_assign_contents: {getattr(task_assign_log, 'updated_task_assign_contents', None)}", flush=True)
-        
-        # 캘린더 insert
-        calendar_log = await insert_calendar_from_task(db, task_assign_log)
-        print(f"[tagging.py] insert_calendar_from_task 결과: {calendar_log}", flush=True)
-
-        # 피드백 유형 매핑 및 저장
-        feedback_type_map = await get_feedback_type_map(db)
-        if isinstance(feedback_result, dict):
-            for feedbacktype_name, feedback_detail in feedback_result.items():
-                feedbacktype_id = feedback_type_map.get(feedbacktype_name, '')
-                if feedbacktype_id:
-                    await insert_feedback_log(db, feedback_detail, feedbacktype_id, meeting_id)
-                else:
-                    print(f"Unknown feedbacktype_name: {feedbacktype_name}", flush=True)
-        else:
-            await insert_feedback_log(db, feedback_result, '', meeting_id)
-
         # ========== 프롬프트 로그 저장 ==========
         if meeting_id:
             # Summary Agent 결과 저장 (모든 summary 관련 agent 결과를 하나로 통합)
@@ -339,11 +690,19 @@ async def tag_chunks_async(project_name: str, subject: str, chunks: list, attend
                 "lang_feedback": feedback_result,
                 "lang_todo_and_role": assigned_roles,
                 "lang_previewmeeting": preview_meeting_data if 'preview_meeting_data' in locals() else None,
+                # 로컬 관련도 분류기 학습 데이터 (source가 llm인 문장만 라벨로 사용)
+                "sentence_scores": [
+                    {"index": s["index"], "sentence": s["sentence"], "score": s["score"], "source": s["source"], "reason": s["reason"], "confidence": s["confidence"]}
+                    for s in sentence_scores
+                ],
                 "metadata": {
                     "subject": subject,
                     "agenda": agenda,
                     "meeting_date": meeting_date,
-                    "attendees_count": len(attendees_list) if attendees_list else 0
+                    "attendees_count": len(attendees_list) if attendees_list else 0,
+                    "token_budget": budget.to_dict(),
+                    "relevance_triage": triage_stats,
+                    "duplicate_speech": duplicate_speech
                 }
             }
             
@@ -408,5 +767,7 @@ async def tag_chunks_async(project_name: str, subject: str, chunks: list, attend
         "feedback": feedback_result,    # <- 피드백 agent 결과
         "assigned_roles": assigned_roles,
         "agenda": agenda,
-        "meeting_date": meeting_date
+        "meeting_date": meeting_date,
+        "token_budget": budget.to_dict(),    # <- 토큰 사용량 및 품질 저하 기록
+        "relevance_triage": triage_stats     # <- 임베딩 1차 분류 통계
     } 
@@ -0,0 +1,186 @@
+# 회의 주제 구간 분할 (문장 임베딩 TextTiling + 구간 군집화) 및 주제 통계 계산
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+import numpy as np
+
+from app.core.config import settings
+from app.services.sentence_table import SentenceTable
+
+
+@dataclass
+class Topic:
+    representative: str  # 주제 중심에 가장 가까운 문장 (주제 이름 생성용)
+    share: float  # 전체 발화(글자 수) 중 비율 (%)
+    visits: int  # 이 주제를 논의한 횟수 (다른 주제로 넘어갔다가 돌아오면 +1)
+    minutes: Optional[float] = None
+
+    @property
+    def repeats(self) -> int:
+        return self.visits - 1
+
+
+@dataclass
+class TopicAnalysis:
+    topics: List[Topic]  # 비율 내림차순
+    segments: List[int] = field(default_factory=list)  # 발화 순서대로 구간별 주제 번호 (topics 인덱스)
+    boundaries: List[int] = field(default_factory=list)  # 구간 시작 문장 번호 (원래 테이블 기준)
+    switches: int = 0  # 인접 구간의 주제가 바뀐 횟수
+    sentence_count: int = 0
+    duration_minutes: Optional[float] = None
+
+    @property
+    def switch_level(self) -> str:
+        # 10분당 전환 횟수 (회의 길이를 모르면 50문장을 10분으로 환산)
+        span = self.duration_minutes / 10 if self.duration_minutes else self.sentence_count / 50
+        rate = self.switches / max(span, 1.0)
+        if rate >= 3:
+            return "높음"
+        if rate >= 1.5:
+            return "보통"
+        return "낮음"
+
+    @property
+    def concentration(self) -> float:
+        # 가장 큰 주제의 비율 (%)
+        return self.topics[0].share if self.topics else 0.0
+
+
+def _block_similarity(vectors: np.ndarray, window: int) -> np.ndarray:
+    """
+    TextTiling 간격 점수: 간격 i(문장 i-1과 i 사이) 앞뒤 window 문장 평균 벡터의 코사인 유사도
+    """
+    n = len(vectors)
+    cumulative = np.vstack([np.zeros((1, vectors.shape[1]), dtype=vectors.dtype), np.cumsum(vectors, axis=0)])
+    gaps = np.arange(1, n)
+    left_start = np.maximum(0, gaps - window)
+    right_end = np.minimum(n, gaps + window)
+    left = cumulative[gaps] - cumulative[left_start]
+    right = cumulative[right_end] - cumulative[gaps]
+    left /= np.clip(np.linalg.norm(left, axis=1, keepdims=True), 1e-12, None)
+    right /= np.clip(np.linalg.norm(right, axis=1, keepdims=True), 1e-12, None)
+    return np.einsum("ij,ij->i", left, right)
+
+
+def _depth_scores(similarity: np.ndarray) -> np.ndarray:
+    # 각 간격에서 좌우로 유사도가 올라가는 동안의 최고점과의 차이 합 (깊은 골짜기 = 주제 경계)
+    depth = np.zeros_like(similarity)
+    for i, value in enumerate(similarity):
+        left = value
+        for j in range(i - 1, -1, -1):
+            if similarity[j] < left:
+                break
+            left = similarity[j]
+        right = value
+        for j in range(i + 1, len(similarity)):
+            if similarity[j] < right:
+                break
+            right = similarity[j]
+        depth[i] = (left - value) + (right - value)
+    return depth
+
+
+def tile_boundaries(vectors: np.ndarray, window: int, min_segment: int) -> List[int]:
+    """
+    TextTiling 경계 (구간 시작 문장 번호, 0 포함)
+    깊이 점수가 평균 - 표준편차/2 이상인 간격을 깊은 순서로 고르되 구간이 min_segment 문장보다 짧아지지 않게 한다.
+    """
+    n = len(vectors)
+    if n < 2 * min_segment:
+        return [0]
+    similarity = _block_similarity(vectors, window)
+    if len(similarity) >= 3:
+        # 3점 이동 평균으로 잡음 제거
+        similarity = np.convolve(np.pad(similarity, 1, mode="edge"), np.ones(3) / 3, mode="valid")
+    depth = _depth_scores(similarity)
+    cutoff = depth.mean() - depth.std() / 2
+    chosen: List[int] = []
+    for gap in np.argsort(-depth, kind="stable"):
+        if depth[gap] <= 0 or depth[gap] < cutoff:
+            break
+        start = int(gap) + 1
+        if start < min_segment or n - start < min_segment:
+            continue
+        if any(abs(start - other) < min_segment for other in chosen):
+            continue
+        chosen.append(start)
+    return [0] + sorted(chosen)
+
+
+def cluster_segments(centroids: np.ndarray, threshold: float) -> List[int]:
+    """
+    구간 평균 벡터를 평균 연결 계층 군집화 (가장 가까운 두 군집의 평균 유사도가 threshold 미만이면 중단)
+    같은 주제로 되돌아온 구간이 같은 번호를 받으며, 번호는 처음 등장한 순서대로 매긴다.
+    """
+    k = len(centroids)
+    # 군집 벡터 합끼리의 내적 / 크기 곱 = 군집 간 평균 유사도
+    dots = centroids @ centroids.T
+    sizes = np.ones(k)
+    active = np.ones(k, dtype=bool)
+    labels = np.arange(k)
+    while active.sum() > 1:
+        average = dots / np.outer(sizes, sizes)
+        np.fill_diagonal(average, -np.inf)
+        average[~active, :] = -np.inf
+        average[:, ~active] = -np.inf
+        a, b = sorted(np.unravel_index(int(np.argmax(average)), average.shape))
+        if average[a, b] < threshold:
+            break
+        dots[a, :] += dots[b, :]
+        dots[:, a] += dots[:, b]
+        sizes[a] += sizes[b]
+        active[b] = False
+        labels[labels == b] = a
+    order = {label: number for number, label in enumerate(dict.fromkeys(labels.tolist()))}
+    return [order[label] for label in labels.tolist()]
+
+
+def analyze_topics(table: SentenceTable, vectors: np.ndarray, duration_minutes: Optional[float] = None) -> Optional[TopicAnalysis]:
+    """
+    회의 문장(빈 문장 제외)과 L2 정규화된 임베딩으로 주제 수, 주제별 비율, 전환 횟수, 반복 논의 횟수를 계산
+
+    Args:
+        table: 문장 테이블
+        vectors: table.char_len > 0 인 문장들의 임베딩 (발화 순서)
+        duration_minutes: 회의 길이(분), 있으면 주제별 추정 시간도 계산
+    """
+    rows = np.flatnonzero(table.char_len > 0)
+    if len(rows) == 0 or len(vectors) != len(rows):
+        return None
+    window = max(2, min(settings.TOPIC_TILING_WINDOW, len(rows) // 4))
+    starts = tile_boundaries(vectors, window, max(2, settings.TOPIC_MIN_SEGMENT_SENTENCES))
+    ends = starts[1:] + [len(rows)]
+
+    centroids = np.vstack([vectors[start:end].mean(axis=0) for start, end in zip(starts, ends)])
+    centroids /= np.clip(np.linalg.norm(centroids, axis=1, keepdims=True), 1e-12, None)
+    labels = cluster_segments(centroids, settings.TOPIC_CLUSTER_SIMILARITY)
+
+    chars = table.char_len[rows].astype(np.float64)
+    total_chars = max(1.0, chars.sum())
+    topics: List[Topic] = []
+    for label in sorted(set(labels)):
+        segment_ids = [i for i, value in enumerate(labels) if value == label]
+        sentence_ids = np.concatenate([np.arange(starts[i], ends[i]) for i in segment_ids])
+        center = vectors[sentence_ids].mean(axis=0)
+        representative = int(sentence_ids[np.argmax(vectors[sentence_ids] @ center)])
+        share = float(chars[sentence_ids].sum() / total_chars * 100)
+        # 연속된 구간이 같은 주제면 한 번의 논의로 봄
+        visits = sum(1 for i in segment_ids if i == 0 or labels[i - 1] != label)
+        topics.append(Topic(
+            representative=table.sentence(int(rows[representative])),
+            share=round(share, 1),
+            visits=visits,
+            minutes=round(duration_minutes * share / 100, 1) if duration_minutes else None,
+        ))
+
+    order = sorted(range(len(topics)), key=lambda i: -topics[i].share)
+    rank = {old: new for new, old in enumerate(order)}
+    switches = sum(1 for i in range(1, len(labels)) if labels[i] != labels[i - 1])
+    return TopicAnalysis(
+        topics=[topics[i] for i in order],
+        segments=[rank[label] for label in labels],
+        boundaries=[int(rows[start]) for start in starts],
+        switches=switches,
+        sentence_count=len(rows),
+        duration_minutes=duration_minutes,
+    )
@@ -0,0 +1,511 @@
+"""
+OpenAI / Gemini / SerpAPI 호환 로컬 대역(stand-in) 서버 (녹화/재생 + 지연/오류 주입)
+
+실제 API 비용 없이 회의 분석 파이프라인을 벤치마크·부하 테스트하기 위한 서버입니다.
+- 녹화된 응답이 있으면 녹화 당시 지연 시간으로 그대로 재생
+- 없으면 요청 형식(JSON schema, tool 호출, logprobs 숫자 평가 등)에 맞는 합성 응답 생성
+- --record 지정 시 녹화가 없는 요청만 실제 API로 전달하고 응답을 저장
+
+사용법:
+    python scripts/llm_standin_server.py --port 8090 --recordings recordings/llm
+    python scripts/llm_standin_server.py --record --recordings recordings/llm   # 실제 API 호출 녹화
+    python scripts/llm_standin_server.py --latency-ms 800 --jitter-ms 300 --error-rate 0.02 --rate-limit-rate 0.05
+
+백엔드 설정 (.env):
+    OPENAI_BASE_URL=http://127.0.0.1:8090/v1
+    GEMINI_API_ENDPOINT=http://127.0.0.1:8090
+    SERPAPI_BASE_URL=http://127.0.0.1:8090
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import random
+import re
+import sys
+import time
+import uuid
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx  # noqa: E402
+from fastapi import FastAPI, Request  # noqa: E402
+from fastapi.responses import JSONResponse, PlainTextResponse, Response, StreamingResponse  # noqa: E402
+
+UPSTREAMS = {
+    "openai": "https://api.openai.com",
+    "gemini": "https://generativelanguage.googleapis.com",
+    "serpapi": "https://serpapi.com",
+}
+# 녹화 키에서 제외할 값 (요청마다 달라지거나 인증 정보)
+VOLATILE_QUERY_KEYS = {"api_key", "key", "output"}
+
+app = FastAPI(title="LLM stand-in server")
+config = argparse.Namespace(
+    recordings=None,
+    record=False,
+    latency_ms=0.0,
+    jitter_ms=0.0,
+    latency_scale=1.0,
+    error_rate=0.0,
+    rate_limit_rate=0.0,
+    seed=None,
+)
+stats = {"requests": 0, "replayed": 0, "recorded": 0, "synthesized": 0, "errors": 0, "rate_limited": 0}
+_upstream: Optional[httpx.AsyncClient] = None
+
+
+# ---------------------------------------------------------------------------
+# 녹화 저장소
+# ---------------------------------------------------------------------------
+
+def request_key(provider: str, route: str, payload: Any) -> str:
+    raw = json.dumps([provider, route, payload], ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _recording_path(provider: str, key: str) -> Optional[str]:
+    if not config.recordings:
+        return None
+    return os.path.join(config.recordings, provider, f"{key}.json")
+
+
+def load_recording(provider: str, key: str) -> Optional[Dict[str, Any]]:
+    path = _recording_path(provider, key)
+    if path is None or not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_recording(provider: str, key: str, route: str, status: int, latency_ms: float, body: Any) -> None:
+    path = _recording_path(provider, key)
+    if path is None:
+        return
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(
+            {"key": key, "route": route, "status": status, "latency_ms": round(latency_ms, 1), "response": body},
+            f, ensure_ascii=False, indent=2,
+        )
+
+
+# ---------------------------------------------------------------------------
+# 지연 / 오류 주입
+# ---------------------------------------------------------------------------
+
+async def _sleep(latency_ms: float) -> None:
+    delay = max(0.0, latency_ms * config.latency_scale + random.uniform(-config.jitter_ms, config.jitter_ms))
+    if delay:
+        await asyncio.sleep(delay / 1000)
+
+
+def injected_error(provider: str) -> Optional[Response]:
+    """설정한 비율로 429 / 500 응답 (provider별 오류 형식)"""
+    roll = random.random()
+    if roll < config.rate_limit_rate:
+        stats["rate_limited"] += 1
+        return JSONResponse(
+            _error_body(provider, 429, "Rate limit reached (stand-in)"),
+            status_code=429,
+            headers={"retry-after": "1", "x-ratelimit-remaining-requests": "0"},
+        )
+    if roll < config.rate_limit_rate + config.error_rate:
+        stats["errors"] += 1
+        return JSONResponse(_error_body(provider, 500, "Internal server error (stand-in)"), status_code=500)
+    return None
+
+
+def _error_body(provider: str, status: int, message: str) -> Dict[str, Any]:
+    if provider == "gemini":
+        return {"error": {"code": status, "message": message, "status": "RESOURCE_EXHAUSTED" if status == 429 else "INTERNAL"}}
+    if provider == "serpapi":
+        return {"error": message}
+    return {"error": {"message": message, "type": "rate_limit_error" if status == 429 else "server_error", "code": None}}
+
+
+# ---------------------------------------------------------------------------
+# 합성 응답
+# ---------------------------------------------------------------------------
+
+def _rng(key: str) -> random.Random:
+    # 같은 요청이면 항상 같은 합성 응답
+    return random.Random(f"{config.seed}:{key}")
+
+
+def _estimate_tokens(text: str) -> int:
+    return max(1, len(text) // 2)
+
+
+def sample_from_schema(schema: Dict[str, Any], rng: random.Random, defs: Optional[Dict[str, Any]] = None, name: str = "", depth: int = 0) -> Any:
+    """JSON schema(OpenAI / Gemini 형식)에 맞는 예시 값"""
+    if defs is None:
+        defs = {**schema.get("$defs", {}), **schema.get("definitions", {})}
+    if depth > 8:
+        return None
+    if "$ref" in schema:
+        return sample_from_schema(defs.get(schema["$ref"].split("/")[-1], {}), rng, defs, name, depth + 1)
+    for combinator in ("anyOf", "oneOf", "allOf"):
+        if combinator in schema:
+            options = [s for s in schema[combinator] if s.get("type") != "null"] or schema[combinator]
+            return sample_from_schema(options[0], rng, defs, name, depth + 1)
+    if "const" in schema:
+        return schema["const"]
+    if "enum" in schema:
+        return rng.choice(schema["enum"])
+
+    kind = schema.get("type", "object" if "properties" in schema else "string")
+    if isinstance(kind, list):
+        kind = next((k for k in kind if k != "null"), "null")
+    kind = str(kind).lower()
+    if kind == "object":
+        return {
+            key: sample_from_schema(value, rng, defs, key, depth + 1)
+            for key, value in schema.get("properties", {}).items()
+        }
+    if kind == "array":
+        count = max(schema.get("minItems", 0), min(schema.get("maxItems", 2), 2))
+        return [sample_from_schema(schema.get("items", {}), rng, defs, name, depth + 1) for _ in range(count)]
+    if kind == "integer":
+        return rng.randint(int(schema.get("minimum", 0)), int(schema.get("maximum", 3)))
+    if kind == "number":
+        return round(rng.uniform(float(schema.get("minimum", 0)), float(schema.get("maximum", 1))), 2)
+    if kind == "boolean":
+        return rng.random() < 0.5
+    if kind == "null":
+        return None
+    return f"샘플 {name}".strip() if name else "샘플 응답"
+
+
+def _message_text(content: Any) -> str:
+    if isinstance(content, list):
+        return " ".join(part.get("text", "") if isinstance(part, dict) else str(part) for part in content)
+    return str(content or "")
+
+
+def _sample_text(prompt: str) -> str:
+    if "Final Answer" in prompt:
+        # ZERO_SHOT_REACT 등 텍스트 ReAct Agent
+        return "Thought: 답변을 정리했습니다.\nFinal Answer: 대역 서버 샘플 답변입니다."
+    return "대역 서버 샘플 응답입니다."
+
+
+def _digit_logprob(token: str, rng: random.Random, top: int) -> Dict[str, Any]:
+    entry = {"token": token, "logprob": round(-rng.uniform(0.01, 0.7), 4), "bytes": list(token.encode()), "top_logprobs": []}
+    if top:
+        others = [d for d in "0123" if d != token][: top - 1]
+        entry["top_logprobs"] = [{"token": token, "logprob": entry["logprob"], "bytes": list(token.encode())}] + [
+            {"token": d, "logprob": round(-rng.uniform(1.5, 6.0), 4), "bytes": list(d.encode())} for d in others
+        ]
+    return entry
+
+
+def synthesize_openai_chat(body: Dict[str, Any], key: str) -> Dict[str, Any]:
+    rng = _rng(key)
+    messages = body.get("messages", [])
+    prompt = "\n".join(_message_text(m.get("content")) for m in messages)
+    model = body.get("model", "gpt-4o")
+    max_tokens = body.get("max_tokens") or body.get("max_completion_tokens")
+    message: Dict[str, Any] = {"role": "assistant", "content": None, "refusal": None}
+    logprobs = None
+    finish_reason = "stop"
+
+    tools = body.get("tools") or []
+    tool_choice = body.get("tool_choice")
+    forced = isinstance(tool_choice, dict) or tool_choice == "required"
+    answered = any(m.get("role") == "tool" for m in messages)
+    response_format = body.get("response_format") or {}
+
+    if tools and tool_choice != "none" and (forced or not answered):
+        if isinstance(tool_choice, dict):
+            name = tool_choice["function"]["name"]
+            tool = next((t for t in tools if t["function"]["name"] == name), tools[0])
+        else:
+            tool = tools[0]
+        arguments = sample_from_schema(tool["function"].get("parameters", {}), rng)
+        message["tool_calls"] = [{
+            "id": f"call_{uuid.uuid4().hex[:24]}",
+            "type": "function",
+            "function": {"name": tool["function"]["name"], "arguments": json.dumps(arguments, ensure_ascii=False)},
+        }]
+        finish_reason = "tool_calls"
+    elif response_format.get("type") == "json_schema":
+        message["content"] = json.dumps(sample_from_schema(response_format["json_schema"].get("schema", {}), rng), ensure_ascii=False)
+    elif response_format.get("type") == "json_object":
+        message["content"] = "{}"
+    elif body.get("logprobs") and max_tokens == 1:
+        # 단일 문장 숫자 평가
+        digit = rng.choice("0123")
+        message["content"] = digit
+        logprobs = {"content": [_digit_logprob(digit, rng, body.get("top_logprobs") or 0)], "refusal": None}
+    elif body.get("logprobs") and max_tokens:
+        # 묶음 숫자 평가: 프롬프트의 "이 순서대로 N개", 없으면 max_tokens = 2N + 4 로 개수 추정
+        match = re.search(r"이 순서대로 (\d+)개", prompt)
+        count = int(match.group(1)) if match else max(1, (max_tokens - 4) // 2)
+        digits = [rng.choice("0123") for _ in range(count)]
+        message["content"] = ",".join(digits)
+        content = []
+        for i, digit in enumerate(digits):
+            if i:
+                content.append({"token": ",", "logprob": -0.0001, "bytes": [44], "top_logprobs": []})
+            content.append(_digit_logprob(digit, rng, body.get("top_logprobs") or 0))
+        logprobs = {"content": content, "refusal": None}
+    else:
+        message["content"] = _sample_text(prompt)
+
+    output = message["content"] or json.dumps(message.get("tool_calls"), ensure_ascii=False)
+    prompt_tokens = _estimate_tokens(prompt)
+    completion_tokens = _estimate_tokens(output)
+    if max_tokens:
+        completion_tokens = min(completion_tokens, max_tokens)
+    return {
+        "id": f"chatcmpl-standin-{key[:24]}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [{"index": 0, "message": message, "logprobs": logprobs, "finish_reason": finish_reason}],
+        "usage": {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens, "total_tokens": prompt_tokens + completion_tokens},
+        "system_fingerprint": "standin",
+    }
+
+
+def synthesize_gemini(body: Dict[str, Any], model: str, key: str) -> Dict[str, Any]:
+    rng = _rng(key)
+    contents = body.get("contents", [])
+    parts = [part for content in contents for part in content.get("parts", [])]
+    prompt = "\n".join(part.get("text", "") for part in parts)
+    system = body.get("systemInstruction") or body.get("system_instruction") or {}
+    prompt = "\n".join(p.get("text", "") for p in system.get("parts", [])) + "\n" + prompt
+
+    declarations = [d for tool in body.get("tools", []) for d in tool.get("functionDeclarations", tool.get("function_declarations", []))]
+    calling = (body.get("toolConfig") or body.get("tool_config") or {}).get("functionCallingConfig", {})
+    mode = str(calling.get("mode", "AUTO")).upper()
+    answered = any("functionResponse" in part or "function_response" in part for part in parts)
+    generation = body.get("generationConfig") or body.get("generation_config") or {}
+
+    if declarations and mode != "NONE" and (mode == "ANY" or not answered):
+        allowed = calling.get("allowedFunctionNames") or []
+        declaration = next((d for d in declarations if d["name"] in allowed), declarations[0])
+        part = {"functionCall": {"name": declaration["name"], "args": sample_from_schema(declaration.get("parameters", {}), rng)}}
+    elif generation.get("responseSchema") or generation.get("response_schema"):
+        schema = generation.get("responseSchema") or generation.get("response_schema")
+        part = {"text": json.dumps(sample_from_schema(schema, rng), ensure_ascii=False)}
+    else:
+        part = {"text": _sample_text(prompt)}
+
+    prompt_tokens = _estimate_tokens(prompt)
+    output_tokens = _estimate_tokens(json.dumps(part, ensure_ascii=False))
+    return {
+        "candidates": [{"content": {"parts": [part], "role": "model"}, "finishReason": "STOP", "index": 0}],
+        "usageMetadata": {"promptTokenCount": prompt_tokens, "candidatesTokenCount": output_tokens, "totalTokenCount": prompt_tokens + output_tokens},
+        "modelVersion": model,
+    }
+
+
+def synthesize_serpapi(params: Dict[str, Any], key: str) -> Dict[str, Any]:
+    rng = _rng(key)
+    query = params.get("q", "")
+    return {
+        "search_metadata": {"id": key[:24], "status": "Success", "total_time_taken": round(rng.uniform(0.5, 2.0), 2)},
+        "search_parameters": {k: v for k, v in params.items() if k not in VOLATILE_QUERY_KEYS},
+        "organic_results": [
+            {
+                "position": i + 1,
+                "title": f"{query} 관련 결과 {i + 1}",
+                "link": f"https://example.com/standin/{key[:8]}/{i + 1}",
+                "snippet": f"'{query}'에 대한 대역 서버 샘플 검색 결과 {i + 1}입니다.",
+            }
+            for i in range(5)
+        ],
+    }
+
+
+def synthesize_transcription(key: str, response_format: str) -> Response:
+    text = f"대역 서버 샘플 전사 결과입니다. ({key[:8]})"
+    if response_format in ("text", "srt", "vtt"):
+        return PlainTextResponse(text)
+    return JSONResponse({"text": text})
+
+
+# ---------------------------------------------------------------------------
+# 공통 처리: 오류 주입 → 재생 → 녹화(프록시) → 합성
+# ---------------------------------------------------------------------------
+
+async def _proxy(provider: str, method: str, path: str, request: Request, content: bytes, params: Dict[str, Any]) -> httpx.Response:
+    global _upstream
+    if _upstream is None:
+        _upstream = httpx.AsyncClient(timeout=httpx.Timeout(300.0, connect=10.0))
+    headers = {
+        name: value for name, value in request.headers.items()
+        if name.lower() in ("authorization", "content-type", "x-goog-api-key", "openai-organization", "openai-beta")
+    }
+    return await _upstream.request(method, UPSTREAMS[provider] + path, content=content or None, params=params, headers=headers)
+
+
+async def handle(
+    provider: str,
+    route: str,
+    key: str,
+    request: Request,
+    synthesize,
+    upstream_path: Optional[str] = None,
+    upstream_body: Optional[bytes] = None,
+    upstream_params: Optional[Dict[str, Any]] = None,
+) -> Response:
+    stats["requests"] += 1
+    error = injected_error(provider)
+    if error is not None:
+        await _sleep(config.latency_ms)
+        return error
+
+    recording = load_recording(provider, key)
+    if recording is not None:
+        stats["replayed"] += 1
+        await _sleep(recording.get("latency_ms", config.latency_ms))
+        return _as_response(recording["status"], recording["response"])
+
+    if config.record:
+        started = time.perf_counter()
+        upstream = await _proxy(provider, request.method, upstream_path or request.url.path, request,
+                                upstream_body if upstream_body is not None else await request.body(),
+                                upstream_params if upstream_params is not None else dict(request.query_params))
+        latency_ms = (time.perf_counter() - started) * 1000
+        try:
+            body: Any = upstream.json()
+        except ValueError:
+            body = upstream.text
+        # 일시적 오류는 녹화하지 않음 (재생 시 매번 실패하게 되므로)
+        if upstream.status_code < 500 and upstream.status_code != 429:
+            save_recording(provider, key, route, upstream.status_code, latency_ms, body)
+            stats["recorded"] += 1
+        print(f"[llm_standin] 녹화 {provider} {route} → {upstream.status_code} ({latency_ms:.0f}ms)", flush=True)
+        return _as_response(upstream.status_code, body)
+
+    stats["synthesized"] += 1
+    await _sleep(config.latency_ms)
+    result = synthesize()
+    return result if isinstance(result, Response) else JSONResponse(result)
+
+
+def _as_response(status: int, body: Any) -> Response:
+    if isinstance(body, str):
+        return PlainTextResponse(body, status_code=status)
+    return JSONResponse(body, status_code=status)
+
+
+def _openai_sse(completion: Dict[str, Any]) -> StreamingResponse:
+    """비스트리밍 응답을 chat.completion.chunk SSE로 변환 (문자 단위 조각)"""
+    async def events():
+        choice = completion["choices"][0]
+        base = {"id": completion["id"], "object": "chat.completion.chunk", "created": completion["created"], "model": completion["model"]}
+        content = choice["message"].get("content") or ""
+        first = {"role": "assistant", "content": ""}
+        if choice["message"].get("tool_calls"):
+            first["tool_calls"] = [{"index": i, **call} for i, call in enumerate(choice["message"]["tool_calls"])]
+        yield f"data: {json.dumps({**base, 'choices': [{'index': 0, 'delta': first, 'finish_reason': None}]}, ensure_ascii=False)}\n\n"
+        for start in range(0, len(content), 8):
+            delta = {"content": content[start:start + 8]}
+            yield f"data: {json.dumps({**base, 'choices': [{'index': 0, 'delta': delta, 'finish_reason': None}]}, ensure_ascii=False)}\n\n"
+            await asyncio.sleep(0)
+        final = {**base, "choices": [{"index": 0, "delta": {}, "finish_reason": choice["finish_reason"]}], "usage": completion.get("usage")}
+        yield f"data: {json.dumps(final, ensure_ascii=False)}\n\n"
+        yield "data: [DONE]\n\n"
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
+# ---------------------------------------------------------------------------
+# 라우트
+# ---------------------------------------------------------------------------
+
+@app.post("/v1/chat/completions")
+async def openai_chat_completions(request: Request):
+    body = await request.json()
+    stream = bool(body.get("stream"))
+    # 스트리밍 요청도 완성 응답 하나로 녹화/재생하고, 응답할 때 SSE로 나눠 보낸다.
+    upstream = {k: v for k, v in body.items() if k not in ("stream", "stream_options")}
+    key = request_key("openai", "chat.completions", upstream)
+    response = await handle(
+        "openai", "chat.completions", key, request,
+        lambda: synthesize_openai_chat(upstream, key),
+        upstream_body=json.dumps(upstream, ensure_ascii=False).encode("utf-8"),
+    )
+    if stream and response.status_code == 200:
+        return _openai_sse(json.loads(response.body))
+    return response
+
+
+@app.post("/v1/audio/transcriptions")
+async def openai_audio_transcriptions(request: Request):
+    content = await request.body()
+    # multipart 경계 문자열은 요청마다 달라서 제외하고 해시
+    boundary = re.search(r"boundary=([^;]+)", request.headers.get("content-type", ""))
+    normalized = content.replace(boundary.group(1).strip('"').encode(), b"") if boundary else content
+    match = re.search(rb'name="response_format"\r\n\r\n([^\r]*)', content)
+    response_format = match.group(1).decode() if match else "json"
+    key = request_key("openai", "audio.transcriptions", hashlib.sha256(normalized).hexdigest())
+    return await handle("openai", "audio.transcriptions", key, request, lambda: synthesize_transcription(key, response_format))
+
+
+@app.post("/v1beta/models/{model_action}")
+@app.post("/v1/models/{model_action}")
+async def gemini_generate_content(model_action: str, request: Request):
+    model, _, action = model_action.partition(":")
+    body = await request.json()
+    key = request_key("gemini", f"{model}:generateContent", body)
+    if action == "streamGenerateContent":
+        # REST 스트리밍은 응답 조각의 JSON 배열 (완성 응답 하나로 재생)
+        response = await handle(
+            "gemini", f"{model}:generateContent", key, request,
+            lambda: synthesize_gemini(body, model, key),
+            upstream_path=request.url.path.replace(":streamGenerateContent", ":generateContent"),
+            upstream_params={k: v for k, v in request.query_params.items() if k != "alt"},
+        )
+        if response.status_code == 200:
+            return JSONResponse([json.loads(response.body)])
+        return response
+    return await handle("gemini", f"{model}:{action}", key, request, lambda: synthesize_gemini(body, model, key))
+
+
+@app.get("/search")
+@app.get("/search.json")
+async def serpapi_search(request: Request):
+    params = dict(request.query_params)
+    key = request_key("serpapi", "search", {k: v for k, v in params.items() if k not in VOLATILE_QUERY_KEYS})
+    return await handle("serpapi", "search", key, request, lambda: synthesize_serpapi(params, key), upstream_path="/search")
+
+
+@app.get("/standin/stats")
+async def standin_stats():
+    return {**stats, "record": config.record, "recordings": config.recordings}
+
+
+@app.on_event("shutdown")
+async def close_upstream():
+    if _upstream is not None:
+        await _upstream.aclose()
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="OpenAI / Gemini / SerpAPI 호환 로컬 대역 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--recordings", default=None, help="녹화 응답 디렉터리 (<provider>/<key>.json)")
+    parser.add_argument("--record", action="store_true", help="녹화가 없는 요청을 실제 API로 보내고 응답을 저장")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="합성 응답 기본 지연(ms)")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="지연 무작위 편차(±ms)")
+    parser.add_argument("--latency-scale", type=float, default=1.0, help="녹화/기본 지연 배율 (0이면 지연 없음)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="500 오류 응답 비율")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="429 응답 비율")
+    parser.add_argument("--seed", default=None, help="합성 응답 난수 시드")
+    args = parser.parse_args()
+    for name in vars(config):
+        setattr(config, name, getattr(args, name))
+    if args.record and not args.recordings:
+        parser.error("--record 사용 시 --recordings 디렉터리가 필요합니다.")
+    print(f"[llm_standin] http://{args.host}:{args.port} (record={args.record}, recordings={args.recordings})", flush=True)
+    uvicorn.run(app, host=args.host, port=args.port)
@@ -0,0 +1,52 @@
+"""
+과거 회의의 LLM 문장 평가 결과(prompt_log summary)로 로컬 관련도 분류기를 학습
+
+사용법:
+    python scripts/train_relevance_classifier.py                    # 전체 회사 공용 모델
+    python scripts/train_relevance_classifier.py --company-id <ID>  # 회사 전용 모델
+학습된 모델은 RELEVANCE_CLASSIFIER_DIR/<company_id|global>.npz 로 저장되며,
+RELEVANCE_SCORER=local 설정 시 tagging.py에서 사용됩니다.
+"""
+import argparse
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.db.db_session import AsyncSessionLocal  # noqa: E402
+from app.services.relevance_classifier import (  # noqa: E402
+    build_training_set,
+    classifier_path,
+    load_training_meetings,
+    train_classifier,
+)
+
+
+async def main(args):
+    async with AsyncSessionLocal() as db:
+        meetings = await load_training_meetings(db, company_id=args.company_id, limit=args.limit)
+    print(f"[train_relevance_classifier] 학습 대상 회의 {len(meetings)}건", flush=True)
+
+    X, y = await build_training_set(meetings)
+    if len(y) < args.min_samples:
+        print(f"[train_relevance_classifier] 라벨 문장 {len(y)}개로 최소 {args.min_samples}개 미만, 학습 중단", flush=True)
+        return 1
+
+    classifier = train_classifier(X, y, company_id=args.company_id, holdout=args.holdout, epochs=args.epochs)
+    output = args.output or classifier_path(args.company_id)
+    classifier.save(output)
+    print(f"[train_relevance_classifier] 저장 완료: {output}", flush=True)
+    print(f"[train_relevance_classifier] {classifier.metadata}", flush=True)
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="로컬 문장 관련도 분류기 학습")
+    parser.add_argument("--company-id", default=None, help="회사 전용 모델 학습 (미지정 시 전체 공용 모델)")
+    parser.add_argument("--limit", type=int, default=None, help="최근 회의 최대 개수")
+    parser.add_argument("--min-samples", type=int, default=2000, help="학습에 필요한 최소 라벨 문장 수")
+    parser.add_argument("--holdout", type=float, default=0.2, help="검증용 데이터 비율")
+    parser.add_argument("--epochs", type=int, default=300)
+    parser.add_argument("--output", default=None, help="저장 경로 (기본: RELEVANCE_CLASSIFIER_DIR)")
+    sys.exit(asyncio.run(main(parser.parse_args())))
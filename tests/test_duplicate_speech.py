@@ -0,0 +1,45 @@
+import asyncio
+import time
+
+from app.services import duplicate_speech
+from app.services.duplicate_speech import detect_duplicate_speech, find_near_duplicates
+from app.services.sentence_table import SentenceTable
+
+
+def make_table(sentences):
+    return SentenceTable.from_scores([{"sentence": s, "score": 2} for s in sentences])
+
+
+def test_repeated_hallucination_bucket_is_fast():
+    # 무음 구간 STT 환각 (같은 문구 수백 번) + 템플릿형 안건 문장 → LSH 버킷이 매우 커지는 입력
+    sentences = []
+    for i in range(1000):
+        sentences.append("시청해 주셔서 감사합니다.")
+        sentences.append(f"안건 {i}번 예산 집행 현황을 검토하겠습니다.")
+    started = time.perf_counter()
+    report = find_near_duplicates(make_table(sentences))
+    assert time.perf_counter() - started < 2.0
+    assert report.candidate_pairs < 20 * len(sentences)
+    hallucinations = [group for group in report.groups if group[0] == 0]
+    assert hallucinations and hallucinations[0] == list(range(0, len(sentences), 2))
+
+
+def test_near_duplicates_are_grouped():
+    report = find_near_duplicates(make_table([
+        "다음 주 금요일까지 디자인 시안을 공유해 주세요.",
+        "오늘 회의는 여기까지 하겠습니다.",
+        "다음 주 금요일까지 디자인 시안을 꼭 공유해 주세요.",
+        "예산 검토는 재무팀에서 진행합니다.",
+    ]))
+    assert report.groups == [[0, 2]]
+    assert report.duplicate_sentences == 1
+
+
+def test_exact_duplicates_skip_embedding(monkeypatch):
+    async def fail(texts):
+        raise AssertionError("exact 중복은 임베딩하지 않아야 함")
+
+    monkeypatch.setattr(duplicate_speech, "encode_texts_async", fail)
+    report = asyncio.run(detect_duplicate_speech(make_table(["지난주 결정 사항을 다시 말씀드리면,"] * 3)))
+    assert report.groups == [[0, 1, 2]]
+    assert all(p.exact for p in report.pairs)
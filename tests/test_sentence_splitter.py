@@ -0,0 +1,60 @@
+from app.services.sentence_splitter import MAX_QUOTE_CHARS, split_korean_sentences
+
+
+def test_split_on_terminators():
+    assert split_korean_sentences("회의를 시작하겠습니다. 오늘 안건은 두 가지입니다! 질문 있나요?") == [
+        "회의를 시작하겠습니다.",
+        "오늘 안건은 두 가지입니다!",
+        "질문 있나요?",
+    ]
+
+
+def test_split_on_sentence_endings_without_punctuation():
+    assert split_korean_sentences("자료를 공유했습니다 확인해 주세요 다음 주에 다시 봐요") == [
+        "자료를 공유했습니다.",
+        "확인해 주세요.",
+        "다음 주에 다시 봐요",
+    ]
+
+
+def test_keep_decimals_and_abbreviations():
+    assert split_korean_sentences("전환율은 3.5% 입니다. 경쟁사 vs. 우리 제품을 비교해요.") == [
+        "전환율은 3.5% 입니다.",
+        "경쟁사 vs. 우리 제품을 비교해요.",
+    ]
+
+
+def test_do_not_split_inside_quotes():
+    assert split_korean_sentences("그 사람이 '이건 안 돼요. 다시 해요.'라고 했어요. 저는 동의합니다.") == [
+        "그 사람이 '이건 안 돼요. 다시 해요.'라고 했어요.",
+        "저는 동의합니다.",
+    ]
+    assert split_korean_sentences("“좋아요.” 다음 안건으로 넘어가죠.") == ["“좋아요.”", "다음 안건으로 넘어가죠."]
+
+
+def test_unmatched_quote_does_not_disable_splitting():
+    assert split_korean_sentences("그 사람이 '이건 안 돼요. 다시 해요. 일정은 금요일입니다.") == [
+        "그 사람이 '이건 안 돼요.",
+        "다시 해요.",
+        "일정은 금요일입니다.",
+    ]
+
+
+def test_quote_state_resets_at_newline():
+    assert split_korean_sentences("그 사람이 '이건 안 해요\n다음 안건입니다. 예산을 봅시다.") == [
+        "그 사람이 '이건 안 해요.",
+        "다음 안건입니다.",
+        "예산을 봅시다.",
+    ]
+
+
+def test_long_unclosed_quote_is_ignored():
+    text = "그가 '" + "가" * MAX_QUOTE_CHARS + "입니다. 마지막 문장입니다."
+    assert split_korean_sentences(text)[-1] == "마지막 문장입니다."
+
+
+def test_line_breaks_inside_sentence_are_joined():
+    assert split_korean_sentences("다음 회의 안건을\n정리하겠습니다. 감사합니다.") == [
+        "다음 회의 안건을 정리하겠습니다.",
+        "감사합니다.",
+    ]
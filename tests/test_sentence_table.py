@@ -0,0 +1,89 @@
+import random
+
+import pytest
+
+from app.services.sentence_table import SentenceTable
+
+
+# 기존 lang_feedback의 문장별 루프 (SentenceTable 도입 전 구현)
+def legacy_char_percent(tag_result):
+    score_char_count = {0: 0, 1: 0, 2: 0, 3: 0}
+    total_chars = 0
+    for s in tag_result:
+        score = s.get("score", 0)
+        sent = s.get("sentence", "")
+        score_char_count[score] += len(sent)
+        total_chars += len(sent)
+    return {n: round((score_char_count.get(n, 0) / total_chars) * 100, 1) if total_chars else 0 for n in range(4)}
+
+
+def legacy_chit_chat_ranges(tag_result):
+    scores = [s.get("score", 0) for s in tag_result]
+    chit_chat_indices = [i for i, s in enumerate(scores) if s in [0, 1]]
+    chit_chat_ranges = []
+    if chit_chat_indices:
+        start = chit_chat_indices[0]
+        prev = start
+        for idx in chit_chat_indices[1:]:
+            if idx == prev + 1:
+                prev = idx
+            else:
+                chit_chat_ranges.append((start, prev))
+                start = idx
+                prev = idx
+        chit_chat_ranges.append((start, prev))
+    return chit_chat_ranges
+
+
+def legacy_small_talk_minutes(tag_result, meeting_duration_minutes):
+    min_per_sentence = meeting_duration_minutes / len(tag_result)
+    small_talk_ranges = []
+    for start, end in legacy_chit_chat_ranges(tag_result):
+        start_min = round(start * min_per_sentence, 1)
+        end_min = round((end + 1) * min_per_sentence, 1)
+        end_min = min(end_min, meeting_duration_minutes)
+        s, e = sorted([start_min, end_min])
+        small_talk_ranges.append((s, e))
+    if not small_talk_ranges:
+        return []
+    ranges = sorted(small_talk_ranges)
+    merged = [ranges[0]]
+    for current in ranges[1:]:
+        prev = merged[-1]
+        if current[0] <= prev[1]:
+            merged[-1] = (prev[0], max(prev[1], current[1]))
+        else:
+            merged.append(current)
+    return merged
+
+
+def make_meeting(rng, n):
+    return [
+        {"sentence": "가" * rng.randint(0, 40), "score": rng.choice([0, 1, 2, 3, 3, 2]), "reason": None}
+        for _ in range(n)
+    ]
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_matches_legacy_loops(seed):
+    rng = random.Random(seed)
+    tag_result = make_meeting(rng, rng.randint(1, 120))
+    duration = round(rng.uniform(5, 120), 1)
+    table = SentenceTable.from_scores(tag_result, duration)
+
+    assert table.score_char_percent() == legacy_char_percent(tag_result)
+    assert table.runs(table.score_between(0, 1)) == legacy_chit_chat_ranges(tag_result)
+    assert table.run_minutes(table.score_between(0, 1)) == pytest.approx(legacy_small_talk_minutes(tag_result, duration))
+
+
+def test_run_minutes_without_duration():
+    tag_result = [{"sentence": "잡담", "score": 0}, {"sentence": "안건", "score": 3}]
+    table = SentenceTable.from_scores(tag_result)
+    assert table.runs(table.score_between(0, 1)) == [(0, 0)]
+    assert table.run_minutes(table.score_between(0, 1)) == []
+
+
+def test_unscored_sentences_are_ignored():
+    table = SentenceTable.from_scores([{"sentence": "가나", "score": None}, {"sentence": "다라", "score": 2}])
+    assert table.score_char_percent() == {0: 0.0, 1: 0.0, 2: 100.0, 3: 0.0}
+    assert table.runs(table.score_between(0, 1)) == []